@@ -1,14 +1,397 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context, g, has_request_context
+from flask.json.provider import DefaultJSONProvider
+import re
 import json
 import os
+import time
+import uuid
+from types import MappingProxyType
+from bisect import bisect_left
 from datetime import datetime
 from tems_parser import TemsParser
+from dataset_store import DatasetStore
+from parse_cache import ParseCache
+from stream_upload import StreamingUploads
+from job_queue import JobQueue, JobQueueFull
+from message_record import MessageRecord, json_default
+from measurements import DEFAULT_PERCENTILES
+from message_export import EXPORT_FORMATS, DETAIL_COLUMNS, export_columns, iter_export
+from metrics import MetricsRegistry, StageTimer, SamplingProfiler
+from json_response import resolve_encoder, negotiate_content_encoding, iter_json_response
+from search_index import parse_query, build_search_index
+import columnar_file
+
+class TemsJSONProvider(DefaultJSONProvider):
+    """Kompakt mesaj kayıtlarını (ve salt okunur iç içe alanlarını) yalnızca JSON yanıtı üretilirken sözlüğe çevirir"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, (MessageRecord, MappingProxyType)):
+            return json_default(o)
+        return DefaultJSONProvider.default(o)
+    
+    def response(self, *args, **kwargs):
+        # jsonify yanıtlarının serileştirme süresi endpoint bazında ölçülür
+        start = time.perf_counter()
+        try:
+            return super().response(*args, **kwargs)
+        finally:
+            endpoint = request.endpoint if has_request_context() else None
+            metrics.observe('tems_json_serialize_seconds', time.perf_counter() - start, endpoint=endpoint or 'none')
 
 app = Flask(__name__)
+app.json_provider_class = TemsJSONProvider
+app.json = TemsJSONProvider(app)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
+# Tek bir log dosyasını parse ederken kullanılacak süreç sayısı
+app.config['PARSE_WORKERS'] = int(os.environ.get('TEMS_PARSE_WORKERS', os.cpu_count() or 1))
+
+# Parse sonuçlarının sunucuda tutulacağı toplam bellek ve taşma (spill) klasörü
+app.config['DATASET_STORE_MAX_BYTES'] = int(os.environ.get('TEMS_DATASET_STORE_MAX_BYTES', 1024 * 1024 * 1024))
+app.config['DATASET_SPILL_DIR'] = os.environ.get('TEMS_DATASET_SPILL_DIR', os.path.join('uploads', 'datasets'))
+
+# İçerik özetine göre parse önbelleği (aynı dosya tekrar yüklendiğinde yeniden parse edilmez)
+app.config['PARSE_CACHE_DIR'] = os.environ.get('TEMS_PARSE_CACHE_DIR', os.path.join('uploads', 'cache'))
+app.config['PARSE_CACHE_MAX_BYTES'] = int(os.environ.get('TEMS_PARSE_CACHE_MAX_BYTES', 2 * 1024 * 1024 * 1024))
+
+# Tembel parse: mesajlar yalnızca özet alanlarıyla tutulur, blok metinleri ayrıntı dosyasına yazılır
+# ve ayrıntılar /api/datasets/<id>/messages/<mesaj id> ile istendiğinde açılır (yüklemede lazy=0/1)
+app.config['LAZY_DETAILS'] = os.environ.get('TEMS_LAZY_DETAILS', '0') == '1'
+app.config['DETAIL_FILE_DIR'] = os.environ.get('TEMS_DETAIL_FILE_DIR', os.path.join('uploads', 'details'))
+app.config['DETAIL_CACHE_SIZE'] = int(os.environ.get('TEMS_DETAIL_CACHE_SIZE', 256))
+
+# Mesaj listesi sayfa boyutu (/upload ilk sayfayı döndürür, kalanı /messages ile alınır)
+app.config['MESSAGE_PAGE_SIZE'] = int(os.environ.get('TEMS_MESSAGE_PAGE_SIZE', 1000))
+app.config['MESSAGE_PAGE_MAX_LIMIT'] = 10000
+
+# Arka plan parse işleri: aynı anda çalışan iş sayısı ve kuyrukta bekleyebilecek en fazla iş
+app.config['JOB_WORKERS'] = int(os.environ.get('TEMS_JOB_WORKERS', 2))
+app.config['JOB_QUEUE_MAX_PENDING'] = int(os.environ.get('TEMS_JOB_QUEUE_MAX_PENDING', 16))
+
+# Canlı takip: yalnızca bu klasördeki, yazılmakta olan log dosyaları izlenebilir (boşsa kapalı)
+app.config['LIVE_LOG_DIR'] = os.environ.get('TEMS_LIVE_LOG_DIR')
+app.config['LIVE_POLL_INTERVAL'] = float(os.environ.get('TEMS_LIVE_POLL_INTERVAL', 1.0))
+app.config['LIVE_MAX_READ_BYTES'] = 8 * 1024 * 1024
+app.config['LIVE_KEEPALIVE_SECONDS'] = 15
+
+# Sütun bazlı ikili dosya (.tcol) olarak kaydedilen veri setlerinin klasörü
+app.config['DATASET_ARCHIVE_DIR'] = os.environ.get('TEMS_DATASET_ARCHIVE_DIR', os.path.join('uploads', 'archive'))
+
+# Büyük JSON yanıtları (yükleme, mesaj sayfaları, filtre sonuçları) parça parça kodlanır. JSON_ENCODER:
+# auto (orjson kuruluysa orjson), orjson ya da json; istemci kabul ediyorsa gzip/deflate ile sıkıştırılır.
+# Düşük sıkıştırma seviyesi serileştirme süresini az artırır (JSON 1. seviyede de ~9 kat küçülür)
+app.config['JSON_ENCODER'] = resolve_encoder(os.environ.get('TEMS_JSON_ENCODER', 'auto'))
+app.config['JSON_COMPRESSION'] = os.environ.get('TEMS_JSON_COMPRESSION', '1') == '1'
+app.config['JSON_COMPRESSION_LEVEL'] = int(os.environ.get('TEMS_JSON_COMPRESSION_LEVEL', 1))
+
+# Tam metin arama (/api/datasets/<id>/search): SEARCH_INDEX açıksa mesajların raw_content'i parse
+# sırasında indekslenir; kapalıysa (ya da indekssiz açılan veri setlerinde) indeks ilk aramada oluşturulur
+app.config['SEARCH_INDEX'] = os.environ.get('TEMS_SEARCH_INDEX', '1') == '1'
+
+# Ölçümler /metrics ile Prometheus metin formatında sunulur. UPLOAD_TIMINGS açıksa (ya da yüklemede
+# timings=1 verilirse) /upload yanıtı parse aşama sürelerini de içerir
+app.config['UPLOAD_TIMINGS'] = os.environ.get('TEMS_UPLOAD_TIMINGS', '0') == '1'
+
+# Örnekleyici profiler: PROFILE_UPLOADS açıksa (ya da yüklemede profile=1 verilirse) parse sırasında
+# çağrı yığını örneklenir; PROFILE_SLOW_SECONDS'tan uzun süren parse'ların örnekleri PROFILE_DIR'e yazılır
+app.config['PROFILE_UPLOADS'] = os.environ.get('TEMS_PROFILE_UPLOADS', '0') == '1'
+app.config['PROFILE_SLOW_SECONDS'] = float(os.environ.get('TEMS_PROFILE_SLOW_SECONDS', 10.0))
+app.config['PROFILE_INTERVAL'] = float(os.environ.get('TEMS_PROFILE_INTERVAL', 0.005))
+app.config['PROFILE_DIR'] = os.environ.get('TEMS_PROFILE_DIR', os.path.join('uploads', 'profiles'))
+
+# Parse aşamaları, yüklemeler ve HTTP istekleri için sayaç ve histogramlar
+metrics = MetricsRegistry()
+metrics.describe('tems_http_requests_total', 'counter', 'HTTP istekleri (endpoint, yöntem, durum kodu)')
+metrics.describe('tems_http_request_duration_seconds', 'histogram',
+                 'Yanıt başlıkları hazırlanana kadar geçen istek süresi (akış yanıtlarının gövdesi hariç)')
+metrics.describe('tems_json_serialize_seconds', 'histogram', 'JSON yanıtlarının serileştirme (ve sıkıştırma) süresi')
+metrics.describe('tems_upload_cache_total', 'counter', 'Yüklemelerde parse önbelleği sonucu (hit/miss)')
+metrics.describe('tems_parses_total', 'counter', 'Parse edilen yüklemeler (mode: full/lazy, sources: single/merged)')
+metrics.describe('tems_parse_duration_seconds', 'histogram', 'Yüklemenin toplam parse süresi')
+metrics.describe('tems_parse_stage_seconds', 'histogram',
+                 "Parse aşaması başına süre; paralel parse'ta işçi süreçlerin süreleri toplanır")
+metrics.describe('tems_parse_bytes_total', 'counter', 'Parse edilen dosya boyutu (byte)')
+metrics.describe('tems_parse_messages_total', 'counter', 'Parse edilen mesaj sayısı')
+metrics.describe('tems_parse_messages_per_second', 'gauge', "Son parse'ın hızı (mesaj/saniye)")
+metrics.describe('tems_parse_profiles_total', 'counter', 'Yavaş parse için yazılan profil dökümleri')
+metrics.describe('tems_datasets', 'gauge', 'Bellekteki veri seti sayısı')
+metrics.describe('tems_dataset_store_bytes', 'gauge', 'Bellekteki veri setlerinin tahmini boyutu (byte)')
+metrics.describe('tems_jobs', 'gauge', 'Arka plan işleri (durum bazında)')
 
 # Initialize the Tems parser
-tems_parser = TemsParser()
+tems_parser = TemsParser(engine='fast')
+
+# Parse edilmiş log'lar dataset ID ile sunucuda tutulur; filtre/analiz istekleri yalnızca ID gönderir
+dataset_store = DatasetStore(
+    max_bytes=app.config['DATASET_STORE_MAX_BYTES'],
+    spill_dir=app.config['DATASET_SPILL_DIR'],
+    max_details=app.config['DETAIL_CACHE_SIZE']
+)
+
+parse_cache = ParseCache(
+    app.config['PARSE_CACHE_DIR'],
+    max_bytes=app.config['PARSE_CACHE_MAX_BYTES'],
+    parser_version=TemsParser.PARSER_VERSION
+)
+
+# İstek gövdesi gelirken parse eden yükleme oturumları (/api/uploads)
+streaming_uploads = StreamingUploads(
+    tems_parser, dataset_store, parse_cache,
+    spool_dir='uploads', workers=app.config['PARSE_WORKERS']
+)
+
+# Büyük dosyalar /upload?async=1 ile arka planda parse edilir; durum /api/jobs/<id> ile izlenir
+job_queue = JobQueue(
+    max_workers=app.config['JOB_WORKERS'],
+    max_pending=app.config['JOB_QUEUE_MAX_PENDING']
+)
+
+ALLOWED_EXTENSIONS = ['.log', '.txt', '.trp']
+
+def _save_upload(file, filepath: str) -> str:
+    """Yüklenen dosyayı diske yaz ve yazarken içerik özetini hesapla"""
+    hasher = ParseCache.new_hasher()
+    with open(filepath, 'wb') as output:
+        while True:
+            chunk = file.stream.read(1024 * 1024)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            output.write(chunk)
+    return hasher.hexdigest()
+
+_WINDOW_BOUND_PATTERN = re.compile(r'^\d{6} \d{2}:\d{2}:\d{2}(\.\d{1,3})?$')
+
+def _upload_result(dataset_id: str, parsed_data: dict) -> dict:
+    """Yükleme yanıtının 'data' kısmı: mesajların yalnızca ilk sayfası ve sonraki sayfanın cursor'ı"""
+    first_page, next_cursor, _ = dataset_store.get_message_store(dataset_id).page(
+        0, app.config['MESSAGE_PAGE_SIZE'])
+    response_data = {key: value for key, value in parsed_data.items()
+                     if key not in ('messages', 'detail_file', 'search_index')}
+    response_data['messages'] = first_page
+    response_data['next_cursor'] = next_cursor
+    return response_data
+
+def _request_flag(name: str, default: bool) -> bool:
+    """Sorgu ya da form parametresi '1' mi (parametre yoksa default)"""
+    return request.args.get(name, request.form.get(name, '1' if default else '0')) == '1'
+
+def _lazy_requested() -> bool:
+    """Yükleme isteği tembel parse istiyor mu (lazy parametresi yoksa LAZY_DETAILS)"""
+    return _request_flag('lazy', app.config['LAZY_DETAILS'])
+
+def _new_detail_file() -> str:
+    """Tembel parse için yeni ayrıntı dosyası yolu"""
+    os.makedirs(app.config['DETAIL_FILE_DIR'], exist_ok=True)
+    return os.path.join(app.config['DETAIL_FILE_DIR'], f'{uuid.uuid4().hex}.blocks')
+
+def _source_names(files) -> list:
+    """Birleştirilen dosyaların kaynak adları (aynı ada sahip dosyalar numaralandırılır)"""
+    names = []
+    for file in files:
+        base = name = os.path.basename(file.filename)
+        number = 2
+        while name in names:
+            name = f'{base} ({number})'
+            number += 1
+        names.append(name)
+    return names
+
+def _upload_cache_key(content_hashes: list, file_extensions: list, sources: list) -> str:
+    """Tek dosyada içerik özeti ve uzantı; birden fazla dosyada hepsi (sıra ve adlarla) anahtara girer"""
+    if len(sources) == 1:
+        return parse_cache.make_key(content_hashes[0], file_extensions[0])
+    hasher = ParseCache.new_hasher()
+    for content_hash, file_extension, (_, name) in zip(content_hashes, file_extensions, sources):
+        hasher.update(f'{content_hash}:{file_extension}:{name}\n'.encode('utf-8'))
+    return parse_cache.make_key(hasher.hexdigest(), 'merged')
+
+def _parse_sources(sources: list, progress=None, detail_file=None, timer=None) -> dict:
+    if len(sources) == 1:
+        return tems_parser.parse_log_file(sources[0][0], workers=app.config['PARSE_WORKERS'],
+                                          progress=progress, detail_file=detail_file, timer=timer,
+                                          search_index=app.config['SEARCH_INDEX'])
+    return tems_parser.parse_log_files(sources, progress=progress, detail_file=detail_file, timer=timer,
+                                       search_index=app.config['SEARCH_INDEX'])
+
+def _parse_upload(sources: list, cache_key: str, lazy: bool, progress=None, profile: bool = False) -> tuple:
+    """Yüklenen dosyaları (birden fazlaysa birleştirerek) parse et; tam sonuçlar önbelleğe alınır.
+    
+    Tembel sonuçlar ayrıntı dosyasına bağlı olduğundan önbelleğe alınmaz. (sonuç, ölçüm raporu)
+    döndürür; profile verilirse parse örneklenir ve yavaşsa profil dökümü rapora eklenir.
+    """
+    timer = StageTimer()
+    profiler = SamplingProfiler(app.config['PROFILE_INTERVAL']) if profile else None
+    if profiler is not None:
+        profiler.start()
+    start = time.perf_counter()
+    try:
+        if not lazy:
+            parsed_data = _parse_sources(sources, progress, timer=timer)
+            with timer.stage('cache_write'):
+                parse_cache.put(cache_key, parsed_data)
+        else:
+            detail_file = _new_detail_file()
+            try:
+                parsed_data = _parse_sources(sources, progress, detail_file, timer)
+            except BaseException:
+                _remove_file(detail_file)
+                raise
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    
+    report = _record_parse(sources, parsed_data, timer, time.perf_counter() - start, lazy)
+    if profiler is not None and report['total_seconds'] >= app.config['PROFILE_SLOW_SECONDS']:
+        report['profile'] = _dump_profile(profiler)
+    return parsed_data, report
+
+def _record_parse(sources: list, parsed_data: dict, timer: StageTimer, seconds: float, lazy: bool) -> dict:
+    """Parse ölçümlerini metriklere ekle ve yükleme yanıtı için rapor döndür"""
+    total_bytes = sum(os.path.getsize(filepath) for filepath, _ in sources)
+    total_messages = parsed_data['total_messages']
+    messages_per_second = total_messages / seconds if seconds > 0 else 0.0
+    
+    metrics.inc('tems_parses_total', mode='lazy' if lazy else 'full',
+                sources='merged' if len(sources) > 1 else 'single')
+    metrics.observe('tems_parse_duration_seconds', seconds)
+    for stage, stage_seconds in timer.seconds.items():
+        metrics.observe('tems_parse_stage_seconds', stage_seconds, stage=stage)
+    metrics.inc('tems_parse_bytes_total', total_bytes)
+    metrics.inc('tems_parse_messages_total', total_messages)
+    metrics.set('tems_parse_messages_per_second', messages_per_second)
+    
+    return {
+        'total_seconds': round(seconds, 6),
+        'stages': timer.result(),
+        'bytes': total_bytes,
+        'messages': total_messages,
+        'messages_per_second': round(messages_per_second, 1),
+        'bytes_per_second': round(total_bytes / seconds if seconds > 0 else 0.0, 1)
+    }
+
+def _dump_profile(profiler: SamplingProfiler) -> str:
+    """Profil örneklerini PROFILE_DIR'e katlanmış yığın olarak yaz; dosya adını döndür"""
+    filename = f"parse_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.folded"
+    profiler.dump(os.path.join(app.config['PROFILE_DIR'], filename))
+    metrics.inc('tems_parse_profiles_total')
+    return filename
+
+def _parse_upload_job(job, sources: list, cache_key: str, lazy: bool = False,
+                      timings: bool = False, profile: bool = False) -> dict:
+    """Arka plan işi: yüklenen dosyaları parse et, önbelleğe ve veri setlerine ekle"""
+    def progress(done: int, total: int):
+        job.report(done / total if total else None, bytes_done=done, total_bytes=total)
+    
+    parsed_data, report = _parse_upload(sources, cache_key, lazy, progress, profile)
+    try:
+        job.check_cancelled()
+    except BaseException:
+        if parsed_data.get('detail_file'):
+            _remove_file(parsed_data['detail_file'])
+        raise
+    dataset_id = dataset_store.add(parsed_data)
+    
+    result = {
+        'dataset_id': dataset_id,
+        'data': _upload_result(dataset_id, parsed_data)
+    }
+    if timings or 'profile' in report:
+        result['timings'] = report
+    return result
+
+def _remove_file(filepath: str):
+    if os.path.exists(filepath):
+        os.remove(filepath)
+
+def _remove_files(sources: list):
+    for filepath, _ in sources:
+        _remove_file(filepath)
+
+def _window_bound(value: str, upper: bool):
+    """'DDMMYY HH:MM:SS[.mmm]' zaman penceresi sınırını mesaj zaman damgası formatına tamamla"""
+    if not value:
+        return None
+    if not _WINDOW_BOUND_PATTERN.match(value):
+        raise ValueError(f'Geçersiz zaman: {value}')
+    if '.' not in value:
+        value += '.'
+    # Eksik milisaniye hanelerini alt sınırda 0, üst sınırda 9 ile doldur
+    return value + ('9' if upper else '0') * (3 - len(value.split('.')[1]))
+
+def _safe_path(base_dir: str, filename: str):
+    """Klasördeki dosyanın tam yolunu döndür; klasör dışına çıkıyorsa None"""
+    base_dir = os.path.realpath(base_dir)
+    filepath = os.path.realpath(os.path.join(base_dir, filename))
+    if not filename or os.path.commonpath([base_dir, filepath]) != base_dir:
+        return None
+    return filepath
+
+def _archive_path(filename: str):
+    """Arşiv klasöründeki .tcol dosyasının tam yolu (uzantı yoksa eklenir)"""
+    if filename and not filename.lower().endswith(columnar_file.FILE_EXTENSION):
+        filename += columnar_file.FILE_EXTENSION
+    return _safe_path(app.config['DATASET_ARCHIVE_DIR'], filename)
+
+def _search_texts(data: dict):
+    """Arama ifadelerinin doğrulanması için id'leri verilen mesajların raw_content'ini sırayla üreten fonksiyon"""
+    messages = data['messages']
+    def texts(ids):
+        selected = (messages[message_id - 1] for message_id in ids.tolist())
+        if data.get('detail_file'):
+            # Tembel parse: raw_content ayrıntı dosyasından blok blok açılır
+            selected = tems_parser.iter_message_details(data['detail_file'], selected)
+        return (message.get('raw_content') or '' for message in selected)
+    return texts
+
+def _build_search_index(data: dict):
+    """Parse sırasında indekslenmemiş veri setinin tam metin indeksini oluştur"""
+    messages = data['messages']
+    if data.get('detail_file'):
+        messages = tems_parser.iter_message_details(data['detail_file'], messages)
+    return build_search_index(messages)
+
+def _json_stream(payload: dict, status: int = 200) -> Response:
+    """Büyük yanıtlar için jsonify yerine: JSON parça parça üretilir ve istemci kabul ediyorsa sıkıştırılır.
+    
+    compact=1 verilirse mesaj türü açıklamaları mesajlara açılmaz, yanıttaki 'descriptors'
+    tablosunda bir kez gönderilir (mesajlar descriptor_id taşır).
+    """
+    endpoint = request.endpoint or 'none'
+    content_encoding = negotiate_content_encoding(request.accept_encodings) if app.config['JSON_COMPRESSION'] else None
+    chunks = iter_json_response(payload, app.config['JSON_ENCODER'], _request_flag('compact', False),
+                                content_encoding, app.config['JSON_COMPRESSION_LEVEL'])
+    
+    def body():
+        # Gövde istek bittikten sonra üretildiğinden serileştirme süresi burada ölçülür
+        timer = StageTimer()
+        yield from timer.timed('serialize', chunks)
+        metrics.observe('tems_json_serialize_seconds', timer.seconds['serialize'], endpoint=endpoint)
+    
+    headers = {'Vary': 'Accept-Encoding'}
+    if content_encoding is not None:
+        headers['Content-Encoding'] = content_encoding
+    return Response(body(), status=status, mimetype='application/json', headers=headers)
+
+def _sse_event(event: str, data) -> str:
+    """Server-Sent Events formatında tek bir olay üret"""
+    return f"event: {event}\ndata: {app.json.dumps(data)}\n\n"
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def _record_request_metrics(response):
+    """İstek süresini ve sayısını endpoint bazında kaydet"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        endpoint = request.endpoint or 'none'
+        metrics.observe('tems_http_request_duration_seconds', time.perf_counter() - started,
+                        endpoint=endpoint, method=request.method)
+        metrics.inc('tems_http_requests_total', endpoint=endpoint, method=request.method,
+                    status=response.status_code)
+    return response
 
 @app.route('/')
 def index():
@@ -17,45 +400,194 @@ def index():
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    """Tems log dosyasını yükle ve parse et"""
+    """Tems log dosyasını yükle ve parse et.
+    
+    Birden fazla 'file' alanı gönderilirse (ör. aynı anda kaydedilen UE logları) dosyalar
+    zaman damgasına göre tek zaman çizelgesinde birleştirilir; mesajlar source_file
+    alanında dosya adını taşır. async=1 verilirse (ve sonuç önbellekte yoksa) parse arka
+    plan işi olarak kuyruğa alınır ve 202 ile iş bilgisi döndürülür; sonuç /api/jobs/<id>
+    ile alınır. lazy=1 verilirse (ve sonuç önbellekte yoksa) tembel parse yapılır.
+    """
     try:
-        if 'file' not in request.files:
+        files = [file for file in request.files.getlist('file') if file and file.filename]
+        if not files:
             return jsonify({'error': 'Dosya seçilmedi'}), 400
         
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'error': 'Dosya seçilmedi'}), 400
-        
-        # Desteklenen dosya uzantıları
-        allowed_extensions = ['.log', '.txt', '.trp']
-        file_extension = os.path.splitext(file.filename)[1].lower()
+        file_extensions = [os.path.splitext(file.filename)[1].lower() for file in files]
         
-        if file and file_extension in allowed_extensions:
-            # Dosyayı geçici olarak kaydet
-            filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}{file_extension}"
-            filepath = os.path.join('uploads', filename)
-            
+        if all(file_extension in ALLOWED_EXTENSIONS for file_extension in file_extensions):
             # uploads klasörünü oluştur
             os.makedirs('uploads', exist_ok=True)
-            file.save(filepath)
             
-            # Parse et
-            parsed_data = tems_parser.parse_log_file(filepath)
+            # Dosyaları geçici olarak kaydet
+            sources = []
+            content_hashes = []
+            try:
+                for file, file_extension, name in zip(files, file_extensions, _source_names(files)):
+                    filename = f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{file_extension}"
+                    filepath = os.path.join('uploads', filename)
+                    sources.append((filepath, name))
+                    content_hashes.append(_save_upload(file, filepath))
+            except BaseException:
+                _remove_files(sources)
+                raise
+            run_async = _request_flag('async', False)
+            lazy = _lazy_requested()
+            timings = _request_flag('timings', app.config['UPLOAD_TIMINGS'])
+            profile = _request_flag('profile', app.config['PROFILE_UPLOADS'])
+            report = None
+            job = None
             
-            # Geçici dosyayı sil
-            os.remove(filepath)
+            try:
+                # Aynı içerik daha önce parse edildiyse önbellekten al
+                cache_key = _upload_cache_key(content_hashes, file_extensions, sources)
+                parsed_data = parse_cache.get(cache_key)
+                cache_hit = parsed_data is not None
+                metrics.inc('tems_upload_cache_total', result='hit' if cache_hit else 'miss')
+                
+                if not cache_hit and run_async:
+                    # Geçici dosyalar iş bitince (veya iptal edilince) silinir
+                    try:
+                        job = job_queue.submit(_parse_upload_job, sources, cache_key, lazy, timings, profile,
+                                               name=f"parse {', '.join(file.filename for file in files)}",
+                                               cleanup=lambda: _remove_files(sources))
+                    except JobQueueFull as e:
+                        return jsonify({'error': str(e)}), 503
+                    
+                    return jsonify({
+                        'success': True,
+                        'job_id': job.id,
+                        'job': job.to_dict(),
+                        'cache': dict(parse_cache.stats(), hit=False)
+                    }), 202
+                
+                if not cache_hit:
+                    # Parse et
+                    parsed_data, report = _parse_upload(sources, cache_key, lazy, profile=profile)
+            finally:
+                # Geçici dosyaları sil
+                if job is None:
+                    _remove_files(sources)
             
-            return jsonify({
+            dataset_id = dataset_store.add(parsed_data)
+            
+            if len(files) > 1:
+                message = f'{len(files)} dosya tek zaman çizelgesinde birleştirildi'
+            else:
+                message = f'{file_extensions[0].upper()} dosyası başarıyla parse edildi'
+            
+            # Yanıtta yalnızca ilk sayfa gönderilir; kalan mesajlar /messages ile sayfa sayfa alınır
+            response = {
                 'success': True,
-                'data': parsed_data,
-                'message': f'{file_extension.upper()} dosyası başarıyla parse edildi'
-            })
+                'dataset_id': dataset_id,
+                'cache': dict(parse_cache.stats(), hit=cache_hit),
+                'data': _upload_result(dataset_id, parsed_data),
+                'message': message
+            }
+            # Önbellekten gelen sonuçta parse yapılmadığından ölçüm raporu yoktur
+            if report is not None and (timings or 'profile' in report):
+                response['timings'] = report
+            return _json_stream(response)
         else:
             return jsonify({'error': 'Sadece .log, .txt ve .trp dosyaları destekleniyor'}), 400
             
     except Exception as e:
         return jsonify({'error': f'Dosya işlenirken hata oluştu: {str(e)}'}), 500
 
+@app.route('/api/uploads', methods=['POST'])
+def create_upload():
+    """Akış halinde yükleme oturumu aç; dataset ID'si hemen döndürülür.
+    
+    Dosya daha sonra PUT /api/uploads/<id> ile ham istek gövdesi olarak gönderilir ve
+    gövde gelirken parse edilir; ilerleme GET /api/uploads/<id> ile izlenir.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        filename = data.get('filename', '')
+        if not filename:
+            return jsonify({'error': 'Dosya seçilmedi'}), 400
+        
+        file_extension = os.path.splitext(filename)[1].lower()
+        if file_extension not in ALLOWED_EXTENSIONS:
+            return jsonify({'error': 'Sadece .log, .txt ve .trp dosyaları destekleniyor'}), 400
+        
+        size = data.get('size')
+        session = streaming_uploads.create(filename, int(size) if size is not None else None)
+        
+        return jsonify({
+            'success': True,
+            'dataset_id': session.dataset_id,
+            'upload': session.progress()
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Yükleme başlatılırken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/uploads/<dataset_id>', methods=['PUT'])
+def stream_upload(dataset_id):
+    """Dosyayı ham istek gövdesi olarak al ve gelirken parse et"""
+    session = streaming_uploads.get(dataset_id)
+    if session is None:
+        return jsonify({'error': 'Yükleme oturumu bulunamadı'}), 404
+    if session.status != 'waiting':
+        return jsonify({'error': 'Bu yükleme oturumu zaten kullanıldı'}), 409
+    
+    if session.content_length is None:
+        session.content_length = request.content_length
+    
+    try:
+        parsed_data = streaming_uploads.receive(session, request.stream)
+        metrics.inc('tems_upload_cache_total', result='hit' if session.cache_hit else 'miss')
+        
+        return _json_stream({
+            'success': True,
+            'dataset_id': dataset_id,
+            'upload': session.progress(),
+            'cache': dict(parse_cache.stats(), hit=session.cache_hit),
+            'data': _upload_result(dataset_id, parsed_data),
+            'message': f'{session.file_extension.upper()} dosyası başarıyla parse edildi'
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Dosya işlenirken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/uploads/<dataset_id>', methods=['GET'])
+def upload_status(dataset_id):
+    """Akış halinde yüklemenin durumunu ve parse ilerlemesini döndür"""
+    session = streaming_uploads.get(dataset_id)
+    if session is None:
+        return jsonify({'error': 'Yükleme oturumu bulunamadı'}), 404
+    
+    return jsonify({
+        'success': True,
+        'upload': session.progress()
+    })
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Arka plan işinin durumunu, ilerlemesini ve (tamamlandıysa) sonucunu döndür"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+    
+    # Tamamlanan işin sonucu mesajların ilk sayfasını içerir
+    return _json_stream({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Arka plan işini iptal et (kuyruktaysa hiç çalışmaz, çalışıyorsa ilk fırsatta durur)"""
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'İş bulunamadı'}), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_call_flow():
     """Call flow analizi yap"""
@@ -84,7 +616,111 @@ def filter_messages():
         
         filtered_data = tems_parser.filter_messages(log_data, filters)
         
+        return _json_stream({
+            'success': True,
+            'filtered_data': filtered_data
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Filtreleme sırasında hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/messages', methods=['GET'])
+def list_dataset_messages(dataset_id):
+    """Veri setinin mesajlarını sayfa sayfa döndür (cursor, limit ve isteğe bağlı from/to zaman penceresi)"""
+    try:
+        message_store = dataset_store.get_message_store(dataset_id)
+        if message_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        try:
+            cursor = int(request.args.get('cursor') or 0)
+            limit = int(request.args.get('limit') or app.config['MESSAGE_PAGE_SIZE'])
+            start = _window_bound(request.args.get('from'), upper=False)
+            end = _window_bound(request.args.get('to'), upper=True)
+        except ValueError:
+            return jsonify({'error': 'Geçersiz cursor, limit veya zaman penceresi'}), 400
+        
+        if cursor < 0 or limit < 1:
+            return jsonify({'error': 'Geçersiz cursor, limit veya zaman penceresi'}), 400
+        
+        messages, next_cursor, total = message_store.page(
+            cursor, min(limit, app.config['MESSAGE_PAGE_MAX_LIMIT']), start, end)
+        
+        return _json_stream({
+            'success': True,
+            'messages': messages,
+            'next_cursor': next_cursor,
+            'total': total
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Mesajlar alınırken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/messages/<int:message_id>', methods=['GET'])
+def get_dataset_message(dataset_id, message_id):
+    """Mesajın tam kaydını (raw_content ve ayrıntılı parametreler) döndür.
+    
+    Tembel parse edilen veri setlerinde blok ayrıntı dosyasından okunup parse edilir;
+    son açılan mesajlar önbellekte tutulur.
+    """
+    try:
+        if dataset_id not in dataset_store:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        message = dataset_store.get_message_details(
+            dataset_id, message_id,
+            lambda data, message: tems_parser.load_message_details(data['detail_file'], message)
+            if data.get('detail_file') else message)
+        if message is None:
+            return jsonify({'error': 'Mesaj bulunamadı'}), 404
+        
+        return _json_stream({
+            'success': True,
+            'message': message
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Mesaj ayrıntıları alınırken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/analyze', methods=['POST'])
+def analyze_dataset(dataset_id):
+    """Sunucuda tutulan veri setinin (isteğe bağlı filtrelenmiş) call flow analizini yap"""
+    try:
+        message_store = dataset_store.get_message_store(dataset_id)
+        if message_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        data = request.get_json(silent=True) or {}
+        filters = data.get('filters', {})
+        
+        messages = message_store.messages
+        if filters:
+            messages = tems_parser.filter_messages(message_store, filters)
+        
+        analysis = tems_parser.analyze_call_flow(messages)
+        
         return jsonify({
+            'success': True,
+            'analysis': analysis
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Analiz sırasında hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/filter', methods=['POST'])
+def filter_dataset(dataset_id):
+    """Sunucuda tutulan veri setinin mesajlarını filtrele"""
+    try:
+        message_store = dataset_store.get_message_store(dataset_id)
+        if message_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        data = request.get_json(silent=True) or {}
+        filters = data.get('filters', {})
+        
+        filtered_data = tems_parser.filter_messages(message_store, filters)
+        
+        return _json_stream({
             'success': True,
             'filtered_data': filtered_data
         })
@@ -92,5 +728,266 @@ def filter_messages():
     except Exception as e:
         return jsonify({'error': f'Filtreleme sırasında hata oluştu: {str(e)}'}), 500
 
+@app.route('/api/datasets/<dataset_id>/export', methods=['GET'])
+def export_dataset(dataset_id):
+    """Veri setinin (isteğe bağlı filtrelenmiş) mesajlarını CSV veya NDJSON olarak akış halinde indir.
+    
+    format=csv|ndjson, columns=virgülle ayrılmış sütun adları, filters=JSON filtre nesnesi
+    (/filter ile aynı kriterler), q=tam metin sorgusu (/search ile aynı söz dizimi; filtrelerle
+    kesiştirilir). Satırlar üretildikçe gönderilir; sonuç bellekte birikmez.
+    """
+    try:
+        data = dataset_store.get(dataset_id)
+        message_store = dataset_store.get_message_store(dataset_id)
+        if data is None or message_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        export_format = request.args.get('format', 'csv')
+        try:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {export_format}")
+            columns = export_columns(request.args.get('columns'))
+            filters = json.loads(request.args.get('filters') or '{}')
+            if not isinstance(filters, dict):
+                raise ValueError('filters bir JSON nesnesi olmalıdır')
+            query = request.args.get('q', '').strip()
+            if query:
+                parse_query(query)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        if query:
+            # Arama sonucundaki mesajlar, /search'teki gibi filtre seçimiyle kesiştirilir
+            search_index = dataset_store.get_search_index(dataset_id, _build_search_index)
+            selection = message_store.filter_mask(filters) if filters else None
+            ids = search_index.search(query, _search_texts(data), selection)
+            messages = (message_store.messages[row] for row in (ids - 1).tolist())
+        else:
+            messages = message_store.iter_filter(filters)
+        if data.get('detail_file') and DETAIL_COLUMNS.intersection(columns):
+            # Tembel parse: raw_content ayrıntı dosyasından blok blok açılır
+            messages = tems_parser.iter_message_details(data['detail_file'], messages)
+        
+        filename = f"tems_messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        return Response(stream_with_context(iter_export(messages, columns, export_format)),
+                        content_type=EXPORT_FORMATS[export_format],
+                        headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+        
+    except Exception as e:
+        return jsonify({'error': f'Dışa aktarma sırasında hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/search', methods=['GET'])
+def search_dataset(dataset_id):
+    """Veri setinin mesajlarında raw_content üzerinde tam metin arama yap.
+    
+    q: sorgu; boşlukla ayrılan terimler AND, OR ile ayrılan gruplar OR ile birleşir. "ifade"
+    ardışık kelimeleri, önek* ön eki, -terim dışlamayı ifade eder (büyük/küçük harf duyarsız).
+    filters: JSON filtre nesnesi (/filter ile aynı kriterler), sonuçla kesiştirilir. Sonuç
+    cursor/limit ile /messages gibi sayfalanır; total eşleşen mesaj sayısıdır.
+    """
+    try:
+        data = dataset_store.get(dataset_id)
+        message_store = dataset_store.get_message_store(dataset_id)
+        if data is None or message_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        query = request.args.get('q', '')
+        try:
+            parse_query(query)
+            cursor = int(request.args.get('cursor') or 0)
+            limit = int(request.args.get('limit') or app.config['MESSAGE_PAGE_SIZE'])
+            if cursor < 0 or limit < 1:
+                raise ValueError('Geçersiz cursor veya limit')
+            filters = json.loads(request.args.get('filters') or '{}')
+            if not isinstance(filters, dict):
+                raise ValueError('filters bir JSON nesnesi olmalıdır')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        search_index = dataset_store.get_search_index(dataset_id, _build_search_index)
+        selection = message_store.filter_mask(filters) if filters else None
+        ids = search_index.search(query, _search_texts(data), selection)
+        
+        # cursor /messages'taki gibi sayfanın başlayacağı satırdır (satır = id - 1)
+        rows = (ids - 1).tolist()
+        first = bisect_left(rows, cursor)
+        limit = min(limit, app.config['MESSAGE_PAGE_MAX_LIMIT'])
+        messages = [message_store.messages[row] for row in rows[first:first + limit]]
+        
+        return _json_stream({
+            'success': True,
+            'messages': messages,
+            'next_cursor': rows[first + limit] if first + limit < len(rows) else None,
+            'total': len(rows)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Arama sırasında hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/measurements', methods=['GET'])
+def dataset_measurements(dataset_id):
+    """Veri setinin RSRP/RSRQ istatistikleri: özet, yüzdelikler, histogram, pci/earfcn
+    kırılımı (group_by) ve zaman kovası serisi (bucket, saniye)"""
+    try:
+        metric_names = [metric for metric in request.args.get('metric', 'rsrp,rsrq').split(',') if metric]
+        group_by = request.args.get('group_by') or None
+        bucket = request.args.get('bucket')
+        bin_width = request.args.get('bin_width')
+        percentiles = request.args.get('percentiles')
+        try:
+            bucket = float(bucket) if bucket else None
+            bin_width = float(bin_width) if bin_width else None
+            percentiles = ([float(q) for q in percentiles.split(',') if q]
+                           if percentiles is not None else DEFAULT_PERCENTILES)
+        except ValueError:
+            return jsonify({'error': 'Geçersiz sayısal parametre'}), 400
+        
+        measurement_store = dataset_store.get_measurement_store(dataset_id)
+        if measurement_store is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        try:
+            measurements = {metric: measurement_store.aggregate(metric, group_by, bucket, percentiles, bin_width)
+                            for metric in metric_names}
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'measurements': measurements
+        })
+    
+    except Exception as e:
+        return jsonify({'error': f'Ölçüm istatistikleri hesaplanırken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/<dataset_id>/save', methods=['POST'])
+def save_dataset(dataset_id):
+    """Veri setini arşiv klasörüne sütun bazlı ikili dosya olarak kaydet"""
+    try:
+        data = dataset_store.get(dataset_id)
+        if data is None:
+            return jsonify({'error': 'Veri seti bulunamadı, lütfen dosyayı yeniden yükleyin'}), 404
+        
+        filename = (request.get_json(silent=True) or {}).get('file', '')
+        filepath = _archive_path(filename)
+        if filepath is None:
+            return jsonify({'error': 'Geçersiz dosya adı'}), 400
+        
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tems_parser.save_dataset(data, filepath)
+        
+        return jsonify({
+            'success': True,
+            'file': os.path.relpath(filepath, os.path.realpath(app.config['DATASET_ARCHIVE_DIR'])),
+            'size': os.path.getsize(filepath)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Veri seti kaydedilirken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/datasets/open', methods=['POST'])
+def open_dataset():
+    """Arşivdeki .tcol dosyasını yeniden parse etmeden aç ve veri seti olarak kaydet"""
+    try:
+        filename = (request.get_json(silent=True) or {}).get('file', '')
+        filepath = _archive_path(filename)
+        if filepath is None:
+            return jsonify({'error': 'Geçersiz dosya adı'}), 400
+        if not os.path.isfile(filepath):
+            return jsonify({'error': 'Dosya bulunamadı'}), 404
+        
+        parsed_data = tems_parser.load_dataset(filepath)
+        dataset_id = dataset_store.add(parsed_data)
+        
+        return _json_stream({
+            'success': True,
+            'dataset_id': dataset_id,
+            'data': _upload_result(dataset_id, parsed_data)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': f'Veri seti açılırken hata oluştu: {str(e)}'}), 500
+
+@app.route('/api/live/stream', methods=['GET'])
+def live_stream():
+    """Yazılmakta olan log dosyasını takip et ve yeni mesajları Server-Sent Events ile gönder.
+    
+    İlk olay ('dataset') takip edilen veri setinin ID'sini taşır; filtre/analiz uçları bu ID
+    ile kullanılabilir. Sonraki 'messages' olayları yalnızca yeni mesajları, güncel
+    istatistikleri ve değişen call flow'ları içerir.
+    """
+    if not app.config['LIVE_LOG_DIR']:
+        return jsonify({'error': 'Canlı takip kapalı (TEMS_LIVE_LOG_DIR ayarlanmamış)'}), 404
+    
+    filename = request.args.get('file', '')
+    filepath = _safe_path(app.config['LIVE_LOG_DIR'], filename)
+    if filepath is None:
+        return jsonify({'error': 'Geçersiz dosya adı'}), 400
+    if not os.path.isfile(filepath):
+        return jsonify({'error': 'Dosya bulunamadı'}), 404
+    
+    try:
+        follower = tems_parser.follow(filepath, from_start=request.args.get('from_start', '1') != '0')
+    except Exception as e:
+        return jsonify({'error': f'Canlı takip başlatılamadı: {str(e)}'}), 500
+    
+    # Veri seti takipçinin mesaj listesini paylaşır; yeni mesajlar filtre/analiz uçlarına da yansır.
+    # Takip sürdükçe bellekten çıkarılmaması için sabitlenir (diske taşınan kopya bayatlardı)
+    dataset = follower.result()
+    dataset_id = dataset_store.add(dataset, pinned=True)
+    
+    def events():
+        yield _sse_event('dataset', {'dataset_id': dataset_id, 'file': filename})
+        last_event = time.monotonic()
+        try:
+            while True:
+                messages = follower.poll(max_bytes=app.config['LIVE_MAX_READ_BYTES'])
+                if follower.restarted:
+                    dataset.update(follower.result())
+                    dataset_store.resize(dataset_id)
+                    yield _sse_event('reset', {'dataset_id': dataset_id})
+                    last_event = time.monotonic()
+                elif messages:
+                    # Büyüyen veri seti bellek sınırına dahil edilir
+                    dataset_store.resize(dataset_id, messages)
+                
+                if messages or follower.updated_call_flows:
+                    dataset['statistics'] = follower.statistics.result()
+                    dataset['total_messages'] = len(follower.messages)
+                    yield _sse_event('messages', {
+                        'messages': messages,
+                        'call_flows': follower.updated_call_flows,
+                        'statistics': dataset['statistics'],
+                        'total_messages': dataset['total_messages']
+                    })
+                    last_event = time.monotonic()
+                    # Okunmamış veri kaldıysa beklemeden devam et
+                    if follower.pending_bytes():
+                        continue
+                elif time.monotonic() - last_event >= app.config['LIVE_KEEPALIVE_SECONDS']:
+                    yield ': keepalive\n\n'
+                    last_event = time.monotonic()
+                
+                time.sleep(app.config['LIVE_POLL_INTERVAL'])
+        except Exception as e:
+            yield _sse_event('error', {'error': f'Canlı takip sırasında hata oluştu: {str(e)}'})
+        finally:
+            # İstemci bağlantıyı kapatınca takip biter; artık güncellenmeyen veri seti bırakılmaz
+            dataset_store.remove(dataset_id)
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Sayaç ve histogramları Prometheus metin formatında döndür"""
+    store_stats = dataset_store.stats()
+    metrics.set('tems_datasets', store_stats['datasets'])
+    metrics.set('tems_dataset_store_bytes', store_stats['bytes'])
+    for status, count in job_queue.stats().items():
+        metrics.set('tems_jobs', count, status=status)
+    
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
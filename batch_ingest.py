@@ -0,0 +1,204 @@
+"""Bir klasördeki tüm drive test loglarını (.log/.txt/.trp) paralel olarak parse eden komut satırı aracı.
+
+Her dosyanın sonucu çıktı klasörüne ayrı bir JSON (veya --format columnar ile sunucunun
+/api/datasets/open ucuyla açılabilen .tcol) dosyası olarak yazılır; tüm dosyaların
+istatistikleri birleştirilerek summary.json'a yazılır. İşlenen dosyalar manifest.json'da
+tutulur; yarıda kesilen bir çalıştırma tekrar başlatıldığında, boyutu ve değişiklik zamanı
+aynı kalan ve çıktısı bulunan dosyalar atlanır.
+
+Kullanım:
+    python batch_ingest.py /data/campaign_42 /data/campaign_42_parsed --workers 8
+    python batch_ingest.py /data/campaign_42 /data/out --recursive --summary-only
+    python batch_ingest.py /data/campaign_42 uploads/archive --format columnar
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+
+from tems_parser import TemsParser, StatisticsAccumulator
+from message_record import json_default
+import columnar_file
+
+SUPPORTED_EXTENSIONS = ('.log', '.txt', '.trp')
+MANIFEST_NAME = 'manifest.json'
+SUMMARY_NAME = 'summary.json'
+OUTPUT_FORMATS = ('json', 'columnar')
+
+
+def find_log_files(input_dir: str, recursive: bool = False) -> List[str]:
+    """Klasördeki desteklenen log dosyalarının göreli yollarını sıralı döndür"""
+    files = []
+    if recursive:
+        for root, dirs, names in os.walk(input_dir):
+            dirs.sort()
+            for name in names:
+                if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                    files.append(os.path.relpath(os.path.join(root, name), input_dir))
+    else:
+        for name in os.listdir(input_dir):
+            path = os.path.join(input_dir, name)
+            if os.path.isfile(path) and os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                files.append(name)
+    return sorted(files)
+
+
+def _write_json(path: str, data: Any):
+    """JSON'u önce geçici dosyaya yazıp yerine taşı (kesinti yarım dosya bırakmaz)"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, default=json_default)
+    os.replace(temp_path, path)
+
+
+def _output_name(relative_path: str, output_format: str = 'json') -> str:
+    """Çıktı dosyası adı: alt klasördeki dosyalar düzleştirilir ve göreli yolun kısa özeti eklenir
+    (a/b.log ile a__b.log aynı çıktıya yazılmaz)"""
+    extension = columnar_file.FILE_EXTENSION if output_format == 'columnar' else '.json'
+    if os.sep not in relative_path:
+        return relative_path + extension
+    digest = hashlib.sha1(relative_path.replace(os.sep, '/').encode('utf-8')).hexdigest()[:8]
+    return f"{relative_path.replace(os.sep, '__')}-{digest}{extension}"
+
+
+def _file_signature(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def parse_file(input_dir: str, relative_path: str, output_dir: str, engine: str,
+               summary_only: bool, output_format: str = 'json') -> Dict[str, Any]:
+    """Süreç havuzu işçisi: tek dosyayı parse edip sonucunu yaz ve manifest kaydını döndür"""
+    path = os.path.join(input_dir, relative_path)
+    signature = _file_signature(path)
+    started = time.perf_counter()
+    try:
+        parser = TemsParser(engine=engine)
+        result = parser.parse_log_file(path)
+        if summary_only:
+            # Mesajsız sonuç her zaman JSON olarak yazılır
+            output = _output_name(relative_path)
+            result = {key: value for key, value in result.items() if key != 'messages'}
+            _write_json(os.path.join(output_dir, output), result)
+        elif output_format == 'columnar':
+            output = _output_name(relative_path, output_format)
+            parser.save_dataset(result, os.path.join(output_dir, output))
+        else:
+            output = _output_name(relative_path)
+            _write_json(os.path.join(output_dir, output), result)
+        return dict(signature, status='completed', output=output,
+                    total_messages=result['total_messages'],
+                    call_flows=len(result['call_flows']),
+                    statistics=result['statistics'],
+                    seconds=round(time.perf_counter() - started, 3))
+    except Exception as e:
+        return dict(signature, status='failed', error=str(e),
+                    seconds=round(time.perf_counter() - started, 3))
+
+
+def load_manifest(output_dir: str) -> Dict[str, Dict[str, Any]]:
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file).get('files', {})
+
+
+def is_done(input_dir: str, output_dir: str, relative_path: str, entry: Optional[Dict[str, Any]],
+            output_format: str = 'json', summary_only: bool = False) -> bool:
+    """Dosya önceki bir çalıştırmada aynı çıktı biçimiyle başarıyla işlendi ve o zamandan beri değişmedi mi?"""
+    if not entry or entry.get('status') != 'completed':
+        return False
+    if not summary_only and entry['output'] != _output_name(relative_path, output_format):
+        return False
+    if not os.path.exists(os.path.join(output_dir, entry['output'])):
+        return False
+    signature = _file_signature(os.path.join(input_dir, relative_path))
+    return entry.get('size') == signature['size'] and entry.get('mtime_ns') == signature['mtime_ns']
+
+
+def build_summary(manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Tamamlanan dosyaların istatistiklerini birleştir"""
+    statistics = StatisticsAccumulator()
+    completed = [entry for entry in manifest.values() if entry.get('status') == 'completed']
+    for entry in completed:
+        statistics.merge(StatisticsAccumulator.from_result(entry['statistics']))
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'files': len(manifest),
+        'completed_files': len(completed),
+        'failed_files': {path: entry['error'] for path, entry in manifest.items() if entry.get('status') == 'failed'},
+        'total_messages': statistics.total_messages,
+        'call_flows': sum(entry['call_flows'] for entry in completed),
+        'statistics': statistics.result()
+    }
+
+
+def ingest(input_dir: str, output_dir: str, workers: int = 1, engine: str = 'fast',
+           recursive: bool = False, force: bool = False, summary_only: bool = False,
+           output_format: str = 'json') -> Dict[str, Any]:
+    """Klasördeki logları parse et, manifest ve özet dosyalarını yaz; özeti döndür"""
+    os.makedirs(output_dir, exist_ok=True)
+    files = find_log_files(input_dir, recursive)
+    previous = {} if force else load_manifest(output_dir)
+    # Artık klasörde bulunmayan dosyaların kayıtları özete girmez
+    manifest = {path: previous[path] for path in files if path in previous}
+    pending = [path for path in files
+               if not is_done(input_dir, output_dir, path, manifest.get(path), output_format, summary_only)]
+
+    print(f'{len(files)} dosya bulundu, {len(files) - len(pending)} dosya daha önce işlenmiş, '
+          f'{len(pending)} dosya parse edilecek')
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(parse_file, input_dir, path, output_dir, engine, summary_only, output_format): path
+                   for path in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            entry = manifest[path] = future.result()
+            # Her dosyadan sonra manifest güncellenir; kesintide tamamlananlar kaybolmaz
+            _write_json(manifest_path, {'input_dir': os.path.abspath(input_dir), 'files': manifest})
+            if entry['status'] == 'completed':
+                print(f"[{done}/{len(pending)}] {path}: {entry['total_messages']} mesaj ({entry['seconds']} s)")
+            else:
+                print(f"[{done}/{len(pending)}] {path}: HATA - {entry['error']}")
+
+    _write_json(manifest_path, {'input_dir': os.path.abspath(input_dir), 'files': manifest})
+    summary = build_summary(manifest)
+    _write_json(os.path.join(output_dir, SUMMARY_NAME), summary)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Klasördeki TEMS loglarını paralel olarak parse et')
+    parser.add_argument('input_dir', help='Log dosyalarının bulunduğu klasör')
+    parser.add_argument('output_dir', help='Dosya başına sonuçların, manifest ve özetin yazılacağı klasör')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Paralel süreç sayısı')
+    parser.add_argument('--engine', choices=TemsParser.ENGINES, default='fast', help='Parse motoru')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='json', dest='output_format',
+                        help='Dosya başına sonuçların biçimi (columnar: sütun bazlı .tcol dosyası)')
+    parser.add_argument('--recursive', action='store_true', help='Alt klasörleri de tara')
+    parser.add_argument('--force', action='store_true', help='Daha önce işlenmiş dosyaları da yeniden parse et')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Dosya başına sonuçlara mesajları yazma (yalnızca istatistik ve call flow)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input_dir):
+        parser.error(f'Klasör bulunamadı: {args.input_dir}')
+
+    summary = ingest(args.input_dir, args.output_dir, args.workers, args.engine,
+                     args.recursive, args.force, args.summary_only, args.output_format)
+    print(f"\n{summary['completed_files']}/{summary['files']} dosya, {summary['total_messages']} mesaj. "
+          f"Özet: {os.path.join(args.output_dir, SUMMARY_NAME)}")
+    if summary['failed_files']:
+        print(f"{len(summary['failed_files'])} dosya parse edilemedi")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""Benchmark'lar için deterministik sentetik TEMS log üreticisi.
+
+Hem eski "LTE RRC OTA message" blok formatını hem de yeni
+"[PROTO] [DIR] [SRC->DST]" formatını üretir. Aynı seed ve parametrelerle
+her zaman aynı dosya oluşur; çıktı diske akış halinde yazılır (5 GB'a kadar).
+
+Kullanım:
+    python benchmarks/generate_logs.py sample.log --size 50MB --mix paging --seed 1
+    python benchmarks/generate_logs.py sample.trp --size 10MB --format trp
+"""
+import os
+import re
+import random
+import argparse
+from itertools import accumulate
+from datetime import datetime, timedelta
+from typing import Dict, Iterator
+
+# Mesaj karışımları: mesaj kimliği -> ağırlık. '_new_format' yeni formattaki satırların ağırlığıdır.
+MIXES = {
+    'default': {
+        'MeasurementReport': 12, 'RRCConnectionRequest': 8, 'RRCConnectionSetup': 8,
+        'RRCConnectionSetupComplete': 8, 'Paging': 8, 'RRCConnectionReconfiguration': 8,
+        'RRCConnectionReconfigurationComplete': 8, 'RRCConnectionRelease': 8,
+        'SystemInformationBlockType1': 6, 'SecurityModeCommand': 5, 'SecurityModeComplete': 5,
+        'UECapabilityEnquiry': 3, 'UECapabilityInformation': 3, '_new_format': 15,
+    },
+    'paging': {
+        'Paging': 60, 'RRCConnectionRequest': 8, 'RRCConnectionSetup': 6,
+        'RRCConnectionSetupComplete': 6, 'RRCConnectionRelease': 5, 'MeasurementReport': 5,
+        '_new_format': 10,
+    },
+    'measurement': {
+        'MeasurementReport': 65, 'RRCConnectionReconfiguration': 10,
+        'RRCConnectionReconfigurationComplete': 10, 'SystemInformationBlockType1': 5,
+        '_new_format': 10,
+    },
+}
+
+# Mesaj kimliği -> kanal
+CHANNELS = {
+    'MeasurementReport': 'UL_DCCH',
+    'RRCConnectionRequest': 'UL_CCCH',
+    'RRCConnectionSetup': 'DL_CCCH',
+    'RRCConnectionSetupComplete': 'UL_DCCH',
+    'Paging': 'PCCH',
+    'RRCConnectionReconfiguration': 'DL_DCCH',
+    'RRCConnectionReconfigurationComplete': 'UL_DCCH',
+    'RRCConnectionRelease': 'DL_DCCH',
+    'SystemInformationBlockType1': 'BCCH_DL_SCH',
+    'SecurityModeCommand': 'DL_DCCH',
+    'SecurityModeComplete': 'UL_DCCH',
+    'UECapabilityEnquiry': 'DL_DCCH',
+    'UECapabilityInformation': 'UL_DCCH',
+}
+
+# Yeni format satırları: (protokol, yön, kaynak->hedef, içerik şablonu)
+NEW_FORMAT_MESSAGES = (
+    ('NAS', 'UL', 'UE->MME', 'Service Request: type=data ksi={ksi}'),
+    ('NAS', 'DL', 'MME->UE', 'Service Accept: bearer={bearer}'),
+    ('S1AP', 'DL', 'MME->eNB', 'Paging: ue-identity m-TMSI={tmsi}'),
+    ('S1AP', 'UL', 'eNB->MME', 'Initial UE Message: cause=mo-Data'),
+    ('NAS', 'UL', 'UE->MME', 'Tracking Area Update Request: tac={tac}'),
+    ('NAS', 'DL', 'MME->UE', 'Service Reject: cause=congestion error'),
+)
+
+# RRC mesajlarının ASN.1 gövdesini taklit eden dolgu satırları
+BODY_LINES = (
+    'criticalExtensions', 'c1', 'radioResourceConfigDedicated', 'drb-ToAddModList',
+    'logicalChannelConfig', 'ul-SpecificParameters', 'priority: 1',
+    'prioritisedBitRate: infinity', 'bucketSizeDuration: ms100', 'mac-MainConfig',
+    'physicalConfigDedicated', 'pdsch-ConfigDedicated', 'p-a: dB0',
+)
+
+SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(value: str) -> int:
+    """'500KB', '10MB', '5GB' gibi boyutları byte'a çevir"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*', value.upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f'Geçersiz boyut: {value}')
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def _legacy_block(rng: random.Random, timestamp: str, identity: str, index: int) -> str:
+    channel = CHANNELS[identity]
+    lines = [
+        f'{timestamp} LTE RRC OTA message {channel.replace("_", "-")} {identity}',
+        f'Version: 1, RRC Release: 15, RRC Version: {rng.randint(0, 3)}',
+        f'LTE_Uu_RRC: {identity}',
+        'Events:',
+        '  RRC message',
+        f'Layer 3 Message: Message identity: {identity} (0x{index & 0xff:x})',
+        f'Protocol: {rng.choice(("RRC", "RRC", "NAS", "S1AP"))}',
+        f'Channel: {channel}',
+        f'PCI: {rng.randint(0, 503)}',
+        f'EARFCN: {rng.choice((1300, 1800, 3050, 6300))}',
+        'LTE RRC Protocol Version: 15.4.0',
+        f'RB Id: {rng.randint(0, 3)}',
+        f'SubFN: {rng.randint(0, 9)}',
+        f'SysFN: {rng.randint(0, 1023)}',
+        f'Message identity: {identity} (0x{index & 0xffff:x})',
+        f'rrc-TransactionIdentifier: {rng.randint(0, 3)}',
+    ]
+    if identity == 'MeasurementReport':
+        lines.append(f'measId: {rng.randint(1, 8)}')
+        for _ in range(rng.randint(1, 4)):
+            rsrp = rng.randint(20, 90)
+            rsrq = rng.randint(5, 30)
+            lines.append(f'physCellId: {rng.randint(0, 503)}')
+            lines.append(f'RSRP: ({rsrp}) {rsrp - 140}.0 dBm')
+            lines.append(f'RSRQ: ({rsrq}) {rsrq / 2 - 19.5} dB')
+    elif identity in ('Paging', 'RRCConnectionRequest'):
+        for record in range(rng.randint(1, 3) if identity == 'Paging' else 1):
+            tmsi = rng.getrandbits(32)
+            prefix = f'pagingRecordList [ {record} ] ' if identity == 'Paging' else ''
+            lines.append(f'{prefix}ue-Identity s-TMSI mmec: {rng.randint(0, 255)} m-TMSI: {tmsi} (0x{tmsi:08X})')
+    for depth in range(rng.randint(10, 60)):
+        lines.append('  ' * (depth % 6) + rng.choice(BODY_LINES) + ' {')
+    if rng.random() < 0.03:
+        lines.append('rlf cause: radio link failure timeout')
+    return '\n'.join(lines)
+
+
+def _new_format_line(rng: random.Random, timestamp: str) -> str:
+    protocol, direction, route, template = rng.choice(NEW_FORMAT_MESSAGES)
+    content = template.format(ksi=rng.randint(0, 6), bearer=rng.randint(5, 15),
+                              tmsi=rng.getrandbits(32), tac=rng.randint(1, 65535))
+    return f'{timestamp} [{protocol}] [{direction}] [{route}] {content}'
+
+
+def iter_blocks(mix: str = 'default', seed: int = 1,
+                start_time: datetime = datetime(2024, 1, 15, 10, 0, 0)) -> Iterator[str]:
+    """Sonsuz, deterministik blok akışı üret (zaman damgaları artan, gün sınırını geçebilir)"""
+    weights: Dict[str, int] = MIXES[mix]
+    identities = list(weights)
+    cumulative = list(accumulate(weights.values()))
+    rng = random.Random(seed)
+    current = start_time
+    index = 0
+    while True:
+        current += timedelta(milliseconds=rng.randint(1, 80))
+        timestamp = current.strftime('%d%m%y %H:%M:%S.') + f'{current.microsecond // 1000:03d}'
+        identity = rng.choices(identities, cum_weights=cumulative)[0]
+        if identity == '_new_format':
+            yield _new_format_line(rng, timestamp)
+        else:
+            yield _legacy_block(rng, timestamp, identity, index)
+        index += 1
+
+
+def generate(path: str, size: int, mix: str = 'default', seed: int = 1, file_format: str = None) -> int:
+    """En az size byte'lık log dosyası yaz ve yazılan blok sayısını döndür.
+
+    file_format 'trp' ise bloklar arasına NUL dolgusu eklenir (TRP dosyalarındaki gibi).
+    """
+    if file_format is None:
+        file_format = 'trp' if path.lower().endswith('.trp') else 'log'
+    written = 0
+    count = 0
+    separator = b'\n---\n'
+    with open(path, 'wb') as output:
+        for block in iter_blocks(mix, seed):
+            data = block.encode('utf-8')
+            if count:
+                data = separator + data
+            if file_format == 'trp':
+                data += b'\x00' * (count % 4)
+            output.write(data)
+            written += len(data)
+            count += 1
+            if written >= size:
+                break
+        output.write(b'\n')
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sentetik TEMS log dosyası üret')
+    parser.add_argument('output', help='Çıktı dosyası (.log, .txt veya .trp)')
+    parser.add_argument('--size', type=parse_size, default=parse_size('10MB'),
+                        help='Hedef boyut, ör. 1MB, 500MB, 5GB (varsayılan: 10MB)')
+    parser.add_argument('--mix', choices=sorted(MIXES), default='default', help='Mesaj karışımı')
+    parser.add_argument('--seed', type=int, default=1, help='Rastgelelik tohumu')
+    parser.add_argument('--format', choices=('log', 'trp'), default=None,
+                        help='Dosya formatı (varsayılan: uzantıdan)')
+    args = parser.parse_args()
+
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(output_dir, exist_ok=True)
+    count = generate(args.output, args.size, args.mix, args.seed, args.format)
+    print(f'{args.output}: {os.path.getsize(args.output)} byte, {count} blok')
+
+
+if __name__ == '__main__':
+    main()
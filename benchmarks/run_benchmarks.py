@@ -0,0 +1,321 @@
+"""Parser ve Flask endpoint'leri için benchmark çalıştırıcısı.
+
+Her senaryo ayrı bir süreçte çalışır; böylece tepe bellek (peak RSS) senaryoya özgü
+ölçülür. Sonuçlar JSON olarak kaydedilip sonraki çalıştırmalarla karşılaştırılabilir.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py --size 20MB --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --size 20MB --compare benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --size 5MB --cases parse_fast,filter_store --repeat 5
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import statistics
+import tempfile
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCHMARK_DIR)
+
+from generate_logs import generate, parse_size, MIXES
+
+# filter_* senaryolarında ölçülen filtre kombinasyonları
+FILTER_SPECS = (
+    {'protocol': 'RRC'},
+    {'channel': 'UL_DCCH', 'is_measurement': True},
+    {'message_direction': 'ue_to_enb'},
+    {'message_identity': 'setup'},
+    {'pci': '100', 'earfcn': '1800'},
+    {'min_rsrp': '-100', 'max_rsrp': '-80'},
+)
+
+# Senaryo adı -> açıklama
+CASES = {
+    'parse_regex': 'TemsParser(engine="regex").parse_log_file',
+    'parse_fast': 'TemsParser(engine="fast").parse_log_file',
+    'parse_parallel': 'TemsParser(engine="fast").parse_log_file(workers=N)',
+    'iter_messages': 'TemsParser(engine="fast").iter_messages (mesajlar tutulmadan)',
+    'filter_list': 'filter_messages(liste, ...) - her filtre için yeni indeks',
+    'filter_store': 'filter_messages(MessageStore, ...) - indeksler yeniden kullanılır',
+    'analyze': 'analyze_call_flow',
+    'route_upload': 'POST /upload (parse önbelleği boş)',
+    'route_upload_cached': 'POST /upload (parse önbelleğinden)',
+    'route_filter': 'POST /api/filter (mesajlar istek gövdesinde)',
+    'route_analyze': 'POST /api/analyze (mesajlar istek gövdesinde)',
+    'route_dataset_filter': 'POST /api/datasets/<id>/filter',
+}
+DEFAULT_CASES = [name for name in CASES if name != 'parse_parallel']
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Bu sürecin (ve beklenen alt süreçlerinin) tepe bellek kullanımı"""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux'ta KB, macOS'ta byte
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _time_repeats(function: Callable[[], Any], repeat: int, before: Callable[[], None] = None) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _load_messages(path: str) -> List[Any]:
+    from tems_parser import TemsParser
+    return TemsParser(engine='fast').parse_log_file(path)['messages']
+
+
+def _import_app(work_dir: str, workers: int):
+    """Flask uygulamasını geçici klasörlerle (önbellek, spill, uploads) yükle"""
+    os.environ['TEMS_PARSE_CACHE_DIR'] = os.path.join(work_dir, 'cache')
+    os.environ['TEMS_DATASET_SPILL_DIR'] = os.path.join(work_dir, 'datasets')
+    os.environ['TEMS_PARSE_WORKERS'] = str(workers)
+    os.chdir(work_dir)
+    import app as flask_app
+    return flask_app
+
+
+def _clear_dir(path: str):
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def _run_case(name: str, path: str, repeat: int, workers: int, work_dir: str) -> Dict[str, Any]:
+    """Tek bir senaryoyu çalıştır (ayrı süreçte çağrılır)"""
+    from tems_parser import TemsParser
+    from message_store import MessageStore
+
+    file_bytes = os.path.getsize(path)
+    message_count = None
+    processed_bytes = None
+
+    if name in ('parse_regex', 'parse_fast', 'parse_parallel'):
+        parser = TemsParser(engine='regex' if name == 'parse_regex' else 'fast')
+        case_workers = workers if name == 'parse_parallel' else 1
+        result = {}
+        timings = _time_repeats(lambda: result.update(parser.parse_log_file(path, workers=case_workers)), repeat)
+        message_count = result['total_messages']
+        processed_bytes = file_bytes
+
+    elif name == 'iter_messages':
+        parser = TemsParser(engine='fast')
+        counter = []
+        timings = _time_repeats(lambda: counter.append(sum(1 for _ in parser.iter_messages(path))), repeat)
+        message_count = counter[-1]
+        processed_bytes = file_bytes
+
+    elif name in ('filter_list', 'filter_store'):
+        messages = _load_messages(path)
+        parser = TemsParser(engine='fast')
+        target = MessageStore(messages) if name == 'filter_store' else messages
+
+        def run_filters():
+            for spec in FILTER_SPECS:
+                parser.filter_messages(target, spec)
+
+        if name == 'filter_store':
+            run_filters()  # İndeksleri ısıt; ölçüm tekrar eden filtre isteklerini yansıtır
+        timings = _time_repeats(run_filters, repeat)
+        message_count = len(messages) * len(FILTER_SPECS)
+
+    elif name == 'analyze':
+        messages = _load_messages(path)
+        parser = TemsParser(engine='fast')
+        timings = _time_repeats(lambda: parser.analyze_call_flow(messages), repeat)
+        message_count = len(messages)
+
+    elif name.startswith('route_'):
+        flask_app = _import_app(work_dir, workers)
+        client = flask_app.app.test_client()
+        with open(path, 'rb') as file:
+            content = file.read()
+        filename = os.path.basename(path)
+
+        def upload():
+            response = client.post('/upload', data={'file': (io.BytesIO(content), filename)},
+                                   content_type='multipart/form-data')
+            assert response.status_code == 200, response.get_json()
+            return response.get_json()
+
+        if name == 'route_upload':
+            cache_dir = flask_app.app.config['PARSE_CACHE_DIR']
+            uploaded = {}
+            timings = _time_repeats(lambda: uploaded.update(upload()), repeat, before=lambda: _clear_dir(cache_dir))
+            message_count = uploaded['data']['total_messages']
+            processed_bytes = file_bytes
+        elif name == 'route_upload_cached':
+            uploaded = upload()
+            timings = _time_repeats(upload, repeat)
+            message_count = uploaded['data']['total_messages']
+            processed_bytes = file_bytes
+        elif name == 'route_dataset_filter':
+            dataset_id = upload()['dataset_id']
+            message_count = flask_app.dataset_store.get(dataset_id)['total_messages'] * len(FILTER_SPECS)
+
+            def dataset_filters():
+                for spec in FILTER_SPECS:
+                    response = client.post(f'/api/datasets/{dataset_id}/filter', json={'filters': spec})
+                    assert response.status_code == 200
+
+            timings = _time_repeats(dataset_filters, repeat)
+        else:
+            # Eski endpoint'ler tüm mesaj listesini istek gövdesinde alır
+            log_data = [message.to_dict() for message in _load_messages(path)]
+            body = json.dumps({'log_data': log_data, 'filters': FILTER_SPECS[0]})
+            processed_bytes = len(body)
+            message_count = len(log_data)
+            endpoint = '/api/filter' if name == 'route_filter' else '/api/analyze'
+
+            def post():
+                response = client.post(endpoint, data=body, content_type='application/json')
+                assert response.status_code == 200
+
+            timings = _time_repeats(post, repeat)
+    else:
+        raise ValueError(f'Bilinmeyen senaryo: {name}')
+
+    best = min(timings)
+    return {
+        'description': CASES[name],
+        'seconds': round(best, 4),
+        'median_seconds': round(statistics.median(timings), 4),
+        'mb_per_second': round(processed_bytes / (1024 * 1024) / best, 2) if processed_bytes else None,
+        'messages_per_second': round(message_count / best) if message_count else None,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_case_isolated(name: str, path: str, repeat: int, workers: int) -> Dict[str, Any]:
+    """Senaryoyu yeni bir süreçte çalıştır (tepe bellek ölçümü diğer senaryolardan etkilenmez)"""
+    work_dir = tempfile.mkdtemp(prefix='tems-bench-')
+    try:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            return pool.submit(_run_case, name, path, repeat, workers, work_dir).result()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Sonuçları baseline ile karşılaştır, tabloyu yazdır ve gerilemeleri döndür"""
+    regressions = []
+    print(f"\n{'Senaryo':<22}{'Baseline (s)':>14}{'Şimdi (s)':>12}{'Fark':>10}")
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f'{name:<22}{"-":>14}{result["seconds"]:>12.4f}{"yeni":>10}')
+            continue
+        change = result['seconds'] / base['seconds'] - 1 if base['seconds'] else 0.0
+        flag = ''
+        if change > tolerance:
+            flag = '  GERİLEME'
+            regressions.append(name)
+        print(f'{name:<22}{base["seconds"]:>14.4f}{result["seconds"]:>12.4f}{change:>+10.1%}{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TEMS parser ve endpoint benchmark\'ları')
+    parser.add_argument('--size', type=parse_size, default=parse_size('10MB'), help='Log boyutu (ör. 1MB, 1GB)')
+    parser.add_argument('--mix', choices=sorted(MIXES), default='default', help='Mesaj karışımı')
+    parser.add_argument('--seed', type=int, default=1, help='Üretici tohumu')
+    parser.add_argument('--format', choices=('log', 'trp'), default='log', help='Log dosyası formatı')
+    parser.add_argument('--log', help='Üretmek yerine bu log dosyasını kullan')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'tems-bench-data'),
+                        help='Üretilen logların saklandığı klasör')
+    parser.add_argument('--cases', default=','.join(DEFAULT_CASES),
+                        help=f'Virgülle ayrılmış senaryolar ({", ".join(CASES)})')
+    parser.add_argument('--repeat', type=int, default=3, help='Her senaryonun tekrar sayısı (en iyisi raporlanır)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='parse_parallel ve route_* için süreç sayısı')
+    parser.add_argument('--output', help='Sonuçları bu JSON dosyasına yaz')
+    parser.add_argument('--save-baseline', help='Sonuçları baseline olarak bu dosyaya kaydet')
+    parser.add_argument('--compare', help='Sonuçları bu baseline dosyasıyla karşılaştır')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Gerileme sayılacak oransal yavaşlama')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Gerileme varsa 1 ile çık')
+    args = parser.parse_args()
+
+    cases = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f'Bilinmeyen senaryo: {", ".join(unknown)}')
+
+    if args.log:
+        path = os.path.abspath(args.log)
+    else:
+        os.makedirs(args.data_dir, exist_ok=True)
+        path = os.path.join(args.data_dir, f'bench_{args.mix}_{args.size}_{args.seed}.{args.format}')
+        if not os.path.exists(path):
+            print(f'Log üretiliyor: {path}')
+            generate(path, args.size, args.mix, args.seed, args.format)
+
+    file_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f'Log: {path} ({file_mb:.1f} MB)\n')
+    print(f"{'Senaryo':<22}{'Süre (s)':>10}{'MB/s':>10}{'mesaj/s':>12}{'Peak RSS (MB)':>15}")
+
+    results = {}
+    for name in cases:
+        result = run_case_isolated(name, path, args.repeat, args.workers)
+        results[name] = result
+        print(f"{name:<22}{result['seconds']:>10.4f}{result['mb_per_second'] or '-':>10}"
+              f"{result['messages_per_second'] or '-':>12}{result['peak_rss_mb'] or '-':>15}")
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'log_file': os.path.basename(path),
+            'log_bytes': os.path.getsize(path),
+            'mix': args.mix,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'workers': args.workers,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+    for target in (args.output, args.save_baseline):
+        if target:
+            with open(target, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2, ensure_ascii=False)
+            print(f'\nSonuçlar kaydedildi: {target}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)
+        if baseline.get('meta', {}).get('log_bytes') != report['meta']['log_bytes']:
+            print('\nUyarı: baseline farklı boyutta bir log ile ölçülmüş')
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f'\nGerileme: {", ".join(regressions)}')
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,327 @@
+import re
+from collections import deque
+from typing import Dict, Any, List, Optional, Iterable
+
+# RRCConnectionRequest içindeki UE kimliği ve kuruluş nedeni
+_S_TMSI_PATTERN = re.compile(r'mmec:\s*(\d+).*?m-TMSI:\s*(\d+)', re.DOTALL)
+_CAUSE_PATTERN = re.compile(r'[Ee]stablishment[Cc]ause:\s*([\w-]+)|\bcause:\s*([\w-]+)')
+# Yeni formattaki (S1AP/NAS) paging içeriği: 'Paging: ue-identity m-TMSI=3046523346'
+_PAGING_M_TMSI_PATTERN = re.compile(r'm-TMSI\s*[=:]\s*(\d+)')
+
+# Komut/yanıt çiftiyle biten RRC prosedürleri: başlatan mesaj -> (prosedür adı, yanıtlar, hata yanıtları,
+# gecikme adı). Yanıt, başlatan mesajla aynı rrc-TransactionIdentifier'ı taşır.
+TRANSACTION_PROCEDURES = {
+    'RRCConnectionReconfiguration': ('RRC Connection Reconfiguration',
+                                     ('RRCConnectionReconfigurationComplete',), (),
+                                     'reconfiguration_to_complete'),
+    'SecurityModeCommand': ('Security Mode', ('SecurityModeComplete',), ('SecurityModeFailure',),
+                            'security_mode_to_complete'),
+    'UECapabilityEnquiry': ('UE Capability', ('UECapabilityInformation',), (),
+                            'capability_enquiry_to_information'),
+    'CounterCheck': ('Counter Check', ('CounterCheckResponse',), (), 'counter_check_to_response'),
+    'UEInformationRequest': ('UE Information', ('UEInformationResponse',), (),
+                             'information_request_to_response'),
+}
+_RESPONSES = {response for _, responses, failures, _ in TRANSACTION_PROCEDURES.values()
+              for response in responses + failures}
+
+# raw_content'i okunan mesajlar (UE kimliği ve kuruluş nedeni); tembel parse'ta bunların
+# raw_content'i korunur
+RAW_CONTENT_IDENTITIES = frozenset(('RRCConnectionRequest',))
+
+# Bağlantıya ait sayılmayan yayın kanalları (paging, sistem bilgisi)
+_BROADCAST_CHANNELS = ('PCCH', 'BCCH')
+
+# Paging'e bu süre içinde gelen aynı m-TMSI'lı RRCConnectionRequest paging yanıtı sayılır
+PAGING_RESPONSE_WINDOW_MS = 10000
+
+# Gecikme dağılımlarında raporlanan yüzdelikler
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+
+class _OpenFlow:
+    """Açık bir flow'un durum makinesi bilgisi (çıktıya girmez, flow kapanınca bırakılır)"""
+    __slots__ = ('flow', 'state', 'start_ms', 'setup_ms', 'paging_ms', 'transaction_id', 'children')
+
+    def __init__(self, flow: Dict[str, Any], state: str, start_ms: Optional[int]):
+        self.flow = flow
+        self.state = state
+        self.start_ms = start_ms
+        self.setup_ms = None
+        self.paging_ms = None
+        self.transaction_id = None
+        self.children = []
+
+
+class CallFlowTracker:
+    """Mesajları tek geçişte, sırayla işleyerek RRC prosedürlerini (call flow) çıkarır.
+
+    RRC bağlantısı durum makinesi: RRCConnectionRequest -> RRCConnectionSetup ->
+    RRCConnectionSetupComplete (Setup ile aynı transaction ID) -> ... -> RRCConnectionRelease
+    (veya RRCConnectionReject). Bağlantı açıkken yayın kanalı dışındaki mesajlar bağlantıya eklenir.
+    Reconfiguration, Security Mode gibi komut/yanıt prosedürleri rrc-TransactionIdentifier ile
+    eşleştirilir ve bağlı oldukları bağlantının alt flow'u olur. Paging kayıtlarındaki m-TMSI,
+    PAGING_RESPONSE_WINDOW_MS içinde aynı S-TMSI ile gelen RRCConnectionRequest'e bağlanır.
+
+    Flow'lar mesajların kopyasını değil ID listesini (message_ids) tutar; gecikmeler
+    timestamp_ms üzerinden milisaniye olarak hesaplanır. Açık flow'lar da call_flows'ta
+    bulunur ve yeni mesajlar geldikçe güncellenir. call_flows verilirse flow'lar bu listeye
+    eklenir (ayrı izlenen UE'lerin flow'ları ortak ID sırası kullanır).
+    """
+
+    def __init__(self, call_flows: Optional[List[Dict[str, Any]]] = None):
+        self.call_flows = call_flows if call_flows is not None else []
+        self._connection = None  # açık RRC bağlantısı (_OpenFlow)
+        self._transactions = {}  # rrc_transaction_id -> açık komut/yanıt prosedürü (_OpenFlow)
+        self._pages = {}  # m_tmsi -> (paging mesajı ID, timestamp_ms)
+        self._page_order = deque()  # (timestamp_ms, m_tmsi, mesaj ID), süresi dolanları silmek için
+
+    def add(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Mesajı işle; bu mesajla oluşan veya değişen flow'ları döndür"""
+        identity = message.get('message_identity') or ''
+        time_ms = message.get('timestamp_ms')
+        changed = []
+
+        if message.get('is_paging') or identity == 'Paging':
+            self._add_paging(message, time_ms)
+            return changed
+
+        if identity == 'RRCConnectionRequest':
+            self._close_connection('Incomplete', message, changed, include=False)
+            self._open_connection(message, 'requested', time_ms, changed)
+            return changed
+
+        if identity == 'RRCConnectionSetup':
+            connection = self._connection
+            if connection is None or connection.state != 'requested':
+                self._close_connection('Incomplete', message, changed, include=False)
+                connection = self._open_connection(message, 'setup', time_ms, changed)
+            else:
+                connection.flow['message_ids'].append(message['id'])
+                connection.state = 'setup'
+                self._latency(connection, 'request_to_setup', connection.start_ms, time_ms)
+                _add_changed(changed, connection.flow)
+            connection.setup_ms = time_ms
+            connection.transaction_id = message.get('rrc_transaction_id')
+            connection.flow['rrc_transaction_id'] = connection.transaction_id
+            if connection.paging_ms is not None:
+                self._latency(connection, 'paging_to_setup', connection.paging_ms, time_ms)
+            return changed
+
+        connection = self._connection
+        if identity == 'RRCConnectionSetupComplete':
+            transaction_id = message.get('rrc_transaction_id')
+            if (connection is not None and connection.state == 'setup'
+                    and (transaction_id is None or connection.transaction_id is None
+                         or transaction_id == connection.transaction_id)):
+                connection.flow['message_ids'].append(message['id'])
+                connection.state = 'connected'
+                connection.flow['status'] = 'Connected'
+                self._latency(connection, 'setup_to_complete', connection.setup_ms, time_ms)
+                _add_changed(changed, connection.flow)
+                return changed
+
+        if identity in ('RRCConnectionRelease', 'RRCConnectionReject'):
+            if connection is not None:
+                status = 'Released' if identity == 'RRCConnectionRelease' else 'Rejected'
+                self._close_connection(status, message, changed, include=True)
+            return changed
+
+        if identity in TRANSACTION_PROCEDURES:
+            self._open_transaction(message, identity, time_ms, changed)
+        elif identity in _RESPONSES:
+            self._complete_transaction(message, identity, time_ms, changed)
+
+        # Bağlantı açıkken adanmış kanallardaki mesajlar bağlantının parçasıdır
+        if connection is not None and not (message.get('channel') or '').startswith(_BROADCAST_CHANNELS):
+            connection.flow['message_ids'].append(message['id'])
+            _add_changed(changed, connection.flow)
+        return changed
+
+    def _new_flow(self, flow_type: str, message: Dict[str, Any], parent_id: Optional[int]) -> Dict[str, Any]:
+        flow = {
+            'id': len(self.call_flows) + 1,
+            'type': flow_type,
+            'status': 'In Progress',
+            'start_time': message.get('timestamp'),
+            'end_time': None,
+            'duration': None,
+            'message_ids': [message['id']],
+            'parent_id': parent_id,
+            'rrc_transaction_id': message.get('rrc_transaction_id'),
+            'latencies': {}
+        }
+        self.call_flows.append(flow)
+        return flow
+
+    def _open_connection(self, message: Dict[str, Any], state: str, time_ms: Optional[int],
+                         changed: List[Dict[str, Any]]) -> _OpenFlow:
+        flow = self._new_flow('RRC Connection', message, None)
+        flow.update({'trigger': None, 'm_tmsi': None, 'cause': None, 'paging_message_id': None})
+        connection = self._connection = _OpenFlow(flow, state, time_ms)
+
+        if state == 'requested':
+            raw_content = message.get('raw_content') or ''
+            s_tmsi = _S_TMSI_PATTERN.search(raw_content)
+            cause = _CAUSE_PATTERN.search(raw_content)
+            if cause:
+                flow['cause'] = cause.group(1) or cause.group(2)
+            if s_tmsi:
+                m_tmsi = int(s_tmsi.group(2))
+                flow['m_tmsi'] = m_tmsi
+                page = self._pages.pop(m_tmsi, None)
+                if page is not None and _within(page[1], time_ms, PAGING_RESPONSE_WINDOW_MS):
+                    flow['trigger'] = 'paging'
+                    flow['paging_message_id'] = page[0]
+                    flow['message_ids'].insert(0, page[0])
+                    connection.paging_ms = page[1]
+                    self._latency(connection, 'paging_to_request', page[1], time_ms)
+            if flow['trigger'] is None:
+                flow['trigger'] = 'paging' if (flow['cause'] or '').startswith('mt') else 'ue'
+
+        _add_changed(changed, flow)
+        return connection
+
+    def _close_connection(self, status: str, message: Dict[str, Any], changed: List[Dict[str, Any]],
+                          include: bool):
+        """Açık bağlantıyı ve alt prosedürlerini kapat; include ise mesaj bağlantının son mesajıdır"""
+        connection = self._connection
+        if connection is None:
+            return
+        self._connection = None
+        flow = connection.flow
+        if include:
+            flow['message_ids'].append(message['id'])
+            self._finish(connection, status, message)
+        else:
+            # Yarım kalan bağlantı son mesajında biter
+            flow['status'] = status
+        for child in connection.children:
+            if child.flow['status'] == 'In Progress':
+                child.flow['status'] = 'Incomplete'
+                if self._transactions.get(child.transaction_id) is child:
+                    del self._transactions[child.transaction_id]
+                _add_changed(changed, child.flow)
+        _add_changed(changed, flow)
+
+    def _open_transaction(self, message: Dict[str, Any], identity: str, time_ms: Optional[int],
+                          changed: List[Dict[str, Any]]):
+        name = TRANSACTION_PROCEDURES[identity][0]
+        transaction_id = message.get('rrc_transaction_id')
+        previous = self._transactions.pop(transaction_id, None)
+        if previous is not None and previous.flow['status'] == 'In Progress':
+            # Aynı transaction ID yanıt gelmeden yeniden kullanıldı
+            previous.flow['status'] = 'Incomplete'
+            _add_changed(changed, previous.flow)
+
+        parent = self._connection
+        flow = self._new_flow(name, message, parent.flow['id'] if parent is not None else None)
+        procedure = _OpenFlow(flow, identity, time_ms)
+        procedure.transaction_id = transaction_id
+        if parent is not None:
+            parent.children.append(procedure)
+        if transaction_id is not None:
+            self._transactions[transaction_id] = procedure
+        _add_changed(changed, flow)
+
+    def _complete_transaction(self, message: Dict[str, Any], identity: str, time_ms: Optional[int],
+                              changed: List[Dict[str, Any]]):
+        procedure = self._transactions.get(message.get('rrc_transaction_id'))
+        if procedure is None:
+            return
+        _, responses, failures, latency_name = TRANSACTION_PROCEDURES[procedure.state]
+        if identity not in responses and identity not in failures:
+            return
+        del self._transactions[procedure.transaction_id]
+        procedure.flow['message_ids'].append(message['id'])
+        self._latency(procedure, latency_name, procedure.start_ms, time_ms)
+        self._finish(procedure, 'Completed' if identity in responses else 'Failed', message)
+        _add_changed(changed, procedure.flow)
+
+    def _finish(self, procedure: _OpenFlow, status: str, message: Dict[str, Any]):
+        flow = procedure.flow
+        flow['status'] = status
+        flow['end_time'] = message.get('timestamp')
+        time_ms = message.get('timestamp_ms')
+        if procedure.start_ms is not None and time_ms is not None:
+            flow['duration'] = float(time_ms - procedure.start_ms)
+
+    def _add_paging(self, message: Dict[str, Any], time_ms: Optional[int]):
+        """Paging'deki m-TMSI'ları bekleyen paging'ler arasına ekle; süresi dolanları unut"""
+        paging_records = (message.get('paging_info') or {}).get('paging_records')
+        if paging_records:
+            m_tmsis = [record['m_tmsi'] for record in paging_records if 'm_tmsi' in record]
+        else:
+            m_tmsis = [int(value) for value in _PAGING_M_TMSI_PATTERN.findall(message.get('raw_content') or '')]
+
+        if time_ms is not None:
+            while self._page_order and not _within(self._page_order[0][0], time_ms, PAGING_RESPONSE_WINDOW_MS):
+                _, m_tmsi, message_id = self._page_order.popleft()
+                if self._pages.get(m_tmsi, (None,))[0] == message_id:
+                    del self._pages[m_tmsi]
+
+        for m_tmsi in m_tmsis:
+            self._pages[m_tmsi] = (message['id'], time_ms)
+            if time_ms is not None:
+                self._page_order.append((time_ms, m_tmsi, message['id']))
+
+    def _latency(self, procedure: _OpenFlow, name: str, start_ms: Optional[int], end_ms: Optional[int]):
+        if start_ms is not None and end_ms is not None:
+            procedure.flow['latencies'][name] = float(end_ms - start_ms)
+
+
+def _within(start_ms: Optional[int], end_ms: Optional[int], window_ms: int) -> bool:
+    if start_ms is None or end_ms is None:
+        return True
+    return 0 <= end_ms - start_ms <= window_ms
+
+
+def _add_changed(changed: List[Dict[str, Any]], flow: Dict[str, Any]):
+    if not any(existing is flow for existing in changed):
+        changed.append(flow)
+
+
+def track_call_flows(messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mesaj dizisinden call flow'ları tek geçişte çıkar.
+
+    Mesajlar source_file taşıyorsa (birleştirilmiş çoklu UE logu) her kaynak kendi durum
+    makinesiyle izlenir ve flow'lar source_file ile etiketlenir.
+    """
+    call_flows = []
+    trackers = {}
+    for message in messages:
+        source_file = message.get('source_file')
+        tracker = trackers.get(source_file)
+        if tracker is None:
+            tracker = trackers[source_file] = CallFlowTracker(call_flows)
+        changed = tracker.add(message)
+        if source_file is not None:
+            for flow in changed:
+                flow['source_file'] = source_file
+    return call_flows
+
+
+def latency_distributions(call_flows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Flow'lardaki gecikmelerin (paging_to_setup, setup_to_complete, ...) dağılımını hesapla"""
+    samples = {}
+    for flow in call_flows:
+        for name, value in flow.get('latencies', {}).items():
+            samples.setdefault(name, []).append(value)
+
+    distributions = {}
+    for name, values in samples.items():
+        values.sort()
+        distribution = {
+            'count': len(values),
+            'min': values[0],
+            'max': values[-1],
+            'avg': sum(values) / len(values)
+        }
+        for q in LATENCY_PERCENTILES:
+            # Doğrusal ara değer (numpy.percentile varsayılanı ile aynı)
+            position = (len(values) - 1) * q / 100
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            distribution[f'p{q}'] = values[lower] + (values[upper] - values[lower]) * (position - lower)
+        distributions[name] = distribution
+    return distributions
@@ -0,0 +1,397 @@
+import os
+import sys
+import json
+import mmap
+import pickle
+import zlib
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+from message_record import MessageRecord, DESCRIPTORS, _MISSING
+from message_store import MessageStore, _CategoricalColumn
+
+# Dosya düzeni: MAGIC | başlık uzunluğu (uint64, little-endian) | başlık JSON | 8 byte hizalı bölümler.
+# Başlık her bölümün konumunu, uzunluğunu ve tipini tutar; sözlükler, istatistikler ve call
+# flow'lar 'meta' bölümünde pickle olarak saklanır (yalnızca güvenilen dosyalar açılmalıdır).
+MAGIC = b'TEMSCOL1'
+FORMAT_VERSION = 2
+FILE_EXTENSION = '.tcol'
+
+_NULL_INT = -2 ** 63
+
+# Büyük metin/pickle sütunları bu kadar satırlık bloklar halinde zlib ile sıkıştırılır
+COMPRESSED_BLOCK_ROWS = 1024
+
+# Sözlük kodlamalı sütunlar: ad -> mesajdan değer. Filtre sütunları MessageStore ile aynı
+# değerleri kullanır; böylece açılan dosyada sütunlar yeniden hesaplanmaz.
+_CODED_COLUMNS = {
+    'timestamp_num': lambda message: message.get('timestamp_num'),
+    'message_type': lambda message: message.get('message_type'),
+    'protocol_type': lambda message: message.get('protocol_type'),
+    'channel': lambda message: message.get('channel'),
+    'message_identity': lambda message: message.get('message_identity', ''),
+    'protocol': lambda message: message.get('protocol'),
+    'source': lambda message: message.get('source', _MISSING),
+    'destination': lambda message: message.get('destination', _MISSING),
+    'source_file': lambda message: message.get('source_file', _MISSING),
+    'is_paging': lambda message: message.get('is_paging'),
+    'is_measurement': lambda message: message.get('is_measurement'),
+    'is_connection_related': lambda message: message.get('is_connection_related'),
+    'error_keywords': lambda message: _keywords(message.get('error_keywords')),
+    'lte_message_type': lambda message: message.get('lte_message_type'),
+    'message_direction': MessageStore._direction_key,
+}
+
+# Sayısal sütunlar (int64, None -> _NULL_INT); tamsayı olmayan değer varsa sözlük kodlanır
+_NUMERIC_COLUMNS = ('id', 'timestamp_ms', 'line_number', 'block_number', 'pci', 'earfcn', 'rrc_transaction_id')
+
+
+def _keywords(value: Any) -> Any:
+    # JSON'dan gelen listeler sözlük anahtarı olabilmesi için demete çevrilir
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _code_typecode(size: int) -> str:
+    if size <= 256:
+        return 'B'
+    if size <= 65536:
+        return 'H'
+    return 'I'
+
+
+class _Writer:
+    """Bölümleri sırayla geçici dosyaya yazar ve başlık için konumlarını tutar"""
+
+    def __init__(self, file):
+        self.file = file
+        self.sections = {}
+
+    def write(self, name: str, data, kind: str, **info):
+        offset = self.file.tell()
+        padding = -offset % 8
+        if padding:
+            self.file.write(b'\x00' * padding)
+            offset += padding
+        if isinstance(data, array):
+            info['typecode'] = data.typecode
+            data = data.tobytes()
+        self.file.write(data)
+        self.sections[name] = dict(info, kind=kind, offset=offset, length=len(data))
+
+
+def save_dataset(data: Dict[str, Any], path: str):
+    """Parse sonucunu sütun bazlı ikili dosyaya yaz (önce geçici dosyaya, sonra yerine taşınır)"""
+    messages = data['messages']
+    records = [MessageRecord.from_dict(message) for message in messages]
+    dictionaries = {}
+    descriptors = []
+    descriptor_codes = {}
+    temp_path = path + '.tmp'
+
+    with open(temp_path, 'wb') as body:
+        writer = _Writer(body)
+
+        for name, value_of in _CODED_COLUMNS.items():
+            codes_by_value = {}
+            codes = []
+            for record in records:
+                value = value_of(record)
+                code = codes_by_value.get(value)
+                if code is None:
+                    code = codes_by_value[value] = len(codes_by_value)
+                codes.append(code)
+            dictionaries[name] = list(codes_by_value)
+            writer.write(name, array(_code_typecode(len(codes_by_value)), codes), 'coded')
+
+        for name in _NUMERIC_COLUMNS:
+            values = [record.get(name) for record in records]
+            if all(value is None or type(value) is int for value in values):
+                writer.write(name, array('q', (_NULL_INT if value is None else value for value in values)), 'numeric')
+            else:
+                codes_by_value = {}
+                codes = [codes_by_value.setdefault(value, len(codes_by_value)) for value in values]
+                dictionaries[name] = list(codes_by_value)
+                writer.write(name, array(_code_typecode(len(codes_by_value)), codes), 'coded')
+
+        # Değişken uzunluklu sütunlar: satır başına bitiş konumu + birleştirilmiş veri.
+        # compress=True ise veri COMPRESSED_BLOCK_ROWS satırlık bloklar halinde sıkıştırılır.
+        def write_variable(name: str, items: Iterable[bytes], compress: bool = False):
+            ends = array('Q')
+            chunks = []
+            position = 0
+            for item in items:
+                position += len(item)
+                ends.append(position)
+                chunks.append(item)
+            writer.write(name + '.ends', ends, 'ends')
+            if not compress:
+                writer.write(name, b''.join(chunks), 'bytes')
+                return
+            block_ends = array('Q')
+            blocks = []
+            compressed_position = 0
+            for start in range(0, len(chunks), COMPRESSED_BLOCK_ROWS):
+                block = zlib.compress(b''.join(chunks[start:start + COMPRESSED_BLOCK_ROWS]), 1)
+                compressed_position += len(block)
+                block_ends.append(compressed_position)
+                blocks.append(block)
+            writer.write(name + '.blocks', block_ends, 'ends')
+            writer.write(name, b''.join(blocks), 'zlib', block_rows=COMPRESSED_BLOCK_ROWS)
+
+        write_variable('timestamp', ((record.timestamp or '').encode('utf-8') for record in records))
+        write_variable('timestamp_time', ((record.timestamp_time or '').encode('utf-8') for record in records))
+        write_variable('raw_content', ((record.raw_content or '').encode('utf-8') for record in records), compress=True)
+
+        def nested(record: MessageRecord) -> bytes:
+            descriptor = DESCRIPTORS.get(record.descriptor_id) if record.descriptor_id >= 0 else None
+            descriptor_code = -1
+            if descriptor:
+                descriptor_code = descriptor_codes.get(descriptor)
+                if descriptor_code is None:
+                    descriptor_code = descriptor_codes[descriptor] = len(descriptors)
+                    descriptors.append(descriptor)
+            state = (record.parameters_head, descriptor_code, record.parameters_tail,
+                     record.measurements_data, record.paging_info_data, record.extra)
+            return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+        write_variable('nested', (nested(record) for record in records), compress=True)
+
+        # RSRP ölçümleri (dBm): MessageStore'un RSRP indeksiyle aynı dönüşüm
+        rsrp_ends = array('Q')
+        rsrp_values = array('d')
+        for record in records:
+            for rsrp in record.get('measurements', {}).get('rsrp_values', ()):
+                try:
+                    rsrp_values.append(float(rsrp['dbm']))
+                except (ValueError, TypeError, KeyError):
+                    continue
+            rsrp_ends.append(len(rsrp_values))
+        writer.write('rsrp.ends', rsrp_ends, 'ends')
+        writer.write('rsrp', rsrp_values, 'numeric')
+
+        meta = {
+            'dictionaries': dictionaries,
+            'descriptors': descriptors,
+            'call_flows': data.get('call_flows', []),
+            'statistics': data.get('statistics', {}),
+        }
+        writer.write('meta', pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL), 'pickle')
+        sections = writer.sections
+
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'byteorder': sys.byteorder,
+        'rows': len(records),
+        'total_messages': data.get('total_messages', len(records)),
+        'sections': sections,
+    }).encode('utf-8')
+    prefix_length = len(MAGIC) + 8 + len(header)
+    header += b' ' * (-prefix_length % 8)
+
+    # Başlık bölüm konumlarını içerdiğinden gövde ayrı yazılıp başlığın arkasına eklenir
+    with open(path + '.part', 'wb') as output, open(temp_path, 'rb') as body:
+        output.write(MAGIC)
+        output.write(struct.pack('<Q', len(header)))
+        output.write(header)
+        while True:
+            chunk = body.read(1024 * 1024)
+            if not chunk:
+                break
+            output.write(chunk)
+    os.remove(temp_path)
+    os.replace(path + '.part', path)
+
+
+class ColumnarMessages(Sequence):
+    """Sütun bazlı dosyadaki mesajlara bellek eşlemeli (mmap), tembel erişim.
+
+    Dosya açılırken yalnızca başlık okunur; MessageRecord'lar ilk erişildiklerinde sütunlardan
+    oluşturulup saklanır. MessageStore filtre sütunlarını ve RSRP/zaman indekslerini
+    column_loaders() üzerinden mesajları oluşturmadan alır.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = self._mmap
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise Exception(f"Geçersiz sütun bazlı dosya: {path}")
+        header_length = struct.unpack_from('<Q', buffer, len(MAGIC))[0]
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(buffer[header_start:header_start + header_length]))
+        if header['version'] != FORMAT_VERSION:
+            raise Exception(f"Desteklenmeyen dosya sürümü: {header['version']}")
+
+        self._base = header_start + header_length
+        self._swap = header['byteorder'] != sys.byteorder
+        self._sections = header['sections']
+        self._view = memoryview(buffer)
+        self._size = header['rows']
+        self.total_messages = header['total_messages']
+
+        meta = pickle.loads(self._bytes('meta'))
+        self.call_flows = meta['call_flows']
+        self.statistics = meta['statistics']
+        self._dictionaries = {name: [sys.intern(value) if type(value) is str else value for value in values]
+                              for name, values in meta['dictionaries'].items()}
+        self._descriptor_ids = [DESCRIPTORS.register_frozen(descriptor) for descriptor in meta['descriptors']]
+        self._columns = {}
+        self._blocks = {}  # sütun adı -> (blok numarası, açılmış blok)
+        self._records = [None] * self._size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('mesaj indeksi aralık dışında')
+        record = self._records[index]
+        if record is None:
+            record = self._records[index] = self._build_record(index)
+        return record
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield self[row]
+
+    def __reduce__(self):
+        # Veri seti diske taşınırken mesajlar değil yalnızca dosya yolu saklanır
+        return ColumnarMessages, (self.path,)
+
+    def estimated_size(self) -> int:
+        """Bellekte tutulan kısmın kaba tahmini (oluşturulmuş kayıtlar ve yüklenen sütunlar)"""
+        built = sum(1 for record in self._records if record is not None)
+        return self._size * 8 + built * 1024
+
+    def column_loaders(self) -> Dict[str, Callable[[], Any]]:
+        """MessageStore için hazır sütun ve indeks yükleyicileri"""
+        loaders = {name: (lambda name=name: self._categorical(name))
+                   for name in ('protocol', 'lte_message_type', 'message_direction', 'channel',
+                                'message_identity', 'pci', 'earfcn', 'rrc_transaction_id',
+                                'is_paging', 'is_measurement', 'is_connection_related')}
+        if 'source_file' in self._sections:
+            loaders['source_file'] = lambda: self._categorical('source_file')
+        loaders['timestamp_ms'] = self._timestamps_ms
+        loaders['rsrp_index'] = self._rsrp_index
+        return loaders
+
+    def _section(self, name: str) -> Dict[str, Any]:
+        return self._sections[name]
+
+    def _bytes(self, name: str) -> memoryview:
+        section = self._section(name)
+        start = self._base + section['offset']
+        return self._view[start:start + section['length']]
+
+    def _array(self, name: str):
+        """Sayısal bölümü kopyalamadan (aynı bayt sırasındaysa) dizi olarak döndür"""
+        column = self._columns.get(name)
+        if column is None:
+            typecode = self._section(name)['typecode']
+            if self._swap:
+                column = array(typecode, self._bytes(name).tobytes())
+                column.byteswap()
+            else:
+                column = self._bytes(name).cast(typecode)
+            self._columns[name] = column
+        return column
+
+    def _value(self, name: str, row: int) -> Any:
+        if self._section(name)['kind'] == 'coded':
+            return self._dictionaries[name][self._array(name)[row]]
+        value = self._array(name)[row]
+        return None if value == _NULL_INT else value
+
+    def _variable(self, name: str, row: int) -> memoryview:
+        ends = self._array(name + '.ends')
+        start = ends[row - 1] if row else 0
+        section = self._section(name)
+        if section['kind'] != 'zlib':
+            return self._bytes(name)[start:ends[row]]
+
+        # Satırın bloğunu aç (son açılan blok sütun başına saklanır)
+        block_rows = section['block_rows']
+        block_number = row // block_rows
+        cached = self._blocks.get(name)
+        if cached is None or cached[0] != block_number:
+            block_ends = self._array(name + '.blocks')
+            block_start = block_ends[block_number - 1] if block_number else 0
+            data = zlib.decompress(self._bytes(name)[block_start:block_ends[block_number]])
+            cached = self._blocks[name] = (block_number, memoryview(data))
+        first_row = block_number * block_rows
+        block_offset = ends[first_row - 1] if first_row else 0
+        return cached[1][start - block_offset:ends[row] - block_offset]
+
+    def _build_record(self, row: int) -> MessageRecord:
+        parameters_head, descriptor_code, parameters_tail, measurements, paging_info, extra = \
+            pickle.loads(self._variable('nested', row))
+        record = MessageRecord.__new__(MessageRecord)
+        record.timestamp_num = self._value('timestamp_num', row)
+        record.timestamp_time = str(self._variable('timestamp_time', row), 'utf-8')
+        record.timestamp = str(self._variable('timestamp', row), 'utf-8')
+        for name in _NUMERIC_COLUMNS:
+            setattr(record, name, self._value(name, row))
+        for name in ('message_type', 'protocol_type', 'channel', 'message_identity', 'protocol',
+                     'source', 'destination', 'is_paging', 'is_measurement', 'is_connection_related'):
+            setattr(record, name, self._value(name, row))
+        record.source_file = self._value('source_file', row) if 'source_file' in self._sections else _MISSING
+        # error_keywords sütunu olmayan dosyalarda analiz raw_content'e geri döner
+        record.error_keywords = self._value('error_keywords', row) if 'error_keywords' in self._sections else None
+        record.parameters_head = parameters_head
+        record.descriptor_id = self._descriptor_ids[descriptor_code] if descriptor_code >= 0 else -1
+        record.parameters_tail = parameters_tail
+        record.measurements_data = measurements
+        record.paging_info_data = paging_info
+        record.raw_content = str(self._variable('raw_content', row), 'utf-8')
+        record.source_offset = record.source_length = _MISSING
+        record.extra = extra
+        return record
+
+    def _categorical(self, name: str) -> _CategoricalColumn:
+        if self._section(name)['kind'] == 'coded':
+            return _CategoricalColumn.from_codes(self._dictionaries[name], self._array(name))
+        return _CategoricalColumn(None if value == _NULL_INT else value for value in self._array(name))
+
+    def _timestamps_ms(self) -> List[Optional[int]]:
+        if self._section('timestamp_ms')['kind'] == 'coded':
+            values = self._dictionaries['timestamp_ms']
+            return [values[code] for code in self._array('timestamp_ms')]
+        return [None if value == _NULL_INT else value for value in self._array('timestamp_ms')]
+
+    def _rsrp_index(self) -> tuple:
+        ends = self._array('rsrp.ends')
+        values = self._array('rsrp')
+        entries = []
+        nan_rows = []
+        start = 0
+        for row in range(self._size):
+            end = ends[row]
+            for position in range(start, end):
+                value = values[position]
+                if value != value:
+                    nan_rows.append(row)
+                else:
+                    entries.append((value, row))
+            start = end
+        entries.sort()
+        return (array('d', (value for value, _ in entries)),
+                array('I', (row for _, row in entries)),
+                nan_rows)
+
+
+def load_dataset(path: str) -> Dict[str, Any]:
+    """Sütun bazlı dosyayı parse_log_file ile aynı yapıda (tembel mesaj dizisiyle) aç"""
+    messages = ColumnarMessages(path)
+    return {
+        'messages': messages,
+        'call_flows': messages.call_flows,
+        'statistics': messages.statistics,
+        'total_messages': messages.total_messages
+    }
@@ -0,0 +1,301 @@
+import os
+import uuid
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Iterable
+from message_store import MessageStore
+from measurements import MeasurementStore
+from search_index import SearchIndex
+
+
+class DatasetStore:
+    """Parse edilmiş log sonuçlarını sunucu tarafında dataset ID ile tutan LRU deposu.
+
+    Toplam tahmini boyut max_bytes'ı aşınca en uzun süredir kullanılmayan veri setleri
+    bellekten çıkarılır; spill_dir verilmişse silinmek yerine diske yazılır ve tekrar
+    istendiğinde geri yüklenir.
+
+    Tembel parse edilen veri setlerinin ayrıntı dosyası (data['detail_file']) veri seti
+    silinince kaldırılır; açılan mesaj ayrıntıları küçük bir LRU önbellekte tutulur.
+
+    Sabitlenen (pinned) veri setleri (ör. canlı takipte büyümeye devam edenler) bellekten
+    çıkarılmaz; yerinde büyüdükçe boyutları resize ile yeniden hesaba katılır.
+    """
+
+    # Mesaj sözlüğü başına tahmini sabit bellek maliyeti (anahtarlar, iç içe sözlükler)
+    MESSAGE_OVERHEAD_BYTES = 2048
+
+    def __init__(self, max_bytes: int = 1024 * 1024 * 1024, spill_dir: Optional[str] = None,
+                 max_details: int = 256):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_details = max_details
+        self._datasets = OrderedDict()  # dataset_id -> (veri, tahmini boyut)
+        self._message_stores = {}  # dataset_id -> MessageStore (filtre indeksleri, ilk filtrede oluşturulur)
+        self._measurement_stores = {}  # dataset_id -> MeasurementStore (ilk ölçüm isteğinde oluşturulur)
+        self._search_indexes = {}  # dataset_id -> (mesaj dizisi, SearchIndex) parse'ta indekslenmemiş veri setleri için
+        self._details = OrderedDict()  # (dataset_id, mesaj id) -> ayrıntılı mesaj kaydı
+        self._detail_files = {}  # dataset_id -> tembel parse ayrıntı dosyası (diske taşınsa da tutulur)
+        self._pinned = set()  # bellekten çıkarılmayacak veri setleri
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def add(self, data: Dict[str, Any], pinned: bool = False) -> str:
+        """Parse sonucunu depola ve yeni dataset ID'sini döndür; pinned ise unpin'e kadar bellekten çıkarılmaz"""
+        dataset_id = uuid.uuid4().hex
+        with self._lock:
+            if pinned:
+                self._pinned.add(dataset_id)
+            self._insert(dataset_id, data)
+        return dataset_id
+
+    def unpin(self, dataset_id: str):
+        """Veri setinin sabitlemesini kaldır (tekrar LRU ile bellekten çıkarılabilir)"""
+        with self._lock:
+            self._pinned.discard(dataset_id)
+            self._evict(dataset_id)
+
+    def resize(self, dataset_id: str, added_messages: Optional[Iterable[Dict[str, Any]]] = None):
+        """Yerinde değişen (ör. canlı takipte büyüyen) veri setinin boyut tahminini güncelle.
+
+        added_messages verilirse yalnızca bu mesajların tahmini boyutu eklenir (tüm liste yeniden
+        sayılmaz); verilmezse tahmin baştan yapılır. Toplam sınırı aşılırsa diğer veri setleri
+        bellekten çıkarılır.
+        """
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                return
+            data, size = entry
+            if added_messages is None:
+                new_size = self._estimate_size(data)
+            else:
+                new_size = size + self._messages_size(added_messages)
+            self._datasets[dataset_id] = (data, new_size)
+            self._total_bytes += new_size - size
+            self._evict(dataset_id)
+
+    def get(self, dataset_id: str) -> Optional[Dict[str, Any]]:
+        """Veri setini döndür; bellekte değilse diskten geri yükle, hiç yoksa None"""
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is not None:
+                self._datasets.move_to_end(dataset_id)
+                return entry[0]
+
+            spill_path = self._spill_path(dataset_id)
+            if spill_path is None or not os.path.exists(spill_path):
+                return None
+
+            with open(spill_path, 'rb') as file:
+                data = pickle.load(file)
+            os.remove(spill_path)
+            self._insert(dataset_id, data)
+            return data
+
+    def update(self, dataset_id: str, data: Dict[str, Any]) -> bool:
+        """Veri setini yenisiyle değiştir ve boyut tahminini güncelle; veri seti yoksa False"""
+        with self._lock:
+            entry = self._datasets.pop(dataset_id, None)
+            if entry is not None:
+                self._total_bytes -= entry[1]
+            else:
+                # Diske taşınmış eski hali geçersiz olur
+                spill_path = self._spill_path(dataset_id)
+                if spill_path is None or not os.path.exists(spill_path):
+                    return False
+                os.remove(spill_path)
+            self._message_stores.pop(dataset_id, None)
+            self._measurement_stores.pop(dataset_id, None)
+            self._search_indexes.pop(dataset_id, None)
+            self._drop_details(dataset_id)
+            if self._detail_files.get(dataset_id) != data.get('detail_file'):
+                self._remove_detail_file(dataset_id)
+            self._insert(dataset_id, data)
+            return True
+
+    def get_message_store(self, dataset_id: str) -> Optional[MessageStore]:
+        """Veri setinin mesajları için indeksli MessageStore'u döndür; veri seti yoksa None"""
+        data = self.get(dataset_id)
+        if data is None:
+            return None
+        with self._lock:
+            message_store = self._message_stores.get(dataset_id)
+            # Mesaj listesi değiştiyse ya da büyüdüyse (canlı takip) depoyu yeniden oluştur
+            if (message_store is None or message_store.messages is not data['messages']
+                    or len(message_store) != len(data['messages'])):
+                message_store = self._message_stores[dataset_id] = MessageStore(data['messages'])
+            return message_store
+
+    def get_measurement_store(self, dataset_id: str) -> Optional[MeasurementStore]:
+        """Veri setinin RSRP/RSRQ ölçümleri için MeasurementStore'u döndür; veri seti yoksa None"""
+        data = self.get(dataset_id)
+        if data is None:
+            return None
+        messages = data['messages']
+        with self._lock:
+            measurement_store = self._measurement_stores.get(dataset_id)
+        # Mesaj listesi değiştiyse ya da büyüdüyse (canlı takip) yeniden oluştur; diziler tüm
+        # mesajlar taranarak kurulduğundan bu kilit dışında yapılır
+        if (measurement_store is None or measurement_store.messages is not messages
+                or len(measurement_store) != len(messages)):
+            measurement_store = MeasurementStore(messages)
+            with self._lock:
+                if dataset_id in self._datasets:
+                    self._measurement_stores[dataset_id] = measurement_store
+        return measurement_store
+
+    def get_search_index(self, dataset_id: str,
+                         builder: Callable[[Dict[str, Any]], SearchIndex]) -> Optional[SearchIndex]:
+        """Veri setinin tam metin indeksini döndür; veri seti yoksa None.
+
+        Parse sırasında oluşturulan indeks (data['search_index']) doğrudan kullanılır. Yoksa (sütun
+        bazlı dosyadan açılan, akış halinde yüklenen ya da canlı takip edilen veri setleri) ilk
+        aramada builder(veri seti) ile oluşturulur ve mesaj listesi büyüyene kadar saklanır.
+        """
+        data = self.get(dataset_id)
+        if data is None:
+            return None
+        messages = data['messages']
+        search_index = data.get('search_index')
+        if search_index is not None and search_index.size == len(messages):
+            return search_index
+        with self._lock:
+            entry = self._search_indexes.get(dataset_id)
+        if entry is not None and entry[0] is messages and entry[1].size == len(messages):
+            return entry[1]
+        # İndeks tüm mesaj metinleri taranarak kurulduğundan bu kilit dışında yapılır
+        search_index = builder(data)
+        with self._lock:
+            if dataset_id in self._datasets:
+                self._search_indexes[dataset_id] = (messages, search_index)
+        return search_index
+
+    def get_message_details(self, dataset_id: str, message_id: int,
+                            loader: Callable[[Dict[str, Any], Dict[str, Any]], Any]) -> Optional[Any]:
+        """Mesajın ayrıntılı kaydını döndür; veri seti ya da mesaj yoksa None.
+
+        Kayıt loader(veri seti, mesaj) ile açılır (ör. ayrıntı dosyasından) ve son
+        max_details kayıt önbellekte tutulur.
+        """
+        key = (dataset_id, message_id)
+        with self._lock:
+            details = self._details.get(key)
+            if details is not None:
+                self._details.move_to_end(key)
+                return details
+
+        data = self.get(dataset_id)
+        if data is None:
+            return None
+        messages = data['messages']
+        # Mesaj id'leri 1'den başlayan sıra numaralarıdır
+        if not 1 <= message_id <= len(messages) or messages[message_id - 1]['id'] != message_id:
+            return None
+
+        # Blok okuma ve parse kilit dışında yapılır
+        details = loader(data, messages[message_id - 1])
+        with self._lock:
+            if dataset_id in self._datasets:
+                self._details[key] = details
+                while len(self._details) > self.max_details:
+                    self._details.popitem(last=False)
+        return details
+
+    def remove(self, dataset_id: str):
+        """Veri setini bellekten ve diskten sil"""
+        with self._lock:
+            entry = self._datasets.pop(dataset_id, None)
+            self._message_stores.pop(dataset_id, None)
+            self._measurement_stores.pop(dataset_id, None)
+            self._search_indexes.pop(dataset_id, None)
+            self._drop_details(dataset_id)
+            self._remove_detail_file(dataset_id)
+            self._pinned.discard(dataset_id)
+            if entry is not None:
+                self._total_bytes -= entry[1]
+            spill_path = self._spill_path(dataset_id)
+            if spill_path is not None and os.path.exists(spill_path):
+                os.remove(spill_path)
+
+    def stats(self) -> Dict[str, int]:
+        """Bellekteki veri seti sayısı ve tahmini toplam boyutu"""
+        with self._lock:
+            return {'datasets': len(self._datasets), 'bytes': self._total_bytes}
+
+    def __contains__(self, dataset_id: str) -> bool:
+        with self._lock:
+            if dataset_id in self._datasets:
+                return True
+            spill_path = self._spill_path(dataset_id)
+            return spill_path is not None and os.path.exists(spill_path)
+
+    def _insert(self, dataset_id: str, data: Dict[str, Any]):
+        size = self._estimate_size(data)
+        self._datasets[dataset_id] = (data, size)
+        if data.get('detail_file'):
+            self._detail_files[dataset_id] = data['detail_file']
+        self._total_bytes += size
+        self._evict(dataset_id)
+
+    def _evict(self, keep_id: str):
+        """Toplam boyut sınırın altına inene kadar en uzun süredir kullanılmayan veri setlerini çıkar.
+
+        keep_id (yeni eklenen ya da büyüyen veri seti) ve sabitlenen veri setleri çıkarılmaz.
+        """
+        while self._total_bytes > self.max_bytes:
+            evicted_id = next((dataset_id for dataset_id in self._datasets
+                               if dataset_id != keep_id and dataset_id not in self._pinned), None)
+            if evicted_id is None:
+                break
+            evicted_data, evicted_size = self._datasets.pop(evicted_id)
+            self._total_bytes -= evicted_size
+            # İndeksler diske yazılmaz, veri seti geri yüklendiğinde yeniden oluşturulur
+            self._message_stores.pop(evicted_id, None)
+            self._measurement_stores.pop(evicted_id, None)
+            self._search_indexes.pop(evicted_id, None)
+            self._drop_details(evicted_id)
+            self._spill(evicted_id, evicted_data)
+
+    def _spill(self, dataset_id: str, data: Dict[str, Any]):
+        """Bellekten çıkarılan veri setini diske yaz (spill_dir yoksa veri seti silinir)"""
+        spill_path = self._spill_path(dataset_id)
+        if spill_path is None:
+            self._remove_detail_file(dataset_id)
+            return
+        temp_path = spill_path + '.tmp'
+        with open(temp_path, 'wb') as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, spill_path)
+
+    def _drop_details(self, dataset_id: str):
+        for key in [key for key in self._details if key[0] == dataset_id]:
+            del self._details[key]
+
+    def _remove_detail_file(self, dataset_id: str):
+        detail_file = self._detail_files.pop(dataset_id, None)
+        if detail_file and os.path.exists(detail_file):
+            os.remove(detail_file)
+
+    def _spill_path(self, dataset_id: str) -> Optional[str]:
+        # Yalnızca uuid4().hex formatındaki ID'ler dosya adına dönüştürülür
+        if not self.spill_dir or len(dataset_id) != 32 or not all(c in '0123456789abcdef' for c in dataset_id):
+            return None
+        return os.path.join(self.spill_dir, f'{dataset_id}.pkl')
+
+    def _estimate_size(self, data: Dict[str, Any]) -> int:
+        """Veri setinin bellekteki boyutunu kabaca tahmin et"""
+        messages = data.get('messages', [])
+        search_index = data.get('search_index')
+        index_size = search_index.estimated_size() if search_index is not None else 0
+        if hasattr(messages, 'estimated_size'):
+            # Dosyadan tembel açılan veri seti: mesajların çoğu bellekte değildir
+            return messages.estimated_size() + index_size
+        return self._messages_size(messages) + index_size
+
+    def _messages_size(self, messages: Iterable[Dict[str, Any]]) -> int:
+        return sum(len(message.get('raw_content', '')) + self.MESSAGE_OVERHEAD_BYTES for message in messages)
@@ -0,0 +1,175 @@
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable
+
+
+class JobCancelled(Exception):
+    """İptal istenen işin kendi kontrol noktasında durdurulması için fırlatılır"""
+
+
+class JobQueueFull(Exception):
+    """Kuyrukta bekleyen/çalışan iş sayısı sınıra ulaştığında fırlatılır"""
+
+
+class Job:
+    """Arka planda çalışan tek bir işin durumu, ilerlemesi ve sonucu"""
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.status = 'queued'  # queued -> running -> completed | failed | cancelled
+        self.progress = 0.0
+        self.details = {}
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'failed', 'cancelled')
+
+    def check_cancelled(self):
+        """İptal istendiyse JobCancelled fırlat (iş fonksiyonları uygun yerlerde çağırır)"""
+        if self._cancel_event.is_set():
+            raise JobCancelled(f'İş iptal edildi: {self.id}')
+
+    def report(self, progress: Optional[float] = None, **details):
+        """İlerlemeyi (0-1) ve ek bilgileri güncelle; iptal istendiyse işi durdur"""
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+        self.details.update(details)
+        self.check_cancelled()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Durum ucunda döndürülen iş bilgisi (sonuç yalnızca tamamlanan işlerde)"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'cancel_requested': self.cancel_requested,
+            'progress': self.progress,
+            'details': dict(self.details),
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'result': self.result if self.status == 'completed' else None
+        }
+
+
+class JobQueue:
+    """Harici bir aracı (broker) gerektirmeyen, süreç içi arka plan iş kuyruğu.
+
+    İşler sınırlı sayıda iş parçacığında (max_workers) sırayla çalıştırılır; en fazla
+    max_pending iş aynı anda kuyrukta bekleyebilir veya çalışabilir. İş fonksiyonu ilk
+    argüman olarak Job nesnesini alır, job.report() ile ilerleme bildirir ve bu sırada
+    iptal isteklerini kontrol eder. Tamamlanan işler ttl_seconds boyunca sorgulanabilir.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 16, ttl_seconds: int = 3600):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tems-job')
+        self._jobs = {}
+        self._cleanups = {}  # job_id -> iş hiç çalışmadan iptal edilirse de çağrılacak temizlik
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable[..., Any], *args, name: str = '',
+               cleanup: Optional[Callable[[], None]] = None, **kwargs) -> Job:
+        """İşi kuyruğa ekle; kuyruk doluysa JobQueueFull fırlat.
+
+        cleanup verilirse iş nasıl biterse bitsin (kuyruktayken iptal dahil) bir kez çağrılır.
+        """
+        job = Job(name or getattr(func, '__name__', 'job'))
+        with self._lock:
+            self._expire()
+            pending = sum(1 for existing in self._jobs.values() if not existing.finished)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f'İş kuyruğu dolu ({self.max_pending} iş bekliyor)')
+            self._jobs[job.id] = job
+            if cleanup is not None:
+                self._cleanups[job.id] = cleanup
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """İşi iptal et: kuyruktaysa hiç çalıştırılmaz, çalışıyorsa ilk kontrol noktasında durur"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return job
+            job._cancel_event.set()
+            if job.status == 'queued':
+                job.status = 'cancelled'
+                job.finished_at = time.time()
+                cleanup = self._cleanups.pop(job.id, None)
+            else:
+                cleanup = None
+        if cleanup is not None:
+            cleanup()
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return counts
+
+    def shutdown(self, wait: bool = True):
+        """Bekleyen işleri iptal et ve iş parçacıklarını kapat"""
+        with self._lock:
+            job_ids = [job.id for job in self._jobs.values() if not job.finished]
+        for job_id in job_ids:
+            self.cancel(job_id)
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: dict):
+        with self._lock:
+            # Kuyruktayken iptal edildi
+            if job.status != 'queued':
+                return
+            job.status = 'running'
+            job.started_at = time.time()
+
+        try:
+            result = func(job, *args, **kwargs)
+            with self._lock:
+                job.result = result
+                job.progress = 1.0
+                job.status = 'completed'
+        except Exception as e:
+            with self._lock:
+                # İş fonksiyonu iptal hatasını kendi hatasına sarmış olabilir
+                if job.cancel_requested:
+                    job.status = 'cancelled'
+                else:
+                    job.status = 'failed'
+                    job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                cleanup = self._cleanups.pop(job.id, None)
+            if cleanup is not None:
+                cleanup()
+
+    def _expire(self):
+        """Süresi dolan bitmiş işleri unut"""
+        deadline = time.time() - self.ttl_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and job.finished_at is not None and job.finished_at < deadline:
+                del self._jobs[job_id]
@@ -0,0 +1,151 @@
+import json
+import zlib
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Iterable, Iterator
+from flask.json.provider import DefaultJSONProvider
+from message_record import MessageRecord, DESCRIPTORS, thaw
+
+try:
+    import orjson
+except ImportError:  # İsteğe bağlı hızlı kodlayıcı; yoksa standart json kullanılır
+    orjson = None
+
+# Kodlayıcı adları ('auto': orjson kuruluysa orjson, değilse json)
+ENCODERS = ('auto', 'orjson', 'json')
+
+# İçerik kodlaması -> zlib wbits (HTTP 'deflate' zlib sarmalıdır)
+CONTENT_ENCODINGS = {
+    'gzip': 31,
+    'deflate': 15,
+}
+
+# Uzun diziler bu kadar elemanlık parçalar halinde kodlanır
+ITEMS_PER_CHUNK = 500
+
+# Bu derinliğe kadar sözlükler anahtar anahtar akıtılır; daha derindeki değerler tek seferde kodlanır
+STREAM_DEPTH = 2
+
+# Küçük parçalar en az bu boyuta ulaşınca gönderilir
+CHUNK_BYTES = 64 * 1024
+
+
+def resolve_encoder(name: str) -> str:
+    """Kodlayıcı adını doğrula; 'auto' kurulu olan en hızlı kodlayıcıya çözülür"""
+    if name not in ENCODERS:
+        raise ValueError(f"Bilinmeyen JSON kodlayıcı: {name}")
+    if name == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson kurulu değil")
+    return name
+
+
+def negotiate_content_encoding(accept_encodings) -> Optional[str]:
+    """Accept-Encoding'e göre gzip ya da deflate seç (eşit kalitede gzip öncelikli); desteklenmiyorsa None"""
+    best, best_quality = None, 0
+    for name in CONTENT_ENCODINGS:
+        quality = accept_encodings[name]
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class JSONStreamEncoder:
+    """Yanıt gövdesini parça parça (UTF-8 byte) üreten JSON kodlayıcı.
+
+    Üst düzey sözlükler STREAM_DEPTH derinliğine kadar anahtar anahtar, uzun diziler
+    ITEMS_PER_CHUNK elemanlık parçalar halinde kodlanır; yanıtın tamamı hiçbir zaman tek
+    metin olarak oluşturulmaz. compact ise MessageRecord'lar to_compact_dict ile yazılır ve
+    kullanılan mesaj türü açıklamaları yanıt sözlüğünün sonunda 'descriptors' tablosunda
+    (descriptor_id -> açıklama alanları) bir kez gönderilir.
+    """
+
+    def __init__(self, encoder: str = 'auto', compact: bool = False):
+        self.encoder = resolve_encoder(encoder)
+        self.compact = compact
+        self._descriptor_ids = set()
+        if self.encoder == 'json':
+            self._json = json.JSONEncoder(default=self._default, ensure_ascii=False, separators=(',', ':'))
+
+    def iter_encode(self, value: Any) -> Iterator[bytes]:
+        """value'nun JSON karşılığını en az CHUNK_BYTES'lık parçalar halinde üret"""
+        buffer, size = [], 0
+        for part in self._iter_value(value, 0, top_level=True):
+            buffer.append(part)
+            size += len(part)
+            if size >= CHUNK_BYTES:
+                yield b''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b''.join(buffer)
+
+    def encode(self, value: Any) -> bytes:
+        """Tek bir değeri kodla"""
+        if self.encoder == 'orjson':
+            return orjson.dumps(value, default=self._default, option=orjson.OPT_NON_STR_KEYS)
+        return self._json.encode(value).encode('utf-8')
+
+    def _iter_value(self, value: Any, depth: int, top_level: bool = False) -> Iterator[bytes]:
+        if type(value) is dict and depth < STREAM_DEPTH:
+            yield b'{'
+            first = True
+            for key, item in value.items():
+                if not first:
+                    yield b','
+                first = False
+                yield self.encode(str(key))
+                yield b':'
+                yield from self._iter_value(item, depth + 1)
+            if top_level and self.compact:
+                # Açıklamalar ancak tüm kayıtlar yazıldıktan sonra bilinir
+                if not first:
+                    yield b','
+                yield b'"descriptors":'
+                yield self.encode(self._descriptor_table())
+            yield b'}'
+        elif type(value) in (list, tuple) and len(value) > ITEMS_PER_CHUNK:
+            yield b'['
+            for start in range(0, len(value), ITEMS_PER_CHUNK):
+                if start:
+                    yield b','
+                # '[a,b,c]' -> 'a,b,c'
+                yield self.encode(list(value[start:start + ITEMS_PER_CHUNK]))[1:-1]
+            yield b']'
+        else:
+            yield self.encode(value)
+
+    def _default(self, o: Any) -> Any:
+        if isinstance(o, MessageRecord):
+            if not self.compact:
+                return o.to_dict()
+            if o.descriptor_id >= 0:
+                self._descriptor_ids.add(o.descriptor_id)
+            return o.to_compact_dict()
+        if isinstance(o, MappingProxyType):
+            # Kaydın salt okunur iç içe alanı (ör. msg['parameters'])
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+    def _descriptor_table(self) -> Dict[str, Dict[str, Any]]:
+        return {str(descriptor_id): thaw(DESCRIPTORS.get(descriptor_id))
+                for descriptor_id in sorted(self._descriptor_ids)}
+
+
+def iter_compressed(chunks: Iterable[bytes], content_encoding: str, level: int = 6) -> Iterator[bytes]:
+    """Parçaları gzip/deflate ile akış halinde sıkıştır"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, CONTENT_ENCODINGS[content_encoding])
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_json_response(value: Any, encoder: str = 'auto', compact: bool = False,
+                       content_encoding: Optional[str] = None, level: int = 6) -> Iterator[bytes]:
+    """Yanıt gövdesini üret: akış halinde JSON, content_encoding verilirse sıkıştırılmış"""
+    chunks = JSONStreamEncoder(encoder, compact).iter_encode(value)
+    if content_encoding is None:
+        return chunks
+    return iter_compressed(chunks, content_encoding, level)
+
@@ -0,0 +1,45 @@
+from typing import Dict, Any, Tuple, Optional
+
+
+class KeywordClassifier:
+    """Bir metni sabit bir anahtar kelime kümesine göre sınıflandırır.
+
+    Anahtar kelimeler bir kez normalize edilir; metin en fazla bir kez küçük harfe çevrilir ve
+    her kelime C seviyesindeki alt metin aramasıyla aranır (CPython'da re alternation'ından
+    ve saf Python otomatından hızlı). Aynı eşleşme kümesi için hep aynı demet döndürülür;
+    mesajlarda saklanan sonuçlar böylece paylaşılır.
+
+    keywords: anahtar kelime -> etiket. Sıra önceliktir: classify() eşleşen ilk kelimenin
+    etiketini döndürür (ör. önce uplink, sonra downlink mesaj adları).
+    """
+
+    def __init__(self, keywords: Dict[str, Any], case_sensitive: bool = False):
+        self._labels = dict(keywords)
+        self._case_sensitive = case_sensitive
+        self._keywords = tuple((keyword if case_sensitive else keyword.lower(), keyword) for keyword in keywords)
+        self._results = {}
+
+    def matches(self, text: Optional[str]) -> Tuple[str, ...]:
+        """Metinde geçen anahtar kelimeleri öncelik sırasıyla döndür"""
+        if not text:
+            return ()
+        if not self._case_sensitive:
+            text = text.lower()
+        found = tuple(keyword for normalized, keyword in self._keywords if normalized in text)
+        if not found:
+            return ()
+        result = self._results.get(found)
+        if result is None:
+            result = self._results.setdefault(found, found)
+        return result
+
+    def classify(self, text: Optional[str], default: Any = None) -> Any:
+        """Metinde geçen en öncelikli anahtar kelimenin etiketini döndür; yoksa default"""
+        if not text:
+            return default
+        if not self._case_sensitive:
+            text = text.lower()
+        for normalized, keyword in self._keywords:
+            if normalized in text:
+                return self._labels[keyword]
+        return default
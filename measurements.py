@@ -0,0 +1,251 @@
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from timestamps import format_timestamp_ms
+
+_NO_VALUE = -1  # pci/earfcn bilinmiyor
+
+DEFAULT_PERCENTILES = (5, 10, 50, 90, 95)
+# Histogram en fazla bu kadar kutu içerir; daha dar kutu istenirse genişlik büyütülür
+MAX_HISTOGRAM_BINS = 1000
+# Zaman serisi en fazla bu kadar (grup, kova) satırı döndürür
+MAX_SERIES_POINTS = 100000
+
+
+def format_seconds(seconds: float) -> str:
+    """Epoch saniyesini 'DDMMYY HH:MM:SS.mmm' formatına çevir"""
+    return format_timestamp_ms(int(round(seconds * 1000)))
+
+
+class MeasurementStore:
+    """Veri setindeki RSRP/RSRQ ölçümlerini NumPy dizilerinde tutan vektörel hesaplama motoru.
+
+    Her ölçüm bir satırdır: değer, mesajın pci/earfcn değeri ve zamanı (timestamp_ms, saniye olarak).
+    Diziler bir kez oluşturulur; yüzdelikler, histogramlar, pci/earfcn kırılımları ve zaman
+    kovası serileri Python döngüsü olmadan sıralama + reduceat ile hesaplanır.
+    """
+
+    # Ölçüm adı -> (measurements anahtarı, değer anahtarı, varsayılan histogram kutu genişliği)
+    METRICS = {
+        'rsrp': ('rsrp_values', 'dbm', 1.0),
+        'rsrq': ('rsrq_values', 'db', 0.5),
+    }
+    GROUP_BY = ('pci', 'earfcn')
+
+    def __init__(self, messages: Sequence[Dict[str, Any]]):
+        self.messages = messages
+        self.size = len(messages)
+        columns = {metric: ([], [], [], []) for metric in self.METRICS}
+
+        for row, message in enumerate(messages):
+            if row >= self.size:
+                break
+            measurements = message.get('measurements')
+            if not measurements:
+                continue
+            seconds = None
+            for metric, (list_key, value_key, _) in self.METRICS.items():
+                samples = measurements.get(list_key)
+                if not samples:
+                    continue
+                if seconds is None:
+                    milliseconds = message.get('timestamp_ms')
+                    seconds = milliseconds / 1000 if milliseconds is not None else float('nan')
+                    pci = _int_or_missing(message.get('pci'))
+                    earfcn = _int_or_missing(message.get('earfcn'))
+                values, pcis, earfcns, times = columns[metric]
+                for sample in samples:
+                    try:
+                        values.append(float(sample[value_key]))
+                    except (ValueError, TypeError, KeyError):
+                        continue
+                    pcis.append(pci)
+                    earfcns.append(earfcn)
+                    times.append(seconds)
+
+        self._columns = {}
+        for metric, (values, pcis, earfcns, times) in columns.items():
+            values = np.array(values, dtype=np.float64)
+            # NaN/sonsuz değerler hiçbir istatistiğe girmez
+            valid = np.isfinite(values)
+            self._columns[metric] = {
+                'value': values[valid],
+                'pci': np.array(pcis, dtype=np.int64)[valid],
+                'earfcn': np.array(earfcns, dtype=np.int64)[valid],
+                'time': np.array(times, dtype=np.float64)[valid],
+            }
+
+    def __len__(self) -> int:
+        return self.size
+
+    def aggregate(self, metric: str, group_by: Optional[str] = None, bucket_seconds: Optional[float] = None,
+                  percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                  bin_width: Optional[float] = None) -> Dict[str, Any]:
+        """Bir ölçüm için özet, histogram ve istenirse grup kırılımı / zaman serisi hesapla"""
+        if metric not in self.METRICS:
+            raise ValueError(f'Bilinmeyen ölçüm: {metric}')
+        if group_by is not None and group_by not in self.GROUP_BY:
+            raise ValueError(f'Geçersiz gruplama: {group_by}')
+        if bucket_seconds is not None and not bucket_seconds > 0:
+            raise ValueError('Kova süresi pozitif olmalı')
+        percentiles = [float(q) for q in percentiles]
+        if any(not 0 <= q <= 100 for q in percentiles):
+            raise ValueError('Yüzdelikler 0-100 aralığında olmalı')
+
+        columns = self._columns[metric]
+        values = columns['value']
+        result = {
+            'summary': _summary(values, percentiles),
+            'histogram': _histogram(values, bin_width or self.METRICS[metric][2]),
+        }
+
+        if group_by is not None:
+            keys, stats = _grouped_stats(values, [columns[group_by]], percentiles)
+            result['groups'] = [
+                dict({group_by: _key_value(key)}, **group)
+                for key, group in zip(keys[0].tolist(), _stat_rows(stats, percentiles))
+            ]
+
+        if bucket_seconds is not None:
+            result['series'] = self._series(columns, group_by, bucket_seconds, percentiles)
+        return result
+
+    def _series(self, columns: Dict[str, np.ndarray], group_by: Optional[str], bucket_seconds: float,
+                percentiles: List[float]) -> Dict[str, Any]:
+        """Zaman kovası (ve istenirse grup) başına istatistik serisi"""
+        timed = np.isfinite(columns['time'])
+        values = columns['value'][timed]
+        times = columns['time'][timed]
+        series = {'bucket_seconds': bucket_seconds, 'start': None, 'points': []}
+        if not len(values):
+            return series
+
+        start = np.floor(times.min() / bucket_seconds) * bucket_seconds
+        buckets = ((times - start) // bucket_seconds).astype(np.int64)
+        key_columns = [buckets] if group_by is None else [columns[group_by][timed], buckets]
+        keys, stats = _grouped_stats(values, key_columns, percentiles)
+        if len(keys[0]) > MAX_SERIES_POINTS:
+            raise ValueError(f'Zaman serisi çok büyük ({len(keys[0])} nokta), daha büyük kova süresi seçin')
+
+        series['start'] = format_seconds(start)
+        bucket_keys = keys[-1].tolist()
+        group_keys = keys[0].tolist() if group_by is not None else None
+        for index, point in enumerate(_stat_rows(stats, percentiles)):
+            bucket_start = start + bucket_keys[index] * bucket_seconds
+            entry = {'bucket': bucket_keys[index], 'time': format_seconds(bucket_start)}
+            if group_keys is not None:
+                entry[group_by] = _key_value(group_keys[index])
+            entry.update(point)
+            series['points'].append(entry)
+        return series
+
+
+def _int_or_missing(value: Any) -> int:
+    try:
+        return int(value) if value is not None else _NO_VALUE
+    except (ValueError, TypeError):
+        return _NO_VALUE
+
+
+def _key_value(key: int) -> Optional[int]:
+    return None if key == _NO_VALUE else key
+
+
+def _summary(values: np.ndarray, percentiles: List[float]) -> Dict[str, Any]:
+    if not len(values):
+        return {'count': 0, 'min': None, 'max': None, 'avg': None, 'std': None,
+                'percentiles': {_percentile_name(q): None for q in percentiles}}
+    points = np.percentile(values, percentiles) if percentiles else []
+    return {
+        'count': int(len(values)),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'avg': float(values.mean()),
+        'std': float(values.std()),
+        'percentiles': {_percentile_name(q): float(point) for q, point in zip(percentiles, points)}
+    }
+
+
+def _histogram(values: np.ndarray, bin_width: float) -> Dict[str, Any]:
+    """Sabit genişlikli kutularla histogram; kutu kenarları genişliğin katlarına hizalanır"""
+    if not bin_width > 0:
+        raise ValueError('Histogram kutu genişliği pozitif olmalı')
+    if not len(values):
+        return {'bin_width': bin_width, 'edges': [], 'counts': []}
+    low = np.floor(values.min() / bin_width)
+    high = np.floor(values.max() / bin_width) + 1
+    if high - low > MAX_HISTOGRAM_BINS:
+        bin_width *= np.ceil((high - low) / MAX_HISTOGRAM_BINS)
+        low = np.floor(values.min() / bin_width)
+        high = np.floor(values.max() / bin_width) + 1
+    bins = np.floor(values / bin_width) - low
+    counts = np.bincount(bins.astype(np.int64), minlength=int(high - low))
+    return {
+        'bin_width': float(bin_width),
+        'edges': (np.arange(low, high + 1) * bin_width).tolist(),
+        'counts': counts.tolist()
+    }
+
+
+def _grouped_stats(values: np.ndarray, key_columns: List[np.ndarray],
+                   percentiles: List[float]) -> Tuple[List[np.ndarray], Dict[str, np.ndarray]]:
+    """Anahtar sütunlarının her farklı birleşimi için count/min/max/avg/std/yüzdelikleri hesapla.
+
+    Değerler (anahtarlar, değer) sırasına dizilir; her grup ardışık bir aralık olur ve
+    istatistikler reduceat ile, yüzdelikler aralık içindeki sıralı konumlardan bulunur.
+    """
+    if not len(values):
+        empty = np.array([], dtype=np.int64)
+        return [empty for _ in key_columns], {'count': empty}
+
+    order = np.lexsort([values] + key_columns[::-1])
+    values = values[order]
+    keys = [column[order] for column in key_columns]
+
+    boundary = np.zeros(len(values), dtype=bool)
+    boundary[0] = True
+    for column in keys:
+        boundary[1:] |= column[1:] != column[:-1]
+    starts = np.flatnonzero(boundary)
+    counts = np.diff(np.append(starts, len(values)))
+
+    sums = np.add.reduceat(values, starts)
+    means = sums / counts
+    squares = np.add.reduceat((values - np.repeat(means, counts)) ** 2, starts)
+    stats = {
+        'count': counts,
+        'min': values[starts],  # grup içinde değerler artan sırada
+        'max': values[starts + counts - 1],
+        'avg': means,
+        'std': np.sqrt(squares / counts),
+    }
+    for q in percentiles:
+        # np.percentile'ın varsayılan (doğrusal) yöntemi
+        position = (counts - 1) * (q / 100.0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, counts - 1)
+        weight = position - lower
+        stats[_percentile_name(q)] = (values[starts + lower] * (1 - weight) + values[starts + upper] * weight)
+    return [column[starts] for column in keys], stats
+
+
+def _stat_rows(stats: Dict[str, np.ndarray], percentiles: List[float]) -> List[Dict[str, Any]]:
+    """_grouped_stats sonucunu grup başına sözlüğe çevir"""
+    columns = {name: values.tolist() for name, values in stats.items()}
+    names = [_percentile_name(q) for q in percentiles]
+    return [
+        {
+            'count': columns['count'][index],
+            'min': columns['min'][index],
+            'max': columns['max'][index],
+            'avg': columns['avg'][index],
+            'std': columns['std'][index],
+            'percentiles': {name: columns[name][index] for name in names}
+        }
+        for index in range(len(columns['count']))
+    ]
+
+
+def _percentile_name(q: float) -> str:
+    return f'p{q:g}'
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+from typing import Dict, Any, List, Optional, Callable, Iterable, Iterator
+from message_record import message_direction
+
+# Dışa aktarılabilen sütunlar: sütun adı -> mesajdan değeri okuyan fonksiyon. Liste değerler
+# (birden fazla RSRP ölçümü, paging kaydı...) CSV'de ';' ile birleştirilir, NDJSON'da dizi kalır.
+EXPORT_COLUMNS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'id': lambda message: message.get('id'),
+    'timestamp': lambda message: message.get('timestamp'),
+    'timestamp_ms': lambda message: message.get('timestamp_ms'),
+    'line_number': lambda message: message.get('line_number'),
+    'block_number': lambda message: message.get('block_number'),
+    'protocol': lambda message: message.get('protocol'),
+    'protocol_type': lambda message: message.get('protocol_type'),
+    'channel': lambda message: message.get('channel'),
+    'message_type': lambda message: message.get('message_type'),
+    'message_identity': lambda message: message.get('message_identity'),
+    'direction': message_direction,
+    'source': lambda message: message.get('source'),
+    'destination': lambda message: message.get('destination'),
+    'source_file': lambda message: message.get('source_file'),
+    'pci': lambda message: message.get('pci'),
+    'earfcn': lambda message: message.get('earfcn'),
+    'rrc_transaction_id': lambda message: message.get('rrc_transaction_id'),
+    'is_paging': lambda message: message.get('is_paging'),
+    'is_measurement': lambda message: message.get('is_measurement'),
+    'is_connection_related': lambda message: message.get('is_connection_related'),
+    'error_keywords': lambda message: list(message.get('error_keywords') or ()),
+    # Ölçümler ve paging kayıtları düz değer listelerine açılır
+    'rsrp': lambda message: _samples(message, 'rsrp_values', 'dbm'),
+    'rsrq': lambda message: _samples(message, 'rsrq_values', 'db'),
+    'meas_id': lambda message: (message.get('measurements') or {}).get('meas_id'),
+    'neighbor_cells': lambda message: list((message.get('measurements') or {}).get('neighbor_cells') or ()),
+    'paging_records': lambda message: len(_paging_records(message)),
+    'paging_mmec': lambda message: [record.get('mmec') for record in _paging_records(message)],
+    'paging_m_tmsi': lambda message: [record.get('m_tmsi') for record in _paging_records(message)],
+    'raw_content': lambda message: message.get('raw_content'),
+}
+
+DEFAULT_COLUMNS = ('id', 'timestamp', 'protocol', 'channel', 'message_type', 'message_identity', 'direction',
+                   'pci', 'earfcn', 'rrc_transaction_id', 'rsrp', 'rsrq')
+
+# Tembel parse edilmiş veri setlerinde yalnızca ayrıntı dosyasından okunabilen sütunlar
+DETAIL_COLUMNS = frozenset(('raw_content',))
+
+# Biçim adı -> yanıt içerik türü
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Yanıt parçaları bu kadar satırda bir gönderilir (satır başına ayrı parça ağ yükünü artırır)
+ROWS_PER_CHUNK = 500
+
+
+def export_columns(names: Optional[str]) -> List[str]:
+    """Virgülle ayrılmış sütun adlarını doğrula; boşsa varsayılan sütunlar"""
+    if not names:
+        return list(DEFAULT_COLUMNS)
+    columns = [name.strip() for name in names.split(',') if name.strip()]
+    unknown = [name for name in columns if name not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen sütun: {', '.join(unknown)}")
+    if not columns:
+        raise ValueError("En az bir sütun seçilmelidir")
+    return columns
+
+
+def iter_export(messages: Iterable[Dict[str, Any]], columns: List[str], export_format: str) -> Iterator[str]:
+    """Mesajları seçilen biçimde parça parça üret; bellekte en fazla ROWS_PER_CHUNK satır tutulur"""
+    if export_format == 'csv':
+        return _iter_csv(messages, columns)
+    if export_format == 'ndjson':
+        return _iter_ndjson(messages, columns)
+    raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {export_format}")
+
+
+def _iter_csv(messages: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    getters = [EXPORT_COLUMNS[name] for name in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns)
+
+    rows = 0
+    for message in messages:
+        writer.writerow([_csv_value(getter(message)) for getter in getters])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _iter_ndjson(messages: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+    getters = [(name, EXPORT_COLUMNS[name]) for name in columns]
+    lines = []
+    for message in messages:
+        lines.append(json.dumps({name: getter(message) for name, getter in getters}, ensure_ascii=False))
+        if len(lines) == ROWS_PER_CHUNK:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ';'.join('' if item is None else str(item) for item in value)
+    return value
+
+
+def _samples(message: Dict[str, Any], list_key: str, value_key: str) -> List[float]:
+    samples = (message.get('measurements') or {}).get(list_key) or ()
+    return [sample.get(value_key) for sample in samples]
+
+
+def _paging_records(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return (message.get('paging_info') or {}).get('paging_records') or []
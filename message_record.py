@@ -0,0 +1,363 @@
+import sys
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Iterator, Callable
+from timestamps import timestamp_ms, any_timestamp_ms
+
+
+class _FrozenDict(tuple):
+    """Sözlüğün (anahtar, değer, anahtar, değer, ...) şeklinde düz demet olarak saklanmış hali"""
+    __slots__ = ()
+
+
+class _FrozenList(tuple):
+    """Listenin demet olarak saklanmış hali"""
+    __slots__ = ()
+
+
+EMPTY = _FrozenDict()
+
+
+def freeze(value: Any) -> Any:
+    """İç içe sözlük/listeleri paylaşılabilir, değiştirilemez demetlere çevir; metinleri intern et"""
+    value_type = type(value)
+    if value_type is dict:
+        if not value:
+            return EMPTY
+        items = []
+        for key, item in value.items():
+            items.append(sys.intern(key))
+            items.append(freeze(item))
+        return _FrozenDict(items)
+    if value_type is list:
+        return _FrozenList(freeze(item) for item in value)
+    if value_type is str:
+        return sys.intern(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """freeze ile saklanan değeri yeni sözlük/listelere geri çevir"""
+    value_type = type(value)
+    if value_type is _FrozenDict:
+        return {value[index]: thaw(value[index + 1]) for index in range(0, len(value), 2)}
+    if value_type is _FrozenList:
+        return [thaw(item) for item in value]
+    return value
+
+
+def view(value: Any) -> Any:
+    """freeze ile saklanan değerin salt okunur görünümü: sözlükler MappingProxyType, listeler demet.
+
+    Kayıt iç içe alanları her erişimde yeniden ürettiğinden bu değerlere yazmak kaybolurdu;
+    görünüme yazma denemesi TypeError verir.
+    """
+    value_type = type(value)
+    if value_type is _FrozenDict:
+        return MappingProxyType(_items(value, view))
+    if value_type is _FrozenList:
+        return tuple(view(item) for item in value)
+    return value
+
+
+def _items(frozen: _FrozenDict, convert: Callable[[Any], Any]) -> Dict[str, Any]:
+    return {frozen[index]: convert(frozen[index + 1]) for index in range(0, len(frozen), 2)}
+
+
+def _find(frozen: _FrozenDict, key: str) -> int:
+    # Anahtarın değerinin demetteki konumu; yoksa -1
+    for index in range(0, len(frozen), 2):
+        if frozen[index] == key:
+            return index + 1
+    return -1
+
+
+def message_direction(message: Mapping) -> Any:
+    """parameters['direction']; kayıtlarda parametre görünümü oluşturulmadan okunur"""
+    if type(message) is MessageRecord:
+        return message.parameter('direction')
+    return (message.get('parameters') or {}).get('direction')
+
+
+def json_default(o: Any) -> Any:
+    """json.dumps(..., default=json_default) için: kayıtları ve salt okunur görünümleri JSON'a çevir"""
+    if isinstance(o, MessageRecord):
+        return o.to_dict()
+    if isinstance(o, MappingProxyType):
+        return dict(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class DescriptorTable:
+    """Mesaj türüne özgü sabit açıklamaları (purpose, content_structure, ...) bir kez tutan tablo.
+
+    Mesajlar açıklamanın kendisi yerine tablodaki ID'sini taşır.
+    """
+
+    def __init__(self):
+        self._descriptors = []
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    def register(self, content: Dict[str, Any]) -> int:
+        """Açıklamayı tabloya ekle (aynısı varsa mevcut ID'yi döndür); boşsa -1"""
+        if not content:
+            return -1
+        return self.register_frozen(freeze(content))
+
+    def register_frozen(self, frozen: _FrozenDict) -> int:
+        with self._lock:
+            descriptor_id = self._ids.get(frozen)
+            if descriptor_id is None:
+                descriptor_id = self._ids[frozen] = len(self._descriptors)
+                self._descriptors.append(frozen)
+            return descriptor_id
+
+    def get(self, descriptor_id: int) -> _FrozenDict:
+        return self._descriptors[descriptor_id] if descriptor_id >= 0 else EMPTY
+
+
+DESCRIPTORS = DescriptorTable()
+
+
+class _Missing:
+    """İsteğe bağlı alanların (source/destination, source_file, source_offset/source_length) bulunmadığını belirten işaret"""
+    __slots__ = ()
+
+    def __reduce__(self):
+        return '_MISSING'
+
+    def __repr__(self) -> str:
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+# Mesaj sözlüğündeki anahtar sırası (source/destination yalnızca yeni formatta, source_file yalnızca
+# birden fazla logun birleştirildiği veri setlerinde, source_offset/source_length yalnızca tembel
+# parse edilen ve ayrıntıları dosyada duran mesajlarda bulunur)
+FIELDS = ('id', 'timestamp', 'timestamp_num', 'timestamp_time', 'timestamp_ms', 'line_number',
+          'block_number', 'message_type', 'protocol_type', 'channel', 'message_identity', 'protocol',
+          'source', 'destination', 'source_file', 'pci', 'earfcn', 'rrc_transaction_id', 'is_paging', 'is_measurement',
+          'is_connection_related', 'error_keywords', 'parameters', 'measurements', 'paging_info', 'raw_content',
+          'source_offset', 'source_length')
+_FIELD_SET = frozenset(FIELDS)
+_OPTIONAL_FIELDS = frozenset(('source', 'destination', 'source_file', 'source_offset', 'source_length'))
+
+
+class MessageRecord(Mapping):
+    """Parse edilmiş tek bir mesajın kompakt (__slots__) gösterimi.
+
+    Sözlük gibi okunur (msg['pci'], msg.get('parameters', {})...). İç içe alanlar (parameters,
+    measurements, paging_info) değiştirilemez demetler olarak saklanır ve salt okunur görünüm
+    (MappingProxyType, listeler demet) olarak döner; bunlara yazmak TypeError verir, alanın
+    tamamı msg['parameters'] = {...} ile değiştirilir. Mesaj türü açıklamaları DESCRIPTORS
+    tablosunda tek kopya tutulur. Düz sözlük için to_dict(), json.dumps için
+    default=json_default kullanılır.
+    """
+
+    __slots__ = ('id', 'timestamp', 'timestamp_num', 'timestamp_time', 'timestamp_ms', 'line_number',
+                 'block_number', 'message_type', 'protocol_type', 'channel', 'message_identity', 'protocol',
+                 'source', 'destination', 'source_file', 'pci', 'earfcn', 'rrc_transaction_id', 'is_paging', 'is_measurement',
+                 'is_connection_related', 'error_keywords', 'parameters_head', 'descriptor_id', 'parameters_tail',
+                 'measurements_data', 'paging_info_data', 'raw_content', 'source_offset', 'source_length',
+                 'extra')
+
+    def __init__(self, id: int, timestamp_num: str, timestamp_time: str, line_number: int,
+                 block_number: int, message_type: str, protocol_type: str, channel: str,
+                 message_identity: str, protocol: str, pci: Optional[int] = None,
+                 earfcn: Optional[int] = None, rrc_transaction_id: Optional[int] = None,
+                 is_paging: bool = False, is_measurement: bool = False,
+                 is_connection_related: bool = False, parameters_head: _FrozenDict = EMPTY,
+                 descriptor_id: int = -1, parameters_tail: _FrozenDict = EMPTY,
+                 measurements_data: _FrozenDict = EMPTY, paging_info_data: _FrozenDict = EMPTY,
+                 raw_content: str = '', source: Any = _MISSING, destination: Any = _MISSING,
+                 error_keywords: Optional[tuple] = None):
+        self.id = id
+        self.timestamp = f"{timestamp_num} {timestamp_time}"
+        self.timestamp_num = sys.intern(timestamp_num)
+        self.timestamp_time = timestamp_time
+        # Zaman hesapları (süre, zaman aralığı filtresi) metin yerine bu sayıyı kullanır
+        self.timestamp_ms = timestamp_ms(timestamp_num, timestamp_time)
+        self.line_number = line_number
+        self.block_number = block_number
+        self.message_type = sys.intern(message_type)
+        self.protocol_type = sys.intern(protocol_type)
+        self.channel = sys.intern(channel)
+        self.message_identity = sys.intern(message_identity)
+        self.protocol = sys.intern(protocol)
+        self.source = source
+        self.destination = destination
+        self.source_file = _MISSING
+        self.pci = pci
+        self.earfcn = earfcn
+        self.rrc_transaction_id = rrc_transaction_id
+        self.is_paging = is_paging
+        self.is_measurement = is_measurement
+        self.is_connection_related = is_connection_related
+        # raw_content'te geçen hata anahtar kelimeleri; analiz metni yeniden taramaz
+        self.error_keywords = error_keywords
+        self.parameters_head = parameters_head
+        self.descriptor_id = descriptor_id
+        self.parameters_tail = parameters_tail
+        self.measurements_data = measurements_data
+        self.paging_info_data = paging_info_data
+        self.raw_content = raw_content
+        self.source_offset = _MISSING
+        self.source_length = _MISSING
+        self.extra = None
+
+    @classmethod
+    def from_dict(cls, message: Mapping) -> 'MessageRecord':
+        """Mesaj sözlüğünden kayıt oluştur (bilinmeyen anahtarlar da korunur)"""
+        if isinstance(message, MessageRecord):
+            return message
+        record = cls.__new__(cls)
+        for slot in cls.__slots__:
+            setattr(record, slot, None)
+        record.source = record.destination = record.source_file = _MISSING
+        record.source_offset = record.source_length = _MISSING
+        record.parameters_head = record.parameters_tail = EMPTY
+        record.measurements_data = record.paging_info_data = EMPTY
+        record.descriptor_id = -1
+        record.raw_content = ''
+        for key, value in message.items():
+            record[key] = value
+        if record.timestamp_ms is None:
+            # timestamp_ms alanı eklenmeden önce üretilmiş sözlükler
+            record.timestamp_ms = timestamp_ms(record.timestamp_num, record.timestamp_time)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON sınırında kullanılmak üzere tam mesaj sözlüğünü (iç içe alanlar düz sözlük/liste) üret"""
+        return {key: self._plain(key) for key in self}
+
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """to_dict gibi, ancak açıklama alanları parametrelere açılmaz.
+
+        Açıklaması olan kayıtlarda 'descriptor_id' eklenir; tam parametreler
+        DESCRIPTORS.get(descriptor_id) ile bu parametrelerin birleşimidir.
+        """
+        result = {}
+        for key in self:
+            result[key] = self._compact_parameters() if key == 'parameters' else self._plain(key)
+        if self.descriptor_id >= 0:
+            result['descriptor_id'] = self.descriptor_id
+        return result
+
+    def _compact_parameters(self) -> Dict[str, Any]:
+        parameters = thaw(self.parameters_head)
+        if self.descriptor_id >= 0:
+            # Açıklamadaki alanlar baştaki parametreleri ezer; bu alanlar gönderilmez
+            for key in DESCRIPTORS.get(self.descriptor_id)[0::2]:
+                parameters.pop(key, None)
+        parameters.update(thaw(self.parameters_tail))
+        return parameters
+
+    def _parameters(self, convert: Callable[[Any], Any] = thaw) -> Dict[str, Any]:
+        parameters = _items(self.parameters_head, convert)
+        if self.descriptor_id >= 0:
+            parameters.update(_items(DESCRIPTORS.get(self.descriptor_id), convert))
+        parameters.update(_items(self.parameters_tail, convert))
+        return parameters
+
+    def parameter(self, key: str, default: Any = None) -> Any:
+        """Tek parametrenin salt okunur değeri; msg['parameters'] gibi tüm parametreleri birleştirmez"""
+        # Sonraki katman öncekini ezer: parameters_tail > açıklama > parameters_head
+        for frozen in (self.parameters_tail, DESCRIPTORS.get(self.descriptor_id), self.parameters_head):
+            index = _find(frozen, key)
+            if index >= 0:
+                return view(frozen[index])
+        return default
+
+    def _plain(self, key: str) -> Any:
+        # İç içe alanların düz (değiştirilebilir) kopyası
+        if key == 'parameters':
+            return self._parameters()
+        if key == 'measurements':
+            return thaw(self.measurements_data)
+        if key == 'paging_info':
+            return thaw(self.paging_info_data)
+        return self[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            if key == 'parameters':
+                return MappingProxyType(self._parameters(view))
+            if key == 'measurements':
+                return view(self.measurements_data)
+            if key == 'paging_info':
+                return view(self.paging_info_data)
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Any):
+        if key == 'parameters':
+            self.parameters_head = freeze(value)
+            self.descriptor_id = -1
+            self.parameters_tail = EMPTY
+        elif key == 'measurements':
+            self.measurements_data = freeze(value)
+        elif key == 'paging_info':
+            self.paging_info_data = freeze(value)
+        elif key == 'timestamp':
+            # Zamandan türetilen alanlar birlikte güncellenir; eski değerlerle kalmazlar
+            self.timestamp = value
+            date, _, time = value.partition(' ') if isinstance(value, str) else (None, '', None)
+            self.timestamp_num = sys.intern(date) if date else date
+            self.timestamp_time = time or None
+            self.timestamp_ms = any_timestamp_ms(value)
+        elif key in _FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: Any) -> bool:
+        if key in _OPTIONAL_FIELDS:
+            return getattr(self, key) is not _MISSING
+        return key in _FIELD_SET or (self.extra is not None and key in self.extra)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if key in _OPTIONAL_FIELDS and getattr(self, key) is _MISSING:
+                continue
+            yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        # Kayıt her zaman alan içerir; doğruluk kontrolü anahtarları saymaz
+        return True
+
+    def __repr__(self) -> str:
+        return f'MessageRecord(id={self.id!r}, timestamp={self.timestamp!r}, message_identity={self.message_identity!r})'
+
+    def __reduce__(self):
+        # Açıklama ID'si süreçler arasında geçerli olmadığından açıklamanın kendisi saklanır
+        state = tuple(getattr(self, slot) for slot in self.__slots__)
+        return _restore_record, (state, DESCRIPTORS.get(self.descriptor_id))
+
+
+def _restore_record(state: tuple, descriptor: _FrozenDict) -> MessageRecord:
+    record = MessageRecord.__new__(MessageRecord)
+    for slot, value in zip(MessageRecord.__slots__, state):
+        setattr(record, slot, value)
+    record.descriptor_id = DESCRIPTORS.register_frozen(descriptor) if descriptor else -1
+    return record
@@ -0,0 +1,341 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple, Sequence
+from message_record import message_direction
+from timestamps import parse_time_bound
+
+# Mesaj yönü filtresi: filtre adı -> (protokolde aranan parça, parametrelerdeki yön)
+DIRECTION_RULES = {
+    'ue_to_enb': ('rrc', 'uplink'),     # UE'den eNB'ye: RRC UL mesajları
+    'enb_to_ue': ('rrc', 'downlink'),   # eNB'den UE'ye: RRC DL mesajları
+    'enb_to_mme': ('s1ap', 'uplink'),   # eNB'den MME'ye: S1-AP UL mesajları
+    'mme_to_enb': ('s1ap', 'downlink'), # MME'den eNB'ye: S1-AP DL mesajları
+    'ue_to_mme': ('nas', 'uplink'),     # UE'den MME'ye: NAS UL mesajları
+    'mme_to_ue': ('nas', 'downlink'),   # MME'den UE'ye: NAS DL mesajları
+}
+
+
+class _CategoricalColumn:
+    """Sözlük kodlamalı sütun: her farklı değere bir kod verilir, satırlar kod tutar.
+
+    256'dan az farklı değer varsa kodlar satır başına bir byte olarak tutulur ve maske
+    bytes.translate ile tek geçişte üretilir; aksi halde her kod için satır listesi tutulur.
+    """
+
+    def __init__(self, values: Iterable[Any]):
+        self.codes_by_value = {}
+        codes = []
+        for value in values:
+            code = self.codes_by_value.get(value)
+            if code is None:
+                code = self.codes_by_value[value] = len(self.codes_by_value)
+            codes.append(code)
+
+        if len(self.codes_by_value) <= 256:
+            self.codes = bytes(codes)
+            self.postings = None
+        else:
+            self.codes = None
+            self.postings = [array('I') for _ in self.codes_by_value]
+            for row, code in enumerate(codes):
+                self.postings[code].append(row)
+
+    @classmethod
+    def from_codes(cls, values: List[Any], codes: Sequence[int]) -> '_CategoricalColumn':
+        """Önceden sözlük kodlanmış sütundan oluştur (satırın değeri values[code])"""
+        column = cls.__new__(cls)
+        column.codes_by_value = {value: code for code, value in enumerate(values)}
+        if len(values) <= 256:
+            # Tek byte'lık kod tamponu doğrudan kopyalanır
+            column.codes = bytes(codes) if getattr(codes, 'itemsize', 1) == 1 else bytes(list(codes))
+            column.postings = None
+        else:
+            column.codes = None
+            column.postings = [array('I') for _ in values]
+            for row, code in enumerate(codes):
+                column.postings[code].append(row)
+        return column
+
+
+class MessageStore:
+    """Parse edilmiş mesajları sütun bazlı tutan ve filtreleri indeksler üzerinden uygulayan depo.
+
+    Filtrelenen her alan ilk kullanıldığında tek geçişte sütuna dönüştürülür ve saklanır:
+    kategorik alanlar (protokol, kanal, PCI, EARFCN, yön, boolean'lar...) sözlük kodlamasıyla,
+    RSRP değerleri ve zaman damgaları sıralı dizilerle tutulur. Filtre sonuçları satır başına
+    bir byte'lık maskelerdir (Python int) ve AND ile kesiştirilir. Sonuç, TemsParser'ın eski
+    liste tabanlı filtresiyle aynı mesaj nesnelerini aynı sırada döndürür.
+
+    Mesaj listesi sonradan büyüyebilir (canlı takip); depo yalnızca oluşturulduğu andaki
+    satırları görür. Mesaj dizisi column_loaders() sağlıyorsa (ör. sütun bazlı dosyadan
+    açılan veri seti) sütunlar ve indeksler mesajlar oluşturulmadan doğrudan oradan alınır.
+    """
+
+    def __init__(self, messages: Sequence[Dict[str, Any]]):
+        self.messages = messages
+        self._size = len(messages)
+        # Sütun adı / 'timestamp_ms' / 'rsrp_index' -> hazır veriyi döndüren fonksiyon
+        self._loaders = messages.column_loaders() if hasattr(messages, 'column_loaders') else {}
+        self._columns = {}
+        self._rsrp_index = None
+        self._time_index = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _rows(self) -> Iterable[Dict[str, Any]]:
+        return islice(self.messages, self._size)
+
+    def filter(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Filtreleri uygula ve eşleşen mesajları orijinal sırayla döndür"""
+        selected = self._filter_selection(filters)
+        if isinstance(self.messages, list):
+            return list(compress(self.messages, selected))
+        # Tembel dizilerde yalnızca eşleşen mesajlar oluşturulur
+        return [self.messages[row] for row in compress(range(self._size), selected)]
+
+    def iter_filter(self, filters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """filter() ile aynı mesajları sırayla üret; sonuç listesi oluşturulmaz (dışa aktarma için).
+
+        Maske çağrı anında hesaplanır; mesajlar yalnızca tüketildikçe okunur.
+        """
+        selected = self._filter_selection(filters)
+        return (self.messages[row] for row in compress(range(self._size), selected))
+
+    def filter_mask(self, filters: Dict[str, Any]) -> bytes:
+        """Filtrelerin satır başına bir byte'lık seçim maskesi (ör. tam metin aramasıyla kesiştirmek için)"""
+        return self._filter_selection(filters)
+
+    def _filter_selection(self, filters: Dict[str, Any]) -> bytes:
+        """Filtrelerin satır başına bir byte'lık seçim maskesi (1: eşleşir)"""
+        mask = self._full_mask()
+
+        # Protokol filtresi
+        if filters.get('protocol'):
+            mask &= self._equals_mask('protocol', filters['protocol'])
+
+        # Mesaj türü filtresi (lte_message_type alanını kontrol et)
+        if filters.get('message_type'):
+            mask &= self._equals_mask('lte_message_type', filters['message_type'])
+
+        # Mesaj yönü filtresi
+        if filters.get('message_direction'):
+            direction_filter = filters['message_direction']
+            column = self._column('message_direction', self._direction_key)
+            mask &= self._codes_mask(column, [code for directions, code in column.codes_by_value.items()
+                                              if direction_filter in directions])
+
+        # Kanal filtresi
+        if filters.get('channel'):
+            mask &= self._equals_mask('channel', filters['channel'])
+
+        # Kaynak log filtresi (birden fazla UE logunun birleştirildiği veri setleri)
+        if filters.get('source_file'):
+            mask &= self._equals_mask('source_file', filters['source_file'])
+
+        # Mesaj kimliği filtresi (kısmi eşleşme, farklı değerler üzerinde)
+        if filters.get('message_identity'):
+            needle = filters['message_identity'].lower()
+            column = self._column('message_identity', lambda msg: msg.get('message_identity', ''))
+            mask &= self._codes_mask(column, [code for identity, code in column.codes_by_value.items()
+                                              if needle in identity.lower()])
+
+        # Sayısal eşitlik filtreleri
+        for field in ('pci', 'earfcn', 'rrc_transaction_id'):
+            if filters.get(field):
+                try:
+                    mask &= self._equals_mask(field, int(filters[field]))
+                except (ValueError, TypeError):
+                    pass
+
+        # Boolean filtreler
+        for field in ('is_paging', 'is_measurement', 'is_connection_related'):
+            if filters.get(field) is not None:
+                mask &= self._equals_mask(field, filters[field])
+
+        # RSRP filtresi
+        if filters.get('min_rsrp') or filters.get('max_rsrp'):
+            mask &= self._rsrp_mask(filters.get('min_rsrp'), filters.get('max_rsrp'))
+
+        # Zaman aralığı filtresi (sınırlardan biri de verilebilir)
+        if filters.get('start_time') or filters.get('end_time'):
+            mask = self._apply_time_range(mask, filters.get('start_time'), filters.get('end_time'))
+
+        return mask.to_bytes(self._size, 'little')
+
+    def page(self, cursor: int = 0, limit: int = 500, start: Optional[str] = None,
+             end: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[int], int]:
+        """Mesajları log sırasıyla sayfa sayfa döndür.
+
+        cursor, sayfanın başlayacağı satırdır (önceki sayfanın next_cursor değeri). start/end
+        ('DDMMYY HH:MM:SS.mmm') verilirse yalnızca bu zaman aralığındaki mesajlar döner.
+        (mesajlar, next_cursor, penceredeki toplam mesaj) döndürür; son sayfada next_cursor None'dır.
+        """
+        if start is None and end is None:
+            rows = range(self._size)
+        else:
+            rows = self._window_rows(start, end)
+
+        first = bisect_left(rows, cursor)
+        page_rows = rows[first:first + limit]
+        messages = [self.messages[row] for row in page_rows]
+        next_cursor = rows[first + limit] if first + limit < len(rows) else None
+        return messages, next_cursor, len(rows)
+
+    def _window_rows(self, start: Optional[str], end: Optional[str]):
+        """Zaman penceresindeki satırları artan sırada döndür (zamanı okunamayan mesajlar hariç)"""
+        first, last = self._time_range_positions(parse_time_bound(start), parse_time_bound(end, upper=True))
+        times, rows, contiguous = self._time_index
+        if first >= last:
+            return range(0)
+        if contiguous:
+            return range(rows[first], rows[first] + last - first)
+        return sorted(rows[first:last])
+
+    def _full_mask(self) -> int:
+        return int.from_bytes(b'\x01' * self._size, 'little')
+
+    def _rows_mask(self, rows: Iterable[int]) -> int:
+        mask = bytearray(self._size)
+        for row in rows:
+            mask[row] = 1
+        return int.from_bytes(mask, 'little')
+
+    def _column(self, name: str, key: Optional[Callable[[Dict[str, Any]], Any]] = None) -> _CategoricalColumn:
+        """Sütunu döndür; ilk kullanımda mesajlardan oluştur"""
+        column = self._columns.get(name)
+        if column is None and name in self._loaders:
+            column = self._columns[name] = self._loaders[name]()
+        if column is None:
+            if key is None:
+                values = (message.get(name) for message in self._rows())
+            else:
+                values = (key(message) for message in self._rows())
+            column = self._columns[name] = _CategoricalColumn(values)
+        return column
+
+    def _codes_mask(self, column: _CategoricalColumn, codes: List[int]) -> int:
+        """Verilen kodlardan birini taşıyan satırların maskesi"""
+        if not codes:
+            return 0
+        if column.postings is not None:
+            return self._rows_mask(row for code in codes for row in column.postings[code])
+        table = bytearray(256)
+        for code in codes:
+            table[code] = 1
+        return int.from_bytes(column.codes.translate(table), 'little')
+
+    def _equals_mask(self, name: str, value: Any) -> int:
+        column = self._column(name)
+        try:
+            code = column.codes_by_value.get(value)
+        except TypeError:
+            # Hashlenemeyen filtre değeri hiçbir mesaj değerine eşit olamaz
+            return 0
+        return self._codes_mask(column, [] if code is None else [code])
+
+    @staticmethod
+    def _direction_key(message: Dict[str, Any]) -> tuple:
+        """Mesajın eşleştiği yön filtrelerinin adları"""
+        protocol = (message.get('protocol') or '').lower()
+        direction = (message_direction(message) or '').lower()
+        return tuple(name for name, (protocol_part, wanted_direction) in DIRECTION_RULES.items()
+                     if protocol_part in protocol and direction == wanted_direction)
+
+    def _timestamps_ms(self) -> Iterable[Optional[int]]:
+        if 'timestamp_ms' in self._loaders:
+            return self._loaders['timestamp_ms']()
+        return (message.get('timestamp_ms') for message in self._rows())
+
+    def _build_rsrp_index(self):
+        """Tüm RSRP ölçümlerini (dBm, satır) olarak değere göre sıralı tut"""
+        if 'rsrp_index' in self._loaders:
+            self._rsrp_index = self._loaders['rsrp_index']()
+            return
+        entries = []
+        nan_rows = []
+        for row, message in enumerate(self._rows()):
+            measurements = message.get('measurements', {})
+            if 'rsrp_values' not in measurements:
+                continue
+            for rsrp in measurements['rsrp_values']:
+                try:
+                    dbm_value = float(rsrp['dbm'])
+                except (ValueError, TypeError, KeyError):
+                    continue
+                if dbm_value != dbm_value:
+                    # NaN hiçbir sınırla karşılaştırılamaz, her aralıkta kabul edilir
+                    nan_rows.append(row)
+                else:
+                    entries.append((dbm_value, row))
+        entries.sort()
+        self._rsrp_index = (array('d', (value for value, _ in entries)),
+                            array('I', (row for _, row in entries)),
+                            nan_rows)
+
+    def _rsrp_mask(self, min_rsrp: Any, max_rsrp: Any) -> int:
+        """En az bir RSRP ölçümü [min_rsrp, max_rsrp] aralığında olan satırlar"""
+        try:
+            low = float(min_rsrp) if min_rsrp else None
+            high = float(max_rsrp) if max_rsrp else None
+        except (ValueError, TypeError):
+            # Geçersiz sınır hiçbir ölçümle eşleşmez
+            return 0
+
+        if self._rsrp_index is None:
+            self._build_rsrp_index()
+        values, rows, nan_rows = self._rsrp_index
+        start = bisect_left(values, low) if low is not None else 0
+        end = bisect_right(values, high) if high is not None else len(values)
+        matched = rows[start:end] if start < end else ()
+        return self._rows_mask(matched) | self._rows_mask(nan_rows)
+
+    def _build_time_index(self):
+        """Epoch milisaniyelerini (timestamp_ms) satırlarıyla birlikte zamana göre sıralı tut"""
+        times = array('q')
+        rows = array('I')
+        for row, value in enumerate(self._timestamps_ms()):
+            if value is not None:
+                times.append(value)
+                rows.append(row)
+        # Loglar çoğunlukla zaman sırasındadır; değilse kararlı sıralama yapılır
+        if any(times[position] > times[position + 1] for position in range(len(times) - 1)):
+            order = sorted(range(len(times)), key=times.__getitem__)
+            times = array('q', (times[position] for position in order))
+            rows = array('I', (rows[position] for position in order))
+        # Satırlar ardışıksa zaman aralığı doğrudan bir satır aralığına karşılık gelir
+        contiguous = not rows or rows[-1] - rows[0] == len(rows) - 1 and all(
+            rows[position] + 1 == rows[position + 1] for position in range(len(rows) - 1))
+        self._time_index = (times, rows, contiguous)
+
+    def _time_range_positions(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        """[start, end] (epoch ms, uçlar dahil) aralığının zaman indeksindeki konumları"""
+        if self._time_index is None:
+            self._build_time_index()
+        times = self._time_index[0]
+        first = bisect_left(times, start) if start is not None else 0
+        last = bisect_right(times, end) if end is not None else len(times)
+        return first, last
+
+    def _apply_time_range(self, mask: int, start_time: Any, end_time: Any) -> int:
+        """Zaman aralığını uygula; zamanı okunamayan mesajlar aralığa girmez.
+
+        Sınırlar epoch milisaniyesi, 'DDMMYY HH:MM:SS[.mmm]' veya 'YYYY-MM-DD HH:MM:SS[.fff]'
+        olabilir; geçersiz sınırda filtre atlanır.
+        """
+        try:
+            start = parse_time_bound(start_time)
+            end = parse_time_bound(end_time, upper=True)
+        except (ValueError, TypeError):
+            return mask
+
+        first, last = self._time_range_positions(start, end)
+        times, rows, contiguous = self._time_index
+        if first >= last:
+            return 0
+        if contiguous:
+            range_mask = bytearray(self._size)
+            range_mask[rows[first]:rows[first] + last - first] = b'\x01' * (last - first)
+            return mask & int.from_bytes(range_mask, 'little')
+        return mask & self._rows_mask(rows[first:last])
@@ -0,0 +1,208 @@
+import os
+import sys
+import time
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterable, Iterator, Tuple
+
+# Süre histogramlarının varsayılan üst sınırları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class StageTimer:
+    """Parse aşamalarında geçen toplam süreyi (saniye) aşama adına göre biriktirir.
+
+    Aşamalar iç içe sayılmaz; her süre yalnızca ölçüldüğü aşamaya eklenir. Paralel parse'ta
+    süreçlerin süreleri toplandığından aşamaların toplamı geçen gerçek süreyi aşabilir.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def merge(self, seconds: Dict[str, float]):
+        """Başka bir ölçümün (ör. paralel parse işçisinin) sürelerini ekle"""
+        for stage, value in seconds.items():
+            self.add(stage, value)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed(self, stage: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """iterable'ı aynen üret; her elemanın üretilmesi için geçen süreyi aşamaya ekle"""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(stage, time.perf_counter() - start)
+                return
+            self.add(stage, time.perf_counter() - start)
+            yield item
+
+    def result(self) -> Dict[str, float]:
+        return {stage: round(seconds, 6) for stage, seconds in self.seconds.items()}
+
+
+class MetricsRegistry:
+    """Sayaç, gösterge (gauge) ve histogramları etiketleriyle tutar.
+
+    render() tüm metrikleri Prometheus metin formatında (0.0.4) döndürür. Metrikler
+    describe ile tanımlanır; tanımlanmamış bir metriğe değer yazmak hata verir.
+    """
+
+    def __init__(self):
+        self._metrics = OrderedDict()  # ad -> (tür, açıklama, histogram sınırları)
+        self._values = {}  # (ad, etiketler) -> değer
+        self._histograms = {}  # (ad, etiketler) -> [sınır başına sayılar, toplam, adet]
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, kind: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """Metriği tanımla; kind 'counter', 'gauge' ya da 'histogram'"""
+        if kind not in ('counter', 'gauge', 'histogram'):
+            raise ValueError(f"Bilinmeyen metrik türü: {kind}")
+        with self._lock:
+            self._metrics[name] = (kind, help_text, tuple(sorted(buckets)))
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """Sayacı value kadar artır"""
+        key = self._key(name, 'counter', labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Göstergenin değerini ayarla"""
+        key = self._key(name, 'gauge', labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Histograma bir gözlem ekle"""
+        key = self._key(name, 'histogram', labels)
+        buckets = self._metrics[name][2]
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(buckets), 0.0, 0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self) -> str:
+        """Tüm metrikleri Prometheus metin formatında döndür"""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text, buckets) in self._metrics.items():
+                lines.append(f"# HELP {name} {_escape_help(help_text)}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind != 'histogram':
+                    for (metric, labels), value in self._values.items():
+                        if metric == name:
+                            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                for (metric, labels), (counts, total, count) in self._histograms.items():
+                    if metric != name:
+                        continue
+                    # Prometheus histogramları kümülatiftir; observe her gözlemi tüm üst sınırlara sayar
+                    for bound, bucket_count in zip(buckets, counts):
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {bucket_count}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def _key(self, name: str, kind: str, labels: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        metric = self._metrics.get(name)
+        if metric is None or metric[0] != kind:
+            raise ValueError(f"Tanımlanmamış {kind} metriği: {name}")
+        return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+class SamplingProfiler:
+    """Bir thread'in çağrı yığınını belirli aralıklarla örnekleyen basit profiler.
+
+    Yalnızca standart kütüphane kullanır (sys._current_frames); örneklenen thread
+    yavaşlatılmaz. Sonuç flamegraph araçlarının okuduğu katlanmış yığın (collapsed
+    stack) formatındadır: her satır 'kök;...;yaprak örnek_sayısı'. Süreç havuzundaki
+    işçiler ayrı süreç olduğundan örneklenmez.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = Counter()  # yığın (kökten yaprağa çerçeveler) -> örnek sayısı
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def collapsed(self) -> str:
+        """Örnekleri katlanmış yığın formatında döndür (en sık yığın önce)"""
+        return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common())
+
+    def dump(self, path: str):
+        """Örnekleri katlanmış yığın formatında dosyaya yaz"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.collapsed())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{code.co_firstlineno}")
+                frame = frame.f_back
+            self.samples[tuple(reversed(stack))] += 1
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{label}="{_escape_label(value)}"' for label, value in labels) + '}'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
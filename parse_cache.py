@@ -0,0 +1,122 @@
+import os
+import gzip
+import pickle
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+
+
+class ParseCache:
+    """Dosya içeriğinin özetine (hash) göre parse sonuçlarını diskte saklayan LRU önbellek.
+
+    Anahtar, dosya byte'larının SHA-256 özeti ile parser sürümünden oluşur; aynı dosya
+    tekrar yüklendiğinde TemsParser hiç çalıştırılmadan sonuç diskten okunur. Kayıtlar
+    sıkıştırılmış pickle olarak tutulur; toplam boyut max_bytes'ı aşınca en uzun süredir
+    kullanılmayan kayıtlar silinir.
+    """
+
+    FILE_SUFFIX = '.pkl.gz'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 * 1024 * 1024, parser_version: str = ''):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.parser_version = str(parser_version)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def new_hasher(cls):
+        """Dosya byte'ları için kullanılan hash nesnesini oluştur (yükleme sırasında beslenebilir)"""
+        return hashlib.sha256()
+
+    @classmethod
+    def hash_file(cls, filepath: str) -> str:
+        """Dosyanın içerik özetini hesapla"""
+        hasher = cls.new_hasher()
+        with open(filepath, 'rb') as file:
+            while True:
+                chunk = file.read(cls.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def make_key(self, content_hash: str, file_extension: str = '') -> str:
+        """İçerik özeti, dosya türü ve parser sürümünden önbellek anahtarını üret"""
+        # .trp ve .log dosyaları farklı okunduğundan uzantı da anahtara girer
+        key_source = f'{content_hash}:{file_extension.lower()}:{self.parser_version}'
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Önbellekteki parse sonucunu döndür; yoksa None"""
+        path = self._path(key)
+        try:
+            with gzip.open(path, 'rb') as file:
+                data = pickle.load(file)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # Bozuk kayıt: sil ve yeniden parse edilmesine izin ver
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # LRU sırası için son kullanım zamanını güncelle
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]):
+        """Parse sonucunu önbelleğe yaz ve gerekirse eski kayıtları sil"""
+        path = self._path(key)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with gzip.open(temp_path, 'wb', compresslevel=1) as file:
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """İsabet/ıskalama sayaçlarını döndür"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def _evict(self):
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                if not entry.name.endswith(self.FILE_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+
+        # En eski kullanılandan başlayarak sil; en son yazılan kayıt her zaman kalır
+        entries.sort()
+        for _, size, path in entries[:-1]:
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.FILE_SUFFIX)
@@ -0,0 +1,282 @@
+import re
+import zlib
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Callable, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+# Token: harf, rakam ve '_' dizisi; indeks ve sorgular küçük harfe çevrilmiş metinle çalışır
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# ASCII metinde kelime olmayan byte'lar boşluğa çevrilip split edilir (regex'ten hızlı, aynı token'lar)
+_ASCII_SEPARATORS = bytes(code if code < 128 and (chr(code).isalnum() or chr(code) == '_') else 32
+                          for code in range(256))
+
+# Sorgu parçası: (-)"tırnaklı ifade" (kapanmamış tırnak satır sonuna kadar) ya da boşluksuz terim
+_QUERY_PART = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+
+# Bu uzunluktan (byte) kısa posting listeleri sıkıştırılmaz
+COMPRESS_MIN_BYTES = 64
+
+# Posting başlığı: (fark türü kodu | sıkıştırma biti, ilk id)
+_HEADER = struct.Struct('<BI')
+_DELTA_TYPES = ('<u1', '<u2', '<u4')
+_COMPRESSED = 0x80
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+# Sorgu terimi: (token'lar, son token önek mi, olumsuz mu)
+Clause = Tuple[Tuple[str, ...], bool, bool]
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni küçük harfli token'lara böl"""
+    text = text.lower()
+    if text.isascii():
+        return text.encode('ascii').translate(_ASCII_SEPARATORS).decode('ascii').split()
+    return TOKEN_PATTERN.findall(text)
+
+
+def encode_postings(ids: Iterable[int]) -> Union[int, bytes]:
+    """Artan id listesini sakla: tek id int olarak, daha fazlası fark (delta) kodlamalı byte dizisi olarak.
+
+    Farklar en küçük yeten tamsayı türünde (1, 2 ya da 4 byte) yazılır; uzun listeler ayrıca
+    zlib ile sıkıştırılır (küçülüyorsa).
+    """
+    values = np.asarray(ids, dtype=np.int64)
+    if len(values) == 1:
+        return int(values[0])
+    deltas = np.diff(values)
+    largest = int(deltas.max())
+    code = 0 if largest < 1 << 8 else 1 if largest < 1 << 16 else 2
+    payload = deltas.astype(_DELTA_TYPES[code]).tobytes()
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(payload, 1)
+        if len(compressed) < len(payload):
+            payload, code = compressed, code | _COMPRESSED
+    return _HEADER.pack(code, int(values[0])) + payload
+
+
+def decode_postings(postings: Union[int, bytes]) -> np.ndarray:
+    """encode_postings ile saklanan id'leri artan int64 dizisi olarak aç"""
+    if isinstance(postings, int):
+        return np.array([postings], dtype=np.int64)
+    code, first = _HEADER.unpack_from(postings)
+    payload = postings[_HEADER.size:]
+    if code & _COMPRESSED:
+        payload = zlib.decompress(payload)
+    deltas = np.frombuffer(payload, dtype=_DELTA_TYPES[code & ~_COMPRESSED])
+    ids = np.empty(len(deltas) + 1, dtype=np.int64)
+    ids[0] = first
+    np.cumsum(deltas, dtype=np.int64, out=ids[1:])
+    ids[1:] += first
+    return ids
+
+
+def parse_query(query: str) -> List[List[Clause]]:
+    """Sorguyu OR ile ayrılmış AND gruplarına ayır.
+
+    Boşlukla ayrılan terimler AND ile birleşir (AND yazılması da kabul edilir) ve OR'dan
+    önce bağlanır: 'a b OR c' = (a AND b) OR c. "Tırnaklı ifade" ve birden fazla token'a
+    bölünen terimler (ör. m-TMSI) token'ların ardışık geçtiği mesajlarla eşleşir; '*' ile
+    biten terimin son token'ı önek olarak aranır, '-' ile başlayan terim mesajı dışlar.
+    """
+    groups = [[]]
+    for match in _QUERY_PART.finditer(query):
+        minus, phrase, word = match.groups()
+        if word == 'OR':
+            groups.append([])
+            continue
+        if word == 'AND':
+            continue
+        if phrase is not None:
+            text, negated = phrase, bool(minus)
+        elif word.startswith('-') and len(word) > 1:
+            text, negated = word[1:], True
+        else:
+            text, negated = word, False
+        tokens = tuple(tokenize(text))
+        if not tokens:
+            raise ValueError(f"Aranacak kelime içermeyen terim: {text}")
+        groups[-1].append((tokens, text.endswith('*'), negated))
+
+    if not all(any(not negated for _, _, negated in group) for group in groups):
+        raise ValueError("Sorgu boş ya da bir OR grubunda yalnızca dışlanan (-) terimler var")
+    return groups
+
+
+def phrase_pattern(tokens: Tuple[str, ...], prefix: bool = False) -> 're.Pattern':
+    """Token'ların küçük harfli metinde ardışık geçtiğini bulan regex"""
+    pattern = r'(?<!\w)' + r'\W+'.join(re.escape(token) for token in tokens)
+    return re.compile(pattern + (r'\w*' if prefix else r'(?!\w)'))
+
+
+class SearchIndexBuilder:
+    """Mesaj metinlerinden ters indeks (token -> mesajların id'leri) oluşturur.
+
+    Mesajlar artan id sırasıyla eklenmelidir. Bir mesajda birden fazla geçen token bir kez
+    sayılır; tek mesajda geçen token'lar (ör. m-TMSI değerleri) dizi yerine int olarak tutulur.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self.size = 0
+
+    def add(self, message_id: int, text: str):
+        postings = self._postings
+        for token in set(tokenize(text)):
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = message_id
+            elif type(ids) is int:
+                postings[token] = array('I', (ids, message_id))
+            else:
+                ids.append(message_id)
+        self.size += 1
+
+    def build(self) -> 'IndexSegment':
+        """Posting listelerini sıkıştırıp değiştirilemez segmente çevir"""
+        return IndexSegment({token: ids if type(ids) is int else encode_postings(ids)
+                             for token, ids in self._postings.items()}, self.size)
+
+
+class IndexSegment:
+    """Tek parse biriminin (dosya ya da byte aralığı) sıkıştırılmış posting listeleri; id'ler birime yereldir"""
+
+    def __init__(self, postings: Dict[str, Union[int, bytes]], size: int):
+        self.postings = postings
+        self.size = size
+        self._vocabulary = None  # önek aramaları için sıralı token listesi (ilk önek aramasında)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'postings': self.postings, 'size': self.size}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.postings = state['postings']
+        self.size = state['size']
+        self._vocabulary = None
+
+    def ids(self, token: str) -> np.ndarray:
+        postings = self.postings.get(token)
+        return _EMPTY if postings is None else decode_postings(postings)
+
+    def prefix_ids(self, prefix: str) -> np.ndarray:
+        """prefix ile başlayan token'lardan herhangi birini içeren mesajlar"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        matches = []
+        for position in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[position].startswith(prefix):
+                break
+            matches.append(decode_postings(self.postings[vocabulary[position]]))
+        if not matches:
+            return _EMPTY
+        return matches[0] if len(matches) == 1 else np.unique(np.concatenate(matches))
+
+    def match(self, tokens: Tuple[str, ...], prefix: bool) -> np.ndarray:
+        """Tüm token'ları (prefix ise sonuncusunu önek olarak) içeren mesajlar"""
+        ids = None
+        for position, token in enumerate(tokens):
+            if prefix and position == len(tokens) - 1:
+                term = self.prefix_ids(token)
+            else:
+                term = self.ids(token)
+            ids = term if ids is None else np.intersect1d(ids, term, assume_unique=True)
+            if not len(ids):
+                break
+        return ids
+
+    def estimated_size(self) -> int:
+        # Sözlük girdisi ve token metni başına yaklaşık 100 byte
+        return sum(len(postings) if type(postings) is bytes else 0 for postings in self.postings.values()) \
+            + 100 * len(self.postings)
+
+
+class SearchIndex:
+    """Veri setinin raw_content üzerindeki tam metin (ters) indeksi.
+
+    Bir ya da daha fazla IndexSegment'ten oluşur: paralel parse'ta her byte aralığı, birleştirilen
+    loglarda her dosya ayrı segmenttir. Segmentler birleştirilmez (posting listeleri yeniden
+    kodlanmaz); sorgu her segmentte çalışır ve sonuç id_map ile global id'lere çevrilir. id_map
+    bir int (yerel id'ye eklenen kaydırma) ya da yerel id - 1 -> global id dizisidir.
+    """
+
+    def __init__(self, segments: List[Tuple[IndexSegment, Union[int, Sequence[int]]]]):
+        self.segments = [(segment, id_map if isinstance(id_map, int) else np.asarray(id_map, dtype=np.int64))
+                         for segment, id_map in segments]
+        self.size = sum(segment.size for segment, _ in segments)
+        # Dizi eşlemeli segmentlerin id'leri iç içe geçer; sonuç yeniden sıralanır
+        self._interleaved = any(not isinstance(id_map, int) for _, id_map in segments)
+
+    def term_ids(self, tokens: Tuple[str, ...], prefix: bool = False) -> np.ndarray:
+        """Tüm token'ları içeren mesajların global id'leri (artan)"""
+        results = []
+        for segment, id_map in self.segments:
+            ids = segment.match(tokens, prefix)
+            if len(ids):
+                results.append(ids + id_map if isinstance(id_map, int) else id_map[ids - 1])
+        if not results:
+            return _EMPTY
+        ids = results[0] if len(results) == 1 else np.concatenate(results)
+        if self._interleaved:
+            ids.sort()
+        return ids
+
+    def search(self, query: str, texts: Optional[Callable[[np.ndarray], Iterable[str]]] = None,
+               selection: Optional[bytes] = None) -> np.ndarray:
+        """Sorguya (bkz. parse_query) uyan mesajların id'lerini artan sırada döndür.
+
+        selection (satır başına bir byte'lık seçim maskesi, MessageStore.filter_mask; satır = id - 1)
+        verilirse yalnızca seçili mesajlar döner. İfadeler önce tüm token'ları içeren mesajlara
+        daraltılır, ardından kalan adayların metni texts(ids) ile (aynı sırada) okunup token'ların
+        ardışık geçtiği doğrulanır; texts verilmezse token'ların aynı mesajda geçmesi yeterli sayılır.
+        """
+        allowed = None if selection is None else np.frombuffer(selection, dtype=np.uint8).view(np.bool_)
+        result = None
+        for group in parse_query(query):
+            positive = [(tokens, prefix) for tokens, prefix, negated in group if not negated]
+            negative = [(tokens, prefix) for tokens, prefix, negated in group if negated]
+
+            ids = None
+            for tokens, prefix in positive:
+                term = self.term_ids(tokens, prefix)
+                ids = term if ids is None else np.intersect1d(ids, term, assume_unique=True)
+            if allowed is not None:
+                # Seçim maskesi doğrulamadan önce uygulanır; yalnızca filtreden geçen metinler okunur
+                ids = ids[allowed[ids - 1]]
+            phrases = [phrase_pattern(tokens, prefix) for tokens, prefix in positive if len(tokens) > 1]
+            ids = self._verify(ids, phrases, texts)
+
+            for tokens, prefix in negative:
+                excluded = np.intersect1d(ids, self.term_ids(tokens, prefix), assume_unique=True)
+                if len(tokens) > 1:
+                    excluded = self._verify(excluded, [phrase_pattern(tokens, prefix)], texts)
+                ids = np.setdiff1d(ids, excluded, assume_unique=True)
+
+            result = ids if result is None else np.union1d(result, ids)
+        return result
+
+    @staticmethod
+    def _verify(ids: np.ndarray, patterns: List['re.Pattern'],
+                texts: Optional[Callable[[np.ndarray], Iterable[str]]]) -> np.ndarray:
+        """Metni tüm ifade regex'leriyle eşleşen mesajları bırak"""
+        if not patterns or texts is None or not len(ids):
+            return ids
+        kept = [message_id for message_id, text in zip(ids.tolist(), texts(ids))
+                if all(pattern.search(text.lower()) for pattern in patterns)]
+        return np.array(kept, dtype=np.int64)
+
+    def estimated_size(self) -> int:
+        return sum(segment.estimated_size() + (0 if isinstance(id_map, int) else id_map.nbytes)
+                   for segment, id_map in self.segments)
+
+
+def build_search_index(messages: Iterable[Dict[str, Any]]) -> SearchIndex:
+    """Mesajların raw_content alanından tek segmentli indeks oluştur (parse sırasında indekslenmemiş veri setleri için)"""
+    builder = SearchIndexBuilder()
+    for message in messages:
+        builder.add(message['id'], message.get('raw_content') or '')
+    return SearchIndex([(builder.build(), 0)])
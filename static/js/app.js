@@ -4,6 +4,9 @@ class TemsAnalyzer {
     constructor() {
         this.currentData = null;
         this.filteredData = null;
+        this.datasetId = null;
+        this.nextCursor = null;
+        this.liveSource = null;
         this.currentZoom = 1;
         this.init();
     }
@@ -19,6 +22,10 @@ class TemsAnalyzer {
         // Dosya yükleme
         document.getElementById('uploadBtn').addEventListener('click', () => this.uploadFile());
         
+        // Canlı takip
+        document.getElementById('liveStartBtn').addEventListener('click', () => this.startLiveFollow());
+        document.getElementById('liveStopBtn').addEventListener('click', () => this.stopLiveFollow());
+        
         // Filtreler
         document.getElementById('applyFilters').addEventListener('click', () => this.applyFilters());
         document.getElementById('clearFilters').addEventListener('click', () => this.clearFilters());
@@ -28,6 +35,9 @@ class TemsAnalyzer {
         document.getElementById('zoomOut').addEventListener('click', () => this.zoomOut());
         document.getElementById('resetZoom').addEventListener('click', () => this.resetZoom());
         
+        // Sonraki mesaj sayfası
+        document.getElementById('loadMoreMessages').addEventListener('click', () => this.loadMoreMessages());
+        
         // Export
         document.getElementById('exportMessages').addEventListener('click', () => this.exportMessages());
         
@@ -51,6 +61,21 @@ class TemsAnalyzer {
 
     hideLoading() {
         document.getElementById('loadingOverlay').classList.remove('show');
+        this.setLoadingText('İşleniyor...');
+    }
+
+    setLoadingText(text) {
+        document.getElementById('loadingText').textContent = text;
+    }
+
+    escapeHtml(value) {
+        // Kullanıcıdan gelen metinler (ör. yüklenen dosya adları) innerHTML'e kaçışlanarak yazılır
+        return String(value)
+            .replace(/&/g, '&amp;')
+            .replace(/</g, '&lt;')
+            .replace(/>/g, '&gt;')
+            .replace(/"/g, '&quot;')
+            .replace(/'/g, '&#39;');
     }
 
     showAlert(message, type = 'info') {
@@ -84,7 +109,8 @@ class TemsAnalyzer {
 
     async uploadFile() {
         const fileInput = document.getElementById('logFile');
-        const file = fileInput.files[0];
+        const files = Array.from(fileInput.files);
+        const file = files[0];
         
         if (!file) {
             this.showAlert('Lütfen bir log dosyası seçin.', 'warning');
@@ -92,27 +118,46 @@ class TemsAnalyzer {
         }
         
         const allowedExtensions = ['.log', '.txt', '.trp'];
-        const fileExtension = file.name.toLowerCase().substring(file.name.lastIndexOf('.'));
+        const unsupported = files.some(f => !allowedExtensions.includes(f.name.toLowerCase().substring(f.name.lastIndexOf('.'))));
         
-        if (!allowedExtensions.includes(fileExtension)) {
+        if (unsupported) {
             this.showAlert('Sadece .log, .txt ve .trp dosyaları destekleniyor.', 'danger');
             return;
         }
         
+        if (files.length > 1) {
+            await this.uploadMergedFiles(files);
+            return;
+        }
+        
         this.showLoading();
         
+        let progressTimer = null;
         try {
-            const formData = new FormData();
-            formData.append('file', file);
-            
-            const response = await fetch('/upload', {
+            // Yükleme oturumu aç; dosya ham gövde olarak gönderilir ve sunucuda gelirken parse edilir
+            const sessionResponse = await fetch('/api/uploads', {
                 method: 'POST',
-                body: formData
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ filename: file.name, size: file.size })
             });
+            const session = await sessionResponse.json();
+            if (!session.success) {
+                this.showAlert(session.error || 'Dosya yüklenirken hata oluştu.', 'danger');
+                return;
+            }
             
-            const result = await response.json();
+            progressTimer = setInterval(() => this.updateUploadProgress(session.dataset_id), 1000);
+            
+            const response = await fetch(`/api/uploads/${session.dataset_id}?compact=1`, {
+                method: 'PUT',
+                body: file
+            });
+            
+            const result = this.expandDescriptors(await response.json());
             
             if (result.success) {
+                this.datasetId = result.dataset_id;
+                this.nextCursor = result.data.next_cursor;
                 this.currentData = result.data;
                 this.filteredData = result.data.messages;
                 this.updateUI();
@@ -124,21 +169,175 @@ class TemsAnalyzer {
         } catch (error) {
             console.error('Upload error:', error);
             this.showAlert('Dosya yüklenirken hata oluştu: ' + error.message, 'danger');
+        } finally {
+            clearInterval(progressTimer);
+            this.hideLoading();
+        }
+    }
+
+    async uploadMergedFiles(files) {
+        // Birden fazla UE logu sunucuda zaman damgasına göre tek veri setinde birleştirilir
+        const formData = new FormData();
+        files.forEach(file => formData.append('file', file));
+        
+        this.showLoading();
+        try {
+            const response = await fetch('/upload?compact=1', {
+                method: 'POST',
+                body: formData
+            });
+            
+            const result = this.expandDescriptors(await response.json());
+            
+            if (result.success) {
+                this.datasetId = result.dataset_id;
+                this.nextCursor = result.data.next_cursor;
+                this.currentData = result.data;
+                this.filteredData = result.data.messages;
+                this.updateUI();
+                this.updateSimulationMessageList();
+                this.showAlert(result.message, 'success');
+            } else {
+                this.showAlert(result.error || 'Dosyalar yüklenirken hata oluştu.', 'danger');
+            }
+        } catch (error) {
+            console.error('Upload error:', error);
+            this.showAlert('Dosyalar yüklenirken hata oluştu: ' + error.message, 'danger');
         } finally {
             this.hideLoading();
         }
     }
 
+    expandDescriptors(result) {
+        // compact=1 yanıtlarında mesaj türü açıklamaları 'descriptors' tablosunda bir kez gelir;
+        // mesajlar descriptor_id ile bu tabloya referans verir
+        const descriptors = result.descriptors;
+        if (!descriptors) return result;
+        
+        const expand = message => {
+            if (message && message.descriptor_id !== undefined) {
+                message.parameters = Object.assign({}, descriptors[message.descriptor_id], message.parameters);
+                delete message.descriptor_id;
+            }
+        };
+        [result.messages, result.filtered_data, result.data?.messages].forEach(messages => {
+            if (Array.isArray(messages)) messages.forEach(expand);
+        });
+        expand(result.message);
+        delete result.descriptors;
+        return result;
+    }
+
+    async updateUploadProgress(datasetId) {
+        try {
+            const response = await fetch(`/api/uploads/${datasetId}`);
+            const result = await response.json();
+            if (result.success && result.upload.status === 'receiving') {
+                const percent = result.upload.progress !== null ? ` %${Math.round(result.upload.progress * 100)}` : '';
+                this.setLoadingText(`Yükleniyor${percent} - ${result.upload.total_messages} mesaj parse edildi`);
+            }
+        } catch (error) {
+            console.error('Upload progress error:', error);
+        }
+    }
+
+    startLiveFollow() {
+        const fileName = document.getElementById('liveFile').value.trim();
+        if (!fileName) {
+            this.showAlert('Lütfen takip edilecek log dosyasının adını girin.', 'warning');
+            return;
+        }
+        
+        this.stopLiveFollow();
+        const fromStart = document.getElementById('liveFromStart').checked ? '1' : '0';
+        const source = new EventSource(`/api/live/stream?file=${encodeURIComponent(fileName)}&from_start=${fromStart}`);
+        this.liveSource = source;
+        this.updateLiveControls();
+        
+        source.addEventListener('dataset', (e) => {
+            const data = JSON.parse(e.data);
+            this.datasetId = data.dataset_id;
+            this.nextCursor = null;
+            this.currentData = { messages: [], call_flows: [], statistics: null, total_messages: 0 };
+            this.filteredData = this.currentData.messages;
+            this.showAlert(`${this.escapeHtml(data.file)} canlı olarak takip ediliyor.`, 'info');
+        });
+        
+        source.addEventListener('messages', (e) => this.onLiveMessages(JSON.parse(e.data)));
+        
+        source.addEventListener('reset', () => {
+            // Dosya baştan yazılmaya başlandı
+            this.currentData.messages.length = 0;
+            this.currentData.call_flows = [];
+        });
+        
+        source.addEventListener('error', (e) => {
+            if (e.data) {
+                this.showAlert(JSON.parse(e.data).error, 'danger');
+            } else if (source.readyState === EventSource.CLOSED) {
+                this.showAlert('Canlı takip bağlantısı kurulamadı.', 'danger');
+            }
+            if (e.data || source.readyState === EventSource.CLOSED) {
+                this.stopLiveFollow();
+            }
+        });
+    }
+
+    stopLiveFollow() {
+        if (this.liveSource) {
+            this.liveSource.close();
+            this.liveSource = null;
+        }
+        this.updateLiveControls();
+    }
+
+    updateLiveControls() {
+        const active = this.liveSource !== null;
+        document.getElementById('liveStartBtn').classList.toggle('d-none', active);
+        document.getElementById('liveStopBtn').classList.toggle('d-none', !active);
+    }
+
+    onLiveMessages(data) {
+        if (!this.currentData) return;
+        
+        const unfiltered = this.filteredData === this.currentData.messages;
+        this.currentData.messages.push(...data.messages);
+        this.currentData.statistics = data.statistics;
+        this.currentData.total_messages = data.total_messages;
+        
+        // Yalnızca değişen call flow'lar gelir; ID'ye göre güncelle
+        data.call_flows.forEach(flow => {
+            this.currentData.call_flows[flow.id - 1] = flow;
+        });
+        
+        if (unfiltered) {
+            this.filteredData = this.currentData.messages;
+        }
+        this.updateUI();
+        this.updateSimulationMessageList();
+    }
+
     updateUI() {
         if (!this.currentData) return;
         
         this.updateStatistics();
+        this.updateSourceFilter();
         this.updateFlowDiagram();
         this.updateMessagesList();
         this.updateAnalysis();
         this.findEnbMmeMessages();
     }
 
+    updateSourceFilter() {
+        // Kaynak filtresi yalnızca birden fazla log birleştirildiğinde gösterilir
+        const sources = this.currentData.sources || [];
+        const select = document.getElementById('sourceFileFilter');
+        // Kaynak adları dosya adlarından gelir; seçenekler HTML olarak değil metin olarak eklenir
+        select.replaceChildren(new Option('Tümü', ''),
+            ...sources.map(source => new Option(`${source.name} (${source.total_messages})`, source.name)));
+        document.getElementById('sourceFileFilterGroup').classList.toggle('d-none', sources.length === 0);
+    }
+
     updateStatistics() {
         const stats = this.currentData.statistics;
         const statsHtml = `
@@ -223,7 +422,7 @@ class TemsAnalyzer {
             const protocol = message.protocol || message.protocol_type || 'unknown';
             const protocolClass = this.getProtocolClass(protocol);
             const messageType = (message.message_type || 'unknown').toLowerCase().replace(/[\s_\-]/g, '');
-            const isError = (message.raw_content && message.raw_content.toLowerCase().includes('error')) || 
+            const isError = this.hasErrorKeyword(message) || 
                            (message.message_type && message.message_type.toLowerCase().includes('error'));
             
             // Mesaj tipi sınıfını belirle
@@ -267,6 +466,7 @@ class TemsAnalyzer {
                         </div>
                         <div class="flow-step-details">
                             <div class="d-flex align-items-center gap-2 flex-wrap">
+                                ${message.source_file ? `<span class="badge bg-dark" style="font-size: 0.7rem;"><i class="fas fa-mobile-alt me-1"></i>${this.escapeHtml(message.source_file)}</span>` : ''}
                                 ${message.parameters?.channel ? `<span class="badge bg-secondary" style="font-size: 0.7rem;">${message.parameters.channel}</span>` : ''}
                                 ${message.pci ? `<span class="badge bg-info" style="font-size: 0.7rem;">PCI: ${message.pci}</span>` : ''}
                                 ${message.earfcn ? `<span class="badge bg-success" style="font-size: 0.7rem;">EARFCN: ${message.earfcn}</span>` : ''}
@@ -314,9 +514,47 @@ class TemsAnalyzer {
         }
     }
 
+    async loadMoreMessages() {
+        if (!this.datasetId || this.nextCursor === null) return;
+        
+        try {
+            const response = await fetch(`/api/datasets/${this.datasetId}/messages?cursor=${this.nextCursor}&compact=1`);
+            const result = this.expandDescriptors(await response.json());
+            
+            if (result.success) {
+                const unfiltered = this.filteredData === this.currentData.messages;
+                this.currentData.messages.push(...result.messages);
+                this.nextCursor = result.next_cursor;
+                if (unfiltered) {
+                    this.filteredData = this.currentData.messages;
+                }
+                this.updateFlowDiagram();
+                this.updateMessagesList();
+                this.updateSimulationMessageList();
+            } else {
+                this.showAlert(result.error || 'Mesajlar yüklenirken hata oluştu.', 'danger');
+            }
+        } catch (error) {
+            console.error('Load more error:', error);
+            this.showAlert('Mesajlar yüklenirken hata oluştu.', 'danger');
+        }
+    }
+
+    updateLoadMore() {
+        // Filtre uygulanmışsa sunucu tüm eşleşmeleri döndürdüğü için sayfalama gizlenir
+        const container = document.getElementById('loadMoreContainer');
+        const hasMore = this.nextCursor !== null && this.filteredData === this.currentData.messages;
+        container.classList.toggle('d-none', !hasMore);
+        if (hasMore) {
+            document.getElementById('loadedMessagesInfo').textContent =
+                `${this.currentData.messages.length} / ${this.currentData.total_messages} mesaj yüklendi`;
+        }
+    }
+
     updateMessagesList() {
         const messages = this.filteredData || this.currentData.messages;
         const tbody = document.querySelector('#messagesTable tbody');
+        this.updateLoadMore();
         
         if (!messages || messages.length === 0) {
             tbody.innerHTML = `
@@ -376,14 +614,13 @@ class TemsAnalyzer {
         if (!this.currentData) return;
         
         try {
-            const response = await fetch('/api/analyze', {
+            // Mesajlar sunucuda tutuluyor; yalnızca dataset ID gönderilir
+            const response = await fetch(`/api/datasets/${this.datasetId}/analyze`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
-                body: JSON.stringify({
-                    log_data: this.currentData.messages
-                })
+                body: JSON.stringify({})
             });
             
             const result = await response.json();
@@ -436,10 +673,36 @@ class TemsAnalyzer {
         document.getElementById('recommendations').innerHTML = recommendationsHtml;
     }
 
-    showMessageDetail(messageId) {
+    hasErrorKeyword(message) {
+        // Parse sırasında bulunan anahtar kelimeler (tembel parse'ta raw_content boştur)
+        if (message.error_keywords) {
+            return message.error_keywords.includes('error');
+        }
+        return Boolean(message.raw_content && message.raw_content.toLowerCase().includes('error'));
+    }
+
+    async loadMessageDetails(message) {
+        // Tembel parse edilen mesajların raw_content ve ayrıntılı parametreleri sunucudan istenir
+        if (message.source_offset === undefined || !this.datasetId) return message;
+        
+        try {
+            const response = await fetch(`/api/datasets/${this.datasetId}/messages/${message.id}?compact=1`);
+            const result = this.expandDescriptors(await response.json());
+            if (response.ok && result.success) {
+                return result.message;
+            }
+            console.error('Mesaj ayrıntıları alınamadı:', result.error);
+        } catch (error) {
+            console.error('Mesaj ayrıntıları alınamadı:', error);
+        }
+        return message;
+    }
+
+    async showMessageDetail(messageId) {
         const messages = this.filteredData || this.currentData.messages;
-        const message = messages.find(m => m.id == messageId);
+        let message = messages.find(m => m.id == messageId);
         if (!message) return;
+        message = await this.loadMessageDetails(message);
         
         const protocol = message.protocol || message.protocol_type || 'Unknown';
         const messageType = message.message_type || 'N/A';
@@ -565,14 +828,10 @@ class TemsAnalyzer {
         modal.show();
     }
 
-    async applyFilters() {
-        if (!this.currentData) {
-            this.showAlert('Önce bir log dosyası yükleyin.', 'warning');
-            return;
-        }
-        
+    collectFilters() {
         const filters = {
             protocol: document.getElementById('protocolFilter').value,
+            source_file: document.getElementById('sourceFileFilter').value,
             channel: document.getElementById('channelFilter').value,
             message_type: document.getElementById('messageTypeFilter').value,
             message_direction: document.getElementById('messageDirectionFilter').value,
@@ -600,19 +859,36 @@ class TemsAnalyzer {
             if (!filters[key] && filters[key] !== false) delete filters[key];
         });
         
+        return filters;
+    }
+
+    async applyFilters() {
+        if (!this.currentData) {
+            this.showAlert('Önce bir log dosyası yükleyin.', 'warning');
+            return;
+        }
+        
+        const filters = this.collectFilters();
+        
+        // Metin araması varsa filtreler arama sonucuyla kesiştirilir
+        const query = document.getElementById('textSearchFilter').value.trim();
+        if (query) {
+            await this.searchMessages(query, filters);
+            return;
+        }
+        
         try {
-            const response = await fetch('/api/filter', {
+            const response = await fetch(`/api/datasets/${this.datasetId}/filter?compact=1`, {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
                 },
                 body: JSON.stringify({
-                    log_data: this.currentData.messages,
                     filters: filters
                 })
             });
             
-            const result = await response.json();
+            const result = this.expandDescriptors(await response.json());
             
             if (result.success) {
                 this.filteredData = result.filtered_data;
@@ -626,12 +902,40 @@ class TemsAnalyzer {
         }
     }
 
+    async searchMessages(query, filters) {
+        try {
+            const params = new URLSearchParams({
+                q: query,
+                filters: JSON.stringify(filters),
+                limit: 10000,
+                compact: 1
+            });
+            const response = await fetch(`/api/datasets/${this.datasetId}/search?${params}`);
+            const result = this.expandDescriptors(await response.json());
+            
+            if (result.success) {
+                this.filteredData = result.messages;
+                this.updateFlowDiagram();
+                this.updateMessagesList();
+                const shown = result.next_cursor !== null ? ` (ilk ${result.messages.length} mesaj gösteriliyor)` : '';
+                this.showAlert(`${result.total} mesaj bulundu${shown}.`, 'info');
+            } else {
+                this.showAlert(result.error || 'Arama sırasında hata oluştu.', 'warning');
+            }
+        } catch (error) {
+            console.error('Search error:', error);
+            this.showAlert('Arama sırasında hata oluştu.', 'danger');
+        }
+    }
+
     clearFilters() {
         document.getElementById('protocolFilter').value = '';
+        document.getElementById('sourceFileFilter').value = '';
         document.getElementById('channelFilter').value = '';
         document.getElementById('messageTypeFilter').value = '';
         document.getElementById('messageDirectionFilter').value = '';
         document.getElementById('messageIdentityFilter').value = '';
+        document.getElementById('textSearchFilter').value = '';
         document.getElementById('pciFilter').value = '';
         document.getElementById('earfcnFilter').value = '';
         document.getElementById('minRsrpFilter').value = '';
@@ -676,6 +980,28 @@ class TemsAnalyzer {
             return;
         }
         
+        if (this.datasetId) {
+            // Sunucu filtreleri ve metin aramasını uygulayıp CSV'yi akış halinde gönderir; tarayıcı
+            // dosyayı doğrudan diske indirir, mesajlar bellekte toplanmaz
+            const params = new URLSearchParams({
+                format: 'csv',
+                filters: JSON.stringify(this.filteredData ? this.collectFilters() : {})
+            });
+            const query = document.getElementById('textSearchFilter').value.trim();
+            if (this.filteredData && query) {
+                params.set('q', query);
+            }
+            const link = document.createElement('a');
+            link.setAttribute('href', `/api/datasets/${this.datasetId}/export?${params}`);
+            link.style.visibility = 'hidden';
+            document.body.appendChild(link);
+            link.click();
+            document.body.removeChild(link);
+            
+            this.showAlert('Mesajlar CSV formatında dışa aktarılıyor.', 'success');
+            return;
+        }
+        
         const messages = this.filteredData || this.currentData.messages;
         const csvContent = this.convertToCSV(messages);
         
@@ -1006,7 +1332,7 @@ class TemsAnalyzer {
              const protocol = message.protocol || message.protocol_type || 'unknown';
              const protocolClass = this.getProtocolClass(protocol);
              const isError = (message.message_type && message.message_type.toLowerCase().includes('error')) ||
-                            (message.raw_content && message.raw_content.toLowerCase().includes('error'));
+                            this.hasErrorKeyword(message);
              
              timelineHTML += `
                  <div class="timeline-event ${protocolClass} ${isError ? 'error' : ''}" 
@@ -2052,7 +2378,9 @@ class TemsAnalyzer {
         detailsContainer.style.display = 'block';
     }
 
-    showMessageDetails(message, messageElement) {
+    async showMessageDetails(message, messageElement) {
+        message = await this.loadMessageDetails(message);
+        
         // Mevcut detay popup'ını kaldır
         const existingPopup = document.querySelector('.message-detail-popup');
         if (existingPopup) {
@@ -0,0 +1,199 @@
+import os
+import time
+import threading
+from typing import Dict, Any, Optional
+from tems_parser import TemsParser, StreamParser
+from dataset_store import DatasetStore
+from parse_cache import ParseCache
+
+
+class UploadSession:
+    """Akış halinde yüklenen tek bir log dosyasının parse durumu"""
+
+    def __init__(self, dataset_id: str, filename: str, file_extension: str,
+                 content_length: Optional[int], stream_parser: StreamParser, data: Dict[str, Any]):
+        self.dataset_id = dataset_id
+        self.filename = filename
+        self.file_extension = file_extension
+        self.content_length = content_length
+        self.stream_parser = stream_parser
+        self.data = data  # DatasetStore'daki veri seti; parse ilerledikçe güncellenir
+        self.status = 'waiting'  # waiting -> receiving -> completed | failed
+        self.bytes_received = 0
+        self.error = None
+        self.cache_hit = False
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def progress(self) -> Dict[str, Any]:
+        """Durum ucunda döndürülen ilerleme bilgisi"""
+        progress = None
+        if self.status == 'completed':
+            progress = 1.0
+        elif self.content_length:
+            progress = min(self.bytes_received / self.content_length, 1.0)
+        return {
+            'dataset_id': self.dataset_id,
+            'filename': self.filename,
+            'status': self.status,
+            'bytes_received': self.bytes_received,
+            'content_length': self.content_length,
+            'progress': progress,
+            'total_messages': self.data['total_messages'],
+            'error': self.error
+        }
+
+
+class StreamingUploads:
+    """İstek gövdesi gelirken parse eden yükleme oturumlarını yönetir.
+
+    create() boş bir veri setini DatasetStore'a ekler ve ID'sini hemen döndürür; receive()
+    gövdeyi parça parça okuyup StreamParser'a verir, mesajlar bu veri setine eklendikçe
+    /messages, /filter ve /analyze uçları yükleme sürerken de kullanılabilir. .log dosyaları
+    diske yazılmaz. .trp dosyaları UTF-8 varsayılarak parse edilirken eşzamanlı olarak geçici
+    dosyaya da yazılır; dosyanın UTF-8 olmadığı anlaşılırsa sonunda bu dosyadan normal
+    parse ile (latin-1) yeniden okunur.
+
+    Gövde gelirken içerik özeti de hesaplanır; aynı içerik önbellekte varsa akışta biriken
+    sonuç yerine önbellekteki sonuç kullanılır (akış kapatılmaz, latin-1 dosya yeniden
+    parse edilmez).
+    """
+
+    READ_CHUNK_SIZE = 1024 * 1024
+    # Tamamlanan/başarısız oturumların durum ucunda görünmeye devam ettiği süre
+    SESSION_TTL_SECONDS = 3600
+    # Açılıp gövdesi hiç gönderilmeyen oturumların (ve boş veri setlerinin) tutulduğu süre
+    WAITING_TTL_SECONDS = 900
+
+    def __init__(self, parser: TemsParser, dataset_store: DatasetStore,
+                 parse_cache: Optional[ParseCache] = None, spool_dir: str = 'uploads', workers: int = 1):
+        self.parser = parser
+        self.dataset_store = dataset_store
+        self.parse_cache = parse_cache
+        self.spool_dir = spool_dir
+        self.workers = workers
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def create(self, filename: str, content_length: Optional[int] = None) -> UploadSession:
+        """Yeni yükleme oturumu aç ve boş veri setini kaydet"""
+        file_extension = os.path.splitext(filename)[1].lower()
+        stream_parser = StreamParser(self.parser, trp=file_extension == '.trp',
+                                     strict=file_extension == '.trp')
+        data = stream_parser.result()
+        dataset_id = self.dataset_store.add(data)
+        session = UploadSession(dataset_id, filename, file_extension, content_length, stream_parser, data)
+
+        with self._lock:
+            self._expire()
+            self._sessions[dataset_id] = session
+        return session
+
+    def get(self, dataset_id: str) -> Optional[UploadSession]:
+        with self._lock:
+            return self._sessions.get(dataset_id)
+
+    def receive(self, session: UploadSession, stream) -> Dict[str, Any]:
+        """İstek gövdesini okuyup parse et ve tamamlanan parse sonucunu döndür"""
+        with self._lock:
+            if self._sessions.get(session.dataset_id) is not session:
+                raise Exception('Yükleme oturumunun süresi doldu')
+            if session.status != 'waiting':
+                raise Exception('Bu yükleme oturumu zaten kullanıldı')
+            session.status = 'receiving'
+
+        stream_parser = session.stream_parser
+        hasher = ParseCache.new_hasher()
+        spool_path = None
+        spool = None
+        utf8 = True
+
+        try:
+            if session.file_extension == '.trp':
+                os.makedirs(self.spool_dir, exist_ok=True)
+                spool_path = os.path.join(self.spool_dir, f'stream_{session.dataset_id}.trp')
+                spool = open(spool_path, 'wb')
+
+            while True:
+                chunk = stream.read(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                if spool is not None:
+                    spool.write(chunk)
+                if utf8:
+                    try:
+                        stream_parser.feed(chunk)
+                    except UnicodeDecodeError:
+                        # latin-1 dosya: kalan kısım yalnızca geçici dosyaya yazılır
+                        utf8 = False
+                session.bytes_received += len(chunk)
+                session.data['statistics'] = stream_parser.statistics.result()
+                session.data['total_messages'] = len(stream_parser.messages)
+
+            if session.content_length is not None and session.bytes_received < session.content_length:
+                raise Exception('Dosya eksik alındı, bağlantı kesildi')
+
+            if spool is not None:
+                spool.close()
+                spool = None
+
+            # Aynı içerik daha önce parse edildiyse önbellekteki sonuç kullanılır
+            cache_key = None
+            parsed_data = None
+            if self.parse_cache is not None:
+                cache_key = self.parse_cache.make_key(hasher.hexdigest(), session.file_extension)
+                parsed_data = self.parse_cache.get(cache_key)
+            session.cache_hit = parsed_data is not None
+
+            if parsed_data is None:
+                if spool_path is not None:
+                    # Boş/çok kısa TRP dosyası için normal parse ile aynı hata verilir
+                    utf8 = utf8 and self.parser._trp_encoding(spool_path) == 'utf-8'
+
+                if utf8:
+                    try:
+                        stream_parser.close()
+                    except UnicodeDecodeError:
+                        utf8 = False
+
+                if utf8:
+                    parsed_data = stream_parser.result()
+                else:
+                    parsed_data = self.parser.parse_log_file(spool_path, workers=self.workers)
+
+            session.data.update(parsed_data)
+            self.dataset_store.update(session.dataset_id, session.data)
+            if cache_key is not None and not session.cache_hit:
+                self.parse_cache.put(cache_key, session.data)
+
+            session.status = 'completed'
+            return session.data
+
+        except Exception as e:
+            session.status = 'failed'
+            session.error = str(e)
+            self.dataset_store.remove(session.dataset_id)
+            raise Exception(f"Akış halinde yükleme başarısız: {str(e)}")
+
+        finally:
+            session.finished_at = time.time()
+            if spool is not None:
+                spool.close()
+            if spool_path is not None and os.path.exists(spool_path):
+                os.remove(spool_path)
+
+    def _expire(self):
+        """Süresi dolan oturumları unut.
+
+        Tamamlanmış/başarısız oturumların veri setleri DatasetStore'da kalır; gövdesi hiç
+        gönderilmeyen oturumların boş veri setleri silinir.
+        """
+        now = time.time()
+        for dataset_id, session in list(self._sessions.items()):
+            if session.finished_at is not None:
+                if session.finished_at < now - self.SESSION_TTL_SECONDS:
+                    del self._sessions[dataset_id]
+            elif session.status == 'waiting' and session.created_at < now - self.WAITING_TTL_SECONDS:
+                del self._sessions[dataset_id]
+                self.dataset_store.remove(dataset_id)
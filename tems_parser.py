@@ -1,12 +1,504 @@
+import io
 import re
-import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import os
+import mmap
+import codecs
+import time
+import heapq
+import shutil
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Union, Callable
+from message_store import MessageStore
+from message_record import MessageRecord, DESCRIPTORS, freeze
+import columnar_file
+from timestamps import parse_timestamp, message_timestamp_ms
+from call_flow import CallFlowTracker, RAW_CONTENT_IDENTITIES, latency_distributions, track_call_flows
+from keyword_classifier import KeywordClassifier
+from metrics import StageTimer
+from search_index import SearchIndex, SearchIndexBuilder, IndexSegment
+
+# Python'un \s ile eşleştirdiği tüm boşluk karakterleri (en büyüğü U+3000)
+_WHITESPACE_CHARS = ''.join(chr(code) for code in range(0x3001) if chr(code).isspace())
+# Blok ayracı yalnızca bu karakterlerden oluşur
+_SEPARATOR_CHARS = _WHITESPACE_CHARS + '-'
+_NON_SPACE = re.compile(r'\S')
+# .log dosyalarında blok ayracının byte karşılığı (paralel parse için kesim noktası arama).
+# Text modunda '\r' ve '\r\n' de '\n' olarak okunur.
+_LOG_CUT_SPACES = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+_LOG_CUT_SEPARATOR = re.compile(rb'[\r\n][ \t\n\r\x0b\x0c\x1c-\x1f]*---[ \t\n\r\x0b\x0c\x1c-\x1f]*[\r\n]')
+
+
+class BlockSplitter:
+    """Parça parça gelen metni '---' ayraçlarından bloklara böler.
+    
+    re.split ile aynı blokları (boş olanlar dahil) üretir; ayraç okuma parçalarının
+    sınırına denk gelse bile doğru bulunur. Bellekte yalnızca tamamlanmamış blok tutulur.
+    """
+    
+    def __init__(self, separator: str = r'\n\s*---\s*\n'):
+        self._separator = re.compile(separator)
+        self._head = []  # Tamamlanmamış bloğun ayraç içeremeyecek baş kısmı
+        self._tail = ''  # Ayracın başlayabileceği son kısım (boşluk ve '-' karakterleri)
+    
+    def feed(self, text: str) -> List[str]:
+        """Metni ekle ve tamamlanan blokları döndür"""
+        return self._split(text, final=False)
+    
+    def close(self) -> List[str]:
+        """Akış bittiğinde kalan blokları (son blok dahil) döndür"""
+        blocks = self._split('', final=True)
+        blocks.append(''.join(self._head) + self._tail)
+        self._head = []
+        self._tail = ''
+        return blocks
+    
+    def _split(self, text: str, final: bool) -> List[str]:
+        buffer = self._tail + text
+        blocks = []
+        position = 0
+        
+        while True:
+            match = self._separator.search(buffer, position)
+            if match is None:
+                break
+            # Ayraçtan sonra boşluk dışı karakter gelmediyse ayraç yeni veriyle uzayabilir
+            if not final and _NON_SPACE.search(buffer, match.end()) is None:
+                break
+            self._head.append(buffer[position:match.start()])
+            blocks.append(''.join(self._head))
+            self._head = []
+            position = match.end()
+        
+        # Sonraki aramada yalnızca ayraç karakterlerinden oluşan kuyruğu tekrar tara
+        tail_start = len(buffer)
+        while tail_start > position and buffer[tail_start - 1] in _SEPARATOR_CHARS:
+            tail_start -= 1
+        if tail_start > position:
+            self._head.append(buffer[position:tail_start])
+        self._tail = buffer[tail_start:]
+        
+        return blocks
+
+
+class DetailFileWriter:
+    """Tembel parse'ta blok metinlerini ayrıntı dosyasına yazar ve konumlarını verir"""
+    
+    def __init__(self, file):
+        self._file = file
+        self.position = 0
+    
+    def add(self, block: str) -> Tuple[int, int]:
+        """Bloğu dosyaya ekle; (başlangıç konumu, byte uzunluğu) döndür"""
+        data = block.encode('utf-8')
+        offset = self.position
+        self._file.write(data)
+        self.position += len(data)
+        return offset, len(data)
+
+
+class StatisticsAccumulator:
+    """Mesaj istatistiklerini mesajları bellekte tutmadan, tek tek ekleyerek biriktirir"""
+    
+    def __init__(self):
+        self.total_messages = 0
+        self.paging_count = 0
+        self.measurement_count = 0
+        self.connection_count = 0
+        self.message_types = {}
+        self.channels = {}
+        self.protocols = {}
+        self.rsrp = {'min': None, 'max': None, 'sum': 0, 'count': 0}
+        self.rsrq = {'min': None, 'max': None, 'sum': 0, 'count': 0}
+    
+    def add(self, msg: Dict[str, Any]):
+        """Bir mesajı istatistiklere ekle"""
+        self.total_messages += 1
+        if msg.get('is_paging', False):
+            self.paging_count += 1
+        if msg.get('is_measurement', False):
+            self.measurement_count += 1
+        if msg.get('is_connection_related', False):
+            self.connection_count += 1
+        
+        msg_identity = msg.get('message_identity', 'Unknown')
+        self.message_types[msg_identity] = self.message_types.get(msg_identity, 0) + 1
+        channel = msg.get('channel', 'Unknown')
+        self.channels[channel] = self.channels.get(channel, 0) + 1
+        protocol = msg.get('protocol', 'Unknown')
+        self.protocols[protocol] = self.protocols.get(protocol, 0) + 1
+        
+        measurements = msg.get('measurements', {})
+        if 'rsrp_values' in measurements:
+            for m in measurements['rsrp_values']:
+                self._add_value(self.rsrp, m['dbm'])
+        if 'rsrq_values' in measurements:
+            for m in measurements['rsrq_values']:
+                self._add_value(self.rsrq, m['db'])
+    
+    @classmethod
+    def from_result(cls, statistics: Dict[str, Any]) -> 'StatisticsAccumulator':
+        """result() / _calculate_statistics çıktısından birikimi yeniden oluştur (birleştirmek için)"""
+        accumulator = cls()
+        accumulator.total_messages = statistics.get('total_messages', 0)
+        accumulator.paging_count = statistics.get('paging_messages', 0)
+        accumulator.measurement_count = statistics.get('measurement_messages', 0)
+        accumulator.connection_count = statistics.get('connection_messages', 0)
+        accumulator.message_types = dict(statistics.get('message_types', {}))
+        accumulator.channels = dict(statistics.get('channels', {}))
+        accumulator.protocols = dict(statistics.get('protocols', {}))
+        for summary, key in ((accumulator.rsrp, 'rsrp_statistics'), (accumulator.rsrq, 'rsrq_statistics')):
+            values = statistics.get(key) or {}
+            if values.get('count'):
+                summary['min'] = values['min']
+                summary['max'] = values['max']
+                summary['sum'] = values['avg'] * values['count']
+                summary['count'] = values['count']
+        return accumulator
+    
+    def merge(self, other: 'StatisticsAccumulator'):
+        """Başka bir birikimi (ör. paralel parse edilen bir dosya aralığını) bu birikime ekle"""
+        self.total_messages += other.total_messages
+        self.paging_count += other.paging_count
+        self.measurement_count += other.measurement_count
+        self.connection_count += other.connection_count
+        
+        for counts, other_counts in ((self.message_types, other.message_types),
+                                     (self.channels, other.channels),
+                                     (self.protocols, other.protocols)):
+            for key, count in other_counts.items():
+                counts[key] = counts.get(key, 0) + count
+        
+        for summary, other_summary in ((self.rsrp, other.rsrp), (self.rsrq, other.rsrq)):
+            if not other_summary['count']:
+                continue
+            if summary['count'] == 0 or other_summary['min'] < summary['min']:
+                summary['min'] = other_summary['min']
+            if summary['count'] == 0 or other_summary['max'] > summary['max']:
+                summary['max'] = other_summary['max']
+            summary['sum'] += other_summary['sum']
+            summary['count'] += other_summary['count']
+    
+    @staticmethod
+    def _add_value(summary: Dict[str, Any], value: float):
+        if summary['count'] == 0 or value < summary['min']:
+            summary['min'] = value
+        if summary['count'] == 0 or value > summary['max']:
+            summary['max'] = value
+        summary['sum'] += value
+        summary['count'] += 1
+    
+    @staticmethod
+    def _summary_result(summary: Dict[str, Any]) -> Dict[str, Any]:
+        if not summary['count']:
+            return {}
+        return {
+            'min': summary['min'],
+            'max': summary['max'],
+            'avg': summary['sum'] / summary['count'],
+            'count': summary['count']
+        }
+    
+    def result(self) -> Dict[str, Any]:
+        """_calculate_statistics ile aynı formatta istatistikleri döndür"""
+        return {
+            'total_messages': self.total_messages,
+            'paging_messages': self.paging_count,
+            'measurement_messages': self.measurement_count,
+            'connection_messages': self.connection_count,
+            'other_messages': self.total_messages - self.paging_count - self.measurement_count - self.connection_count,
+            'message_types': dict(self.message_types),
+            'channels': dict(self.channels),
+            'protocols': dict(self.protocols),
+            'rsrp_statistics': self._summary_result(self.rsrp),
+            'rsrq_statistics': self._summary_result(self.rsrq)
+        }
+
+
+class StreamParser:
+    """Parça parça gelen log byte'larını artımlı olarak parse eder.
+    
+    feed() ile verilen byte'lardan tamamlanan blokları parse eder; mesajlar, istatistikler
+    ve call flow'lar artımlı olarak güncellenir. Bir blok, ardından gelen ayraç ve sonraki
+    bloğun ilk karakteri geldiğinde tamamlanmış sayılır; son blok close() ile parse edilir.
+    .log için sonuç parse_log_file ile aynıdır; .trp için içerik geçerli UTF-8 ise aynıdır.
+    """
+    
+    def __init__(self, parser: 'TemsParser', trp: bool = False, strict: bool = False):
+        self.parser = parser
+        self._trp = trp
+        # strict: geçersiz UTF-8 byte'ları atlamak yerine UnicodeDecodeError ver
+        self._errors = 'strict' if strict else 'ignore'
+        self.reset()
+    
+    def reset(self):
+        """Parse durumunu sıfırla"""
+        self.bytes_fed = 0
+        self.messages = []
+        self.statistics = StatisticsAccumulator()
+        self.call_flows = CallFlowTracker()
+        self.updated_call_flows = []
+        self._skip_first_block = False
+        self._block_number = 0
+        self._splitter = BlockSplitter(self.parser.message_patterns['block_separator'])
+        if self._trp:
+            # TRP: NUL byte'lar decode sonrası silinir
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors=self._errors)
+        else:
+            # _iter_log_text ile aynı decode ve satır sonu dönüşümü
+            self._decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')(errors=self._errors), translate=True)
+    
+    def feed(self, data: bytes) -> List[MessageRecord]:
+        """Byte'ları ekle ve tamamlanan bloklardaki yeni mesajları döndür.
+        
+        Güncellenen call flow'lar updated_call_flows'a yazılır.
+        """
+        self.bytes_fed += len(data)
+        text = self._decode(data)
+        return self._add_blocks(self._splitter.feed(text) if text else [])
+    
+    def close(self) -> List[MessageRecord]:
+        """Akış bittiğinde son bloğu da parse et ve yeni mesajları döndür"""
+        blocks = self._splitter.feed(self._decode(b'', final=True))
+        blocks.extend(self._splitter.close())
+        return self._add_blocks(blocks)
+    
+    def result(self) -> Dict[str, Any]:
+        """Şu ana kadarki sonucu parse_log_file ile aynı formatta döndür"""
+        return {
+            'messages': self.messages,
+            'call_flows': self.call_flows.call_flows,
+            'statistics': self.statistics.result(),
+            'total_messages': len(self.messages)
+        }
+    
+    def _decode(self, data: bytes, final: bool = False) -> str:
+        text = self._decoder.decode(data, final=final)
+        return text.replace('\x00', '') if self._trp else text
+    
+    def _add_blocks(self, blocks: List[str]) -> List[MessageRecord]:
+        new_messages = []
+        updated = {}
+        for block in blocks:
+            if self._skip_first_block:
+                self._skip_first_block = False
+                continue
+            self._block_number += 1
+            messages = self.parser._extract_block_messages(block, self._block_number,
+                                                           len(self.messages) + 1)
+            for message in messages:
+                self.statistics.add(message)
+                for flow in self.call_flows.add(message):
+                    updated[flow['id']] = flow
+            self.messages.extend(messages)
+            new_messages.extend(messages)
+        self.updated_call_flows = list(updated.values())
+        return new_messages
+
+
+class LogFollower(StreamParser):
+    """Yazılmakta olan bir log dosyasını takip eder (canlı drive test kaydı).
+    
+    Her poll() çağrısında yalnızca son okunan byte'tan sonra eklenmiş veriyi okuyup
+    StreamParser'a verir. Dosya kısalırsa (yeniden başlatılan kayıt) takip baştan başlar.
+    """
+    
+    def __init__(self, parser: 'TemsParser', filepath: str, from_start: bool = True):
+        self.filepath = filepath
+        super().__init__(parser, trp=filepath.lower().endswith('.trp'))
+        if not from_start:
+            # Dosyanın sonundan başla; yarım kalmış ilk blok atlanır
+            self.offset = os.path.getsize(filepath)
+            self._skip_first_block = self.offset > 0
+    
+    def reset(self):
+        """Takip durumunu sıfırla ve dosyayı baştan okumaya hazırla"""
+        super().reset()
+        self.offset = 0
+        self.restarted = False
+    
+    def pending_bytes(self) -> int:
+        """Dosyada henüz okunmamış byte sayısı"""
+        return max(os.path.getsize(self.filepath) - self.offset, 0)
+    
+    def poll(self, max_bytes: Optional[int] = None) -> List[MessageRecord]:
+        """Dosyaya eklenen veriyi oku ve tamamlanan bloklardaki yeni mesajları döndür.
+        
+        max_bytes verilirse tek çağrıda en fazla o kadar byte okunur. updated_call_flows bu
+        çağrıda güncellenen flow'ları içerir; dosya kısaldığı için takip baştan başladıysa
+        restarted True olur.
+        """
+        size = os.path.getsize(self.filepath)
+        restarted = size < self.offset
+        if restarted:
+            self.reset()
+        self.restarted = restarted
+        
+        messages = []
+        updated = {}
+        with open(self.filepath, 'rb') as file:
+            file.seek(self.offset)
+            remaining = size - self.offset if max_bytes is None else min(size - self.offset, max_bytes)
+            while remaining > 0:
+                chunk = file.read(min(self.parser.READ_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.offset += len(chunk)
+                remaining -= len(chunk)
+                messages.extend(self.feed(chunk))
+                for flow in self.updated_call_flows:
+                    updated[flow['id']] = flow
+        self.updated_call_flows = list(updated.values())
+        return messages
+    
+    def close(self) -> List[MessageRecord]:
+        """Kayıt bittiğinde son bloğu da parse et ve yeni mesajları döndür"""
+        messages = self.poll()
+        messages.extend(super().close())
+        return messages
+
 
 class TemsParser:
     """Tems log dosyalarını parse eden ve analiz eden sınıf"""
     
-    def __init__(self):
+    # Desteklenen parse motorları: 'regex' mevcut alan-alan arama yolu,
+    # 'fast' her bloğu tek geçişte tarayan önceden derlenmiş motor
+    ENGINES = ('regex', 'fast')
+    
+    # Akış halinde okurken kullanılan parça boyutu (karakter/byte)
+    READ_CHUNK_SIZE = 1024 * 1024
+    
+    # Parse çıktısının formatı değiştiğinde artırılır (parse önbelleği anahtarının parçası)
+    PARSER_VERSION = '9'
+    
+    # Timing analizinde yavaş sayılan istek/yanıt gecikmesi (ms) ve raporlanan en fazla işlem
+    SLOW_OPERATION_MS = 1000
+    MAX_SLOW_OPERATIONS = 50
+    # İstek/yanıt gecikmesi sayılmayan ölçümler (paging'den isteğe geçen süre UE'ye bağlıdır)
+    NON_RESPONSE_LATENCIES = ('paging_to_request', 'paging_to_setup')
+    
+    # raw_content'te hata sayılan anahtar kelimeler (parse sırasında mesajın error_keywords alanına yazılır)
+    ERROR_KEYWORDS = ('error', 'fail', 'reject', 'timeout')
+    
+    # Kanaldan yön çıkmazsa mesaj tipinde aranan adlar (uplink adları önceliklidir)
+    UPLINK_MESSAGES = (
+        'rrcconnectionrequest', 'rrcconnectionsetupcomplete', 'rrcconnectionreconfigurationcomplete',
+        'measurementreport', 'ulhandoverpreparationtransfer', 'ulnastransport', 'initialuemessage',
+        'uplinkdatatransfer', 'rrcconnectionreestablishmentrequest', 'rrcconnectionreestablishmentcomplete',
+        'securitymodecompleterequest', 'uecapabilityinformation', 'attachrequest', 'authenticationresponse',
+        'securitymodecomplete', 'attachcomplete', 'trackingareaupdaterequest'
+    )
+    DOWNLINK_MESSAGES = (
+        'rrcconnectionsetup', 'rrcconnectionreconfiguration', 'rrcconnectionrelease',
+        'dlhandoverpreparationtransfer', 'dlnastransport', 'initialcontextsetupresponse',
+        'downlinkdatatransfer', 'rrcconnectionreestablishment', 'rrcconnectionreestablishmentreject',
+        'securitymodecommand', 'uecapabilityenquiry', 'attachaccept', 'authenticationrequest',
+        'attachreject', 'trackingareaupdateaccept', 'paging'
+    )
+    # NAS ve S1AP bloklarında içerikten yön (uplink ifadeleri önceliklidir)
+    NAS_DIRECTION_KEYWORDS = {
+        'attach request': 'uplink', 'tau request': 'uplink', 'service request': 'uplink',
+        'attach accept': 'downlink', 'tau accept': 'downlink', 'authentication request': 'downlink'
+    }
+    S1AP_DIRECTION_KEYWORDS = {
+        'initial ue message': 'uplink', 'uplink nas transport': 'uplink',
+        'initial context setup': 'downlink', 'downlink nas transport': 'downlink'
+    }
+    
+    # Mesaj türüne özgü açıklamalar; mesaj tipinde ilk geçen (sıradaki ilk) ad kullanılır
+    MESSAGE_SPECIFIC_CONTENT = {
+        'RRCConnectionReconfigurationComplete': {
+            'purpose': 'UE tarafından RRC bağlantı yeniden yapılandırmasının başarıyla tamamlandığını onaylar',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-DCCH',
+            'content_structure': 'RRC Transaction ID, Completion confirmation'
+        },
+        'MeasurementReport': {
+            'purpose': 'Serving ve komşu hücrelerin sinyal kalitesi ölçümlerini raporlar',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-DCCH',
+            'content_structure': 'Measurement ID, RSRP/RSRQ değerleri, PCI listesi'
+        },
+        'RRCConnectionRequest': {
+            'purpose': 'UE tarafından RRC bağlantısı kurma talebi',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-CCCH',
+            'content_structure': 'UE Identity, Establishment Cause'
+        },
+        'Paging': {
+            'purpose': 'Ağ tarafından UE\'yi arama ve uyandırma',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'PCCH',
+            'content_structure': 'Paging Record List, System Info Modification'
+        },
+        'RRCConnectionReconfiguration': {
+            'purpose': 'Radyo kaynakları ve parametrelerinin yeniden yapılandırılması',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'DL-DCCH',
+            'content_structure': 'Radio Resource Config, Mobility Control Info'
+        },
+        'RRCConnectionRelease': {
+            'purpose': 'RRC bağlantısının sonlandırılması ve IDLE moda geçiş',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'DL-DCCH',
+            'content_structure': 'Release Cause, Redirect Info'
+        },
+        'RRCConnectionSetup': {
+            'purpose': 'RRC bağlantısının kurulması ve radyo kaynaklarının atanması',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'DL-CCCH',
+            'content_structure': 'Radio Resource Config, RRC Transaction ID'
+        },
+        'SystemInformationBlockType': {
+            'purpose': 'Hücre ve sistem parametrelerinin yayınlanması',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'BCCH-DL-SCH',
+            'content_structure': 'Cell Access Info, Frequency Info, Neighbor Cell List'
+        },
+        'RRCConnectionSetupComplete': {
+            'purpose': 'RRC bağlantı kurulumunun teyidi ve NAS mesajının iletimi',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-DCCH',
+            'content_structure': 'Selected PLMN, Dedicated Info NAS'
+        },
+        'SecurityModeCommand': {
+            'purpose': 'Güvenlik algoritmaları ve şifreleme parametrelerinin aktivasyonu',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'DL-DCCH',
+            'content_structure': 'Security Config SMC, Ciphering Algorithm, Integrity Algorithm'
+        },
+        'SecurityModeComplete': {
+            'purpose': 'Güvenlik prosedürlerinin başarıyla tamamlandığının onayı',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-DCCH',
+            'content_structure': 'RRC Transaction ID, Security completion confirmation'
+        },
+        'UECapabilityEnquiry': {
+            'purpose': 'UE yeteneklerinin sorgulanması',
+            'direction': 'Downlink (eNB → UE)',
+            'channel': 'DL-DCCH',
+            'content_structure': 'UE Capability Request, RAT Type'
+        },
+        'UECapabilityInformation': {
+            'purpose': 'UE yetenekleri ve desteklenen özelliklerin raporlanması',
+            'direction': 'Uplink (UE → eNB)',
+            'channel': 'UL-DCCH',
+            'content_structure': 'Supported Band List, Category Info, Feature Group Indicators'
+        },
+        'ServiceRequest': {
+            'purpose': 'Çekirdek ağ hizmetlerine erişim talebi',
+            'direction': 'Uplink (UE → MME)',
+            'channel': 'NAS/EMM',
+            'content_structure': 'Service Type, KSI and Sequence Number, Authentication Token'
+        }
+    }
+
+    def __init__(self, engine: str = 'regex'):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Bilinmeyen parse motoru: {engine}")
+        self.engine = engine
+
         self.message_patterns = {
             # LTE RRC log patterns
             'timestamp': r'(\d{6})\s+(\d{2}:\d{2}:\d{2}\.\d{3})',
@@ -25,194 +517,1003 @@ class TemsParser:
             'phys_cell_id': r'physCellId:\s*(\d+)',
             'paging_record': r'pagingRecordList\s*\[\s*(\d+)\s*\]',
             's_tmsi': r'mmec:\s*(\d+).*?m-TMSI:\s*(\d+)\s*\(0x([0-9A-Fa-f]+)\)',
-            'version_info': r'Version:\s*(\d+),\s*RRC Release:\s*(\d+),\s*RRC Version:\s*(\d+)'
+            'version_info': r'Version:\s*(\d+),\s*RRC Release:\s*(\d+),\s*RRC Version:\s*(\d+)',
+            # Blok ayracı ve yeni format başlığı
+            'block_separator': r'\n\s*---\s*\n',
+            'new_format': r'(\d{6})\s+(\d{2}:\d{2}:\d{2}\.\d{3})\s+\[(\w+)\]\s+\[(\w+)\]\s+\[([^\]]+)\]\s+(.+)',
+            # Detay parametreleri
+            'events': r'(?m)Events:\s*\n([^\n]*(?:\n[^\n]*)*?)(?=\n\n|\nLayer|\nProtocol|$)',
+            'layer3_message': r'Layer 3 Message:\s*Message identity:\s*([^\(]+)\s*\([^\)]*\)',
+            'protocol_detail': r'Protocol:\s*(\w+)',
+            'channel_detail': r'Channel:\s*(\w+)',
+            'lte_rrc_version': r'LTE RRC Protocol Version:\s*([\d\.]+)',
+            'nr_rrc_version': r'NR 5G RRC Protocol Version:\s*([\d\.]+)',
+            'rb_id': r'RB Id:\s*(\d+)',
+            'subfn': r'SubFN:\s*(\d+)',
+            'sysfn': r'SysFN:\s*(\d+)'
         }
+        self._compiled_patterns = {name: re.compile(pattern) for name, pattern in self.message_patterns.items()}
+
+        # Hızlı motor için çapa tablosu: pattern adı -> (sabit metin, eşleşme başlangıcına uzaklık).
+        # Bir pattern'in ilk eşleşmesi, çapasının ilk geçtiği yerden önce başlayamaz;
+        # bu yüzden arama doğrudan oradan başlatılır.
+        self._pattern_anchors = {
+            'rrc_message': ('LTE_Uu_RRC:', 0),
+            'message_identity': ('Message identity:', 0),
+            'protocol': ('Protocol:', 0),
+            'channel': ('Channel:', 0),
+            'pci': ('PCI:', 0),
+            'earfcn': ('EARFCN:', 0),
+            'rsrp': ('RSRP:', 0),
+            'rsrq': ('RSRQ:', 0),
+            'rrc_transaction': ('rrc-TransactionIdentifier:', 0),
+            'meas_id': ('measId:', 0),
+            'phys_cell_id': ('physCellId:', 0),
+            's_tmsi': ('mmec:', 0),
+            'version_info': ('Version:', 0),
+            'events': ('Events:', 0),
+            'layer3_message': ('Layer 3 Message:', 0),
+            'protocol_detail': ('Protocol:', 0),
+            'channel_detail': ('Channel:', 0),
+            'lte_rrc_version': ('Version:', len('LTE RRC Protocol ')),
+            'nr_rrc_version': ('Version:', len('NR 5G RRC Protocol ')),
+            'rb_id': ('RB Id:', 0),
+            'subfn': ('SubFN:', 0),
+            'sysfn': ('SysFN:', 0)
+        }
+        self._anchors = sorted({anchor for anchor, _ in self._pattern_anchors.values()})
+        self._specific_content_cache = {}
+        self._trp_separators = {}
+
+        # Anahtar kelime sınıflandırıcıları (tablolar bir kez hazırlanır, metin bir kez küçültülür)
+        self._error_classifier = KeywordClassifier({keyword: keyword for keyword in self.ERROR_KEYWORDS})
+        direction_keywords = {name: 'uplink' for name in self.UPLINK_MESSAGES}
+        direction_keywords.update((name, 'downlink') for name in self.DOWNLINK_MESSAGES
+                                  if name not in direction_keywords)
+        self._direction_classifier = KeywordClassifier(direction_keywords)
+        self._nas_direction_classifier = KeywordClassifier(self.NAS_DIRECTION_KEYWORDS)
+        self._s1ap_direction_classifier = KeywordClassifier(self.S1AP_DIRECTION_KEYWORDS)
+        # 'SIB' adı SystemInformationBlockType açıklamasını kullanır (büyük/küçük harf duyarlı)
+        specific_keywords = {}
+        for name in self.MESSAGE_SPECIFIC_CONTENT:
+            specific_keywords[name] = name
+            if name == 'SystemInformationBlockType':
+                specific_keywords['SIB'] = name
+        self._specific_content_classifier = KeywordClassifier(specific_keywords, case_sensitive=True)
     
-    def parse_log_file(self, filepath: str) -> Dict[str, Any]:
-        """Log dosyasını parse et (.log ve .trp dosyaları desteklenir)"""
+    def parse_log_file(self, filepath: str, workers: int = 1,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       detail_file: Optional[str] = None,
+                       timer: Optional[StageTimer] = None,
+                       search_index: bool = False) -> Dict[str, Any]:
+        """Log dosyasını parse et (.log ve .trp dosyaları desteklenir).
+        
+        workers > 1 ise dosya blok sınırlarına hizalı aralıklara bölünüp süreç havuzunda
+        paralel parse edilir; sonuç sıralı parse ile aynıdır. progress verilirse parse
+        ilerledikçe (işlenen byte, toplam byte) ile çağrılır; fırlattığı hata parse'ı
+        durdurur (iş iptali için).
+        
+        detail_file verilirse parse tembeldir: mesajlar yalnızca özet alanlarını ve blok
+        metninin bu dosyadaki konumunu tutar, ayrıntılar load_message_details ile açılır.
+        
+        timer verilirse aşama süreleri (read/trp_decode, split, extract, index, statistics, merge,
+        call_flows) bu StageTimer'a eklenir.
+        
+        search_index verilirse mesajların raw_content'i üzerinde tam metin indeksi oluşturulur
+        ve sonuca 'search_index' (SearchIndex) olarak eklenir.
+        """
+        if timer is None:
+            timer = StageTimer()
         try:
-            # Dosya uzantısını kontrol et
-            file_extension = filepath.lower().split('.')[-1]
-            
-            if file_extension == 'trp':
-                # .trp dosyası için binary okuma
-                with open(filepath, 'rb') as file:
-                    content = file.read()
-                # .trp dosyasını text'e çevir
-                content = self._parse_trp_content(content)
+            index = None
+            if workers > 1:
+                messages, statistics, index = self._parse_parallel(filepath, workers, progress, detail_file, timer,
+                                                                   search_index)
             else:
-                # .log dosyası için normal okuma
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
-                    content = file.read()
+                builder = SearchIndexBuilder() if search_index else None
+                messages = list(self.iter_messages(filepath, progress, detail_file, timer, builder))
+                if builder is not None:
+                    index = SearchIndex([(builder.build(), 0)])
+                with timer.stage('statistics'):
+                    statistics = StatisticsAccumulator()
+                    for message in messages:
+                        statistics.add(message)
             
-            messages = self._extract_messages(content)
-            call_flows = self._group_by_call_flow(messages)
-            statistics = self._calculate_statistics(messages)
+            with timer.stage('call_flows'):
+                call_flows = self._group_by_call_flow(messages)
             
-            return {
+            result = {
                 'messages': messages,
                 'call_flows': call_flows,
-                'statistics': statistics,
+                'statistics': statistics.result(),
                 'total_messages': len(messages)
             }
+            if detail_file is not None:
+                result['detail_file'] = detail_file
+            if index is not None:
+                result['search_index'] = index
+            return result
             
         except Exception as e:
             raise Exception(f"Log dosyası parse edilirken hata: {str(e)}")
     
-    def _parse_trp_content(self, binary_content):
-        """TRP dosyasının binary içeriğini text formatına çevirir"""
+    def iter_messages(self, filepath: str,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      detail_file: Optional[str] = None,
+                      timer: Optional[StageTimer] = None,
+                      index: Optional[SearchIndexBuilder] = None) -> Iterator[Dict[str, Any]]:
+        """Log dosyasını parça parça okuyup mesajları tek tek üret.
+        
+        Dosya hiçbir zaman tamamen belleğe alınmaz; aynı anda yalnızca bir okuma
+        parçası ve tamamlanmamış blok tutulur. detail_file verilirse yalnızca mesaj
+        özetleri üretilir ve blok metinleri bu dosyaya yazılır. index verilirse mesajlar
+        üretildikçe bu SearchIndexBuilder'a eklenir.
+        """
+        file = open(detail_file, 'wb') if detail_file is not None else None
+        try:
+            writer = DetailFileWriter(file) if file is not None else None
+            yield from self._iter_file_messages(filepath, progress, writer, timer, index)
+        finally:
+            if file is not None:
+                file.close()
+    
+    def parse_log_files(self, sources: List[Tuple[str, str]],
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        detail_file: Optional[str] = None,
+                        timer: Optional[StageTimer] = None,
+                        search_index: bool = False) -> Dict[str, Any]:
+        """Birden fazla log dosyasını (ör. aynı anda kaydedilen UE'ler) tek zaman çizelgesinde birleştir.
+        
+        sources: (dosya yolu, kaynak adı) listesi. Dosyalar iter_messages gibi akış halinde
+        okunur ve mesajlar heapq.merge ile timestamp_ms'e göre birleştirilir; birleştirilmiş
+        liste ayrıca sıralanmaz, aynı zamandaki mesajlar kaynak sırasını korur. Her mesaj
+        source_file ile etiketlenir ve id'ler birleştirilmiş sırada 1'den verilir. Call flow'lar
+        her kaynak için ayrı çıkarılır. progress, detail_file, timer ve search_index parse_log_file'daki
+        gibidir; indeks her kaynak için ayrı segment olarak kurulur.
+        """
+        if timer is None:
+            timer = StageTimer()
+        try:
+            sizes = [os.path.getsize(filepath) for filepath, _ in sources]
+            done = [0] * len(sources)
+            
+            def file_progress(index: int) -> Optional[Callable[[int, int], None]]:
+                if progress is None:
+                    return None
+                def report(position: int, total: int):
+                    done[index] = position
+                    progress(sum(done), sum(sizes))
+                return report
+            
+            counts = {name: 0 for _, name in sources}
+            messages = []
+            builders = [SearchIndexBuilder() if search_index else None for _ in sources]
+            # Kaynak başına yerel id - 1 -> birleştirilmiş id (indeks segmentlerinin eşlemesi)
+            id_maps = [array('q') for _ in sources]
+            file = open(detail_file, 'wb') if detail_file is not None else None
+            try:
+                writer = DetailFileWriter(file) if file is not None else None
+                streams = [self._timeline(index, name, self._iter_file_messages(filepath, file_progress(index),
+                                                                                writer, timer, builders[index]))
+                           for index, (filepath, name) in enumerate(sources)]
+                for _, index, _, message in heapq.merge(*streams):
+                    message['id'] = len(messages) + 1
+                    counts[message['source_file']] += 1
+                    id_maps[index].append(message['id'])
+                    messages.append(message)
+            finally:
+                if file is not None:
+                    file.close()
+            
+            with timer.stage('statistics'):
+                statistics = StatisticsAccumulator()
+                for message in messages:
+                    statistics.add(message)
+            
+            with timer.stage('call_flows'):
+                call_flows = self._group_by_call_flow(messages)
+            
+            result = {
+                'messages': messages,
+                'call_flows': call_flows,
+                'statistics': statistics.result(),
+                'total_messages': len(messages),
+                'sources': [{'name': name, 'total_messages': count} for name, count in counts.items()]
+            }
+            if detail_file is not None:
+                result['detail_file'] = detail_file
+            if search_index:
+                result['search_index'] = SearchIndex([(builder.build(), id_map)
+                                                      for builder, id_map in zip(builders, id_maps)])
+            return result
+            
+        except Exception as e:
+            raise Exception(f"Log dosyaları birleştirilirken hata: {str(e)}")
+    
+    @staticmethod
+    def _timeline(index: int, source_file: str,
+                  messages: Iterable[MessageRecord]) -> Iterator[Tuple[int, int, int, MessageRecord]]:
+        """Kaynağın mesajlarını (birleştirme anahtarı, kaynak sırası, mesaj sırası, mesaj) olarak üret.
+        
+        Zamanı okunamayan mesaj kaynaktaki bir önceki mesajın zamanını alır; böylece kaynak
+        içindeki sırası bozulmaz.
+        """
+        time_ms = -1
+        for position, message in enumerate(messages):
+            if message['timestamp_ms'] is not None:
+                time_ms = message['timestamp_ms']
+            message['source_file'] = source_file
+            yield time_ms, index, position, message
+    
+    def _iter_file_messages(self, filepath: str, progress: Optional[Callable[[int, int], None]],
+                            writer: Optional[DetailFileWriter],
+                            timer: Optional[StageTimer] = None,
+                            index: Optional[SearchIndexBuilder] = None) -> Iterator[MessageRecord]:
+        next_id = 1
+        for block_number, block in enumerate(self._iter_blocks(filepath, progress=progress, timer=timer), 1):
+            if timer is None:
+                messages = self._extract_block_messages(block, block_number, next_id, writer)
+                if index is not None:
+                    self._index_block(index, block, messages)
+            else:
+                start = time.perf_counter()
+                messages = self._extract_block_messages(block, block_number, next_id, writer)
+                index_start = time.perf_counter()
+                timer.add('extract', index_start - start)
+                if index is not None:
+                    self._index_block(index, block, messages)
+                    timer.add('index', time.perf_counter() - index_start)
+            next_id += len(messages)
+            yield from messages
+    
+    @staticmethod
+    def _index_block(index: SearchIndexBuilder, block: str, messages: List[Dict[str, Any]]):
+        """Bloktaki mesajları tam metin indeksine ekle.
+        
+        Tembel parse'ta raw_content üretilmediğinden mesajın blok satırları (bir sonraki mesajın
+        satırına kadar) indekslenir; satırlar strip edilmediği için token'lar raw_content ile aynıdır.
+        """
+        lines = None
+        for position, message in enumerate(messages):
+            text = message.get('raw_content')
+            if not text:
+                if lines is None:
+                    lines = block.split('\n')
+                end = messages[position + 1]['line_number'] - 1 if position + 1 < len(messages) else len(lines)
+                text = '\n'.join(lines[message['line_number'] - 1:end])
+            index.add(message['id'], text)
+    
+    def load_message_details(self, detail_file: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Tembel parse edilmiş mesajın tam kaydını (raw_content, parametreler) ayrıntı dosyasından aç.
+        
+        Konum bilgisi olmayan mesajlar zaten tamdır ve olduğu gibi döndürülür.
+        """
+        if 'source_offset' not in message:
+            return message
+        try:
+            with open(detail_file, 'rb') as file:
+                file.seek(message['source_offset'])
+                block = file.read(message['source_length']).decode('utf-8')
+            return self._detail_record(self._block_records(block, message), message)
+        except Exception as e:
+            raise Exception(f"Mesaj ayrıntıları okunurken hata: {str(e)}")
+    
+    def iter_message_details(self, detail_file: str, messages: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Mesajların tam kayıtlarını sırayla üret; her blok bir kez okunup parse edilir"""
+        with open(detail_file, 'rb') as file:
+            block_offset, records = None, {}
+            for message in messages:
+                if 'source_offset' not in message:
+                    yield message
+                    continue
+                if message['source_offset'] != block_offset:
+                    block_offset = message['source_offset']
+                    file.seek(block_offset)
+                    block = file.read(message['source_length']).decode('utf-8')
+                    records = self._block_records(block, message)
+                yield self._detail_record(records, message)
+    
+    def _block_records(self, block: str, message: Dict[str, Any]) -> Dict[int, MessageRecord]:
+        """Bloğu tam parse et; kayıtları satır numarasına göre döndür"""
+        records = self._extract_block_messages(block, message['block_number'], message['id'])
+        return {record['line_number']: record for record in records}
+    
+    @staticmethod
+    def _detail_record(records: Dict[int, MessageRecord], message: Dict[str, Any]) -> MessageRecord:
+        """Blok kayıtlarından mesajınkini seç; id ve kaynak (source_file) özetten alınır"""
+        record = records[message['line_number']]
+        record['id'] = message['id']
+        if 'source_file' in message:
+            record['source_file'] = message['source_file']
+        return record
+    
+    def save_dataset(self, data: Dict[str, Any], path: str):
+        """Parse sonucunu sütun bazlı ikili dosyaya (.tcol) kaydet.
+        
+        Tembel parse sonuçlarında mesajların tam kayıtları ayrıntı dosyasından açılarak yazılır.
+        """
+        try:
+            if data.get('detail_file'):
+                data = dict(data, messages=list(self.iter_message_details(data['detail_file'], data['messages'])))
+            columnar_file.save_dataset(data, path)
+        except Exception as e:
+            raise Exception(f"Veri seti kaydedilirken hata: {str(e)}")
+    
+    def load_dataset(self, path: str) -> Dict[str, Any]:
+        """save_dataset ile kaydedilen dosyayı parse_log_file ile aynı yapıda aç.
+        
+        Dosya bellek eşlemeli açılır; mesajlar erişildikçe oluşturulur, filtre sütunları
+        doğrudan dosyadan okunur.
+        """
+        try:
+            return columnar_file.load_dataset(path)
+        except Exception as e:
+            raise Exception(f"Veri seti açılırken hata: {str(e)}")
+    
+    def follow(self, filepath: str, from_start: bool = True) -> 'LogFollower':
+        """Yazılmakta olan log dosyası için artımlı takip nesnesi oluştur.
+        
+        from_start False ise yalnızca bundan sonra eklenen bloklar parse edilir.
+        """
+        return LogFollower(self, filepath, from_start)
+    
+    def _parse_parallel(self, filepath: str, workers: int,
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        detail_file: Optional[str] = None,
+                        timer: Optional[StageTimer] = None,
+                        search_index: bool = False
+                        ) -> Tuple[List[Dict[str, Any]], 'StatisticsAccumulator', Optional[SearchIndex]]:
+        """Dosyayı byte aralıklarına bölüp süreç havuzunda parse et ve sonuçları birleştir.
+        
+        Tembel parse'ta her aralık kendi ayrıntı dosyasına yazar; parçalar sırayla
+        detail_file'da birleştirilir. İşçilerin aşama süreleri timer'a toplanır. search_index
+        verilirse her aralık kendi indeks segmentini kurar; segmentler id kaydırmasıyla birleşir.
+        """
+        if timer is None:
+            timer = StageTimer()
+        with timer.stage('plan'):
+            encoding, boundaries = self._plan_byte_ranges(filepath, workers)
+        ranges = list(zip(boundaries, boundaries[1:]))
+        
+        messages = []
+        statistics = StatisticsAccumulator()
+        segments = []
+        block_offset = 0
+        
+        # Tek aralık doğrudan detail_file'a yazar; birden fazla aralık sırayla birleştirilecek parçalara
+        part_files = [f'{detail_file}.{index}' for index in range(len(ranges))] \
+            if detail_file is not None and len(ranges) > 1 else []
         try:
-            # TRP dosyası genellikle UTF-8 veya ASCII encoding kullanır
-            # Önce UTF-8 deneyelim
+            if len(ranges) == 1:
+                results = [_parse_byte_range(self.engine, filepath, 0, boundaries[-1], encoding, detail_file,
+                                             search_index)]
+                if progress is not None:
+                    progress(boundaries[-1], boundaries[-1])
+            else:
+                results = self._parse_ranges(filepath, workers, ranges, boundaries[-1], encoding, part_files, progress,
+                                             search_index)
+            
+            # Aralık içi id ve blok numaralarını (ve ayrıntı konumlarını) global değerlere kaydır
+            merge_start = time.perf_counter()
+            output = open(detail_file, 'wb') if part_files else None
             try:
-                content = binary_content.decode('utf-8')
-            except UnicodeDecodeError:
-                # UTF-8 başarısız olursa latin-1 deneyelim
+                detail_offset = 0
+                for index, (range_messages, block_count, range_statistics, range_seconds,
+                            segment) in enumerate(results):
+                    timer.merge(range_seconds)
+                    id_offset = len(messages)
+                    if segment is not None:
+                        segments.append((segment, id_offset))
+                    for message in range_messages:
+                        message['id'] += id_offset
+                        message['block_number'] += block_offset
+                        if detail_offset and 'source_offset' in message:
+                            message['source_offset'] += detail_offset
+                    messages.extend(range_messages)
+                    block_offset += block_count
+                    statistics.merge(range_statistics)
+                    if output is not None:
+                        with open(part_files[index], 'rb') as part:
+                            shutil.copyfileobj(part, output)
+                        detail_offset = output.tell()
+            finally:
+                if output is not None:
+                    output.close()
+            timer.add('merge', time.perf_counter() - merge_start)
+        finally:
+            for part_file in part_files:
+                if os.path.exists(part_file):
+                    os.remove(part_file)
+        
+        return messages, statistics, SearchIndex(segments) if search_index else None
+    
+    def _parse_ranges(self, filepath: str, workers: int, ranges: List[Tuple[int, int]], size: int,
+                      encoding: Optional[str], part_files: List[str],
+                      progress: Optional[Callable[[int, int], None]],
+                      search_index: bool = False) -> List[tuple]:
+        """Aralıkları süreç havuzunda parse et; sonuçları aralık sırasıyla döndür"""
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+            futures = {pool.submit(_parse_byte_range, self.engine, filepath, start, end, encoding,
+                                   part_files[index] if part_files else None, search_index): end - start
+                       for index, (start, end) in enumerate(ranges)}
+            if progress is not None:
+                done = 0
                 try:
-                    content = binary_content.decode('latin-1')
-                except UnicodeDecodeError:
-                    # Son çare olarak errors='ignore' ile decode edelim
-                    content = binary_content.decode('utf-8', errors='ignore')
+                    for future in as_completed(futures):
+                        done += futures[future]
+                        progress(done, size)
+                except BaseException:
+                    # İptal: henüz başlamamış aralıkları çalıştırma
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+            return [future.result() for future in futures]
+    
+    def _plan_byte_ranges(self, filepath: str, parts: int) -> Tuple[Optional[str], List[int]]:
+        """Dosyayı yaklaşık eşit, blok ayraçlarına hizalı byte aralıklarına böl.
+        
+        (encoding, sınırlar) döndürür; encoding yalnızca .trp dosyaları için belirlenir.
+        """
+        is_trp = filepath.lower().split('.')[-1] == 'trp'
+        
+        with open(filepath, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < self.READ_CHUNK_SIZE or parts < 2:
+                return (self._trp_encoding(filepath) if is_trp else None), [0, size]
             
-            # TRP dosyalarında genellikle null byte'lar olabilir, bunları temizleyelim
-            content = content.replace('\x00', '')
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if is_trp:
+                    encoding = self._trp_encoding(filepath, buffer)
+                    separator = self._trp_separator(encoding)
+                    spaces, newlines = _LOG_CUT_SPACES + b'\x00', b'\n'
+                else:
+                    encoding = None
+                    separator = _LOG_CUT_SEPARATOR
+                    spaces, newlines = _LOG_CUT_SPACES, b'\r\n'
+                
+                boundaries = [0]
+                for part in range(1, parts):
+                    offset = max(size * part // parts, boundaries[-1] + 1)
+                    cut = self._find_block_boundary(buffer, offset, separator, spaces, newlines)
+                    if cut is None:
+                        break
+                    if cut > boundaries[-1]:
+                        boundaries.append(cut)
+                boundaries.append(size)
+        
+        return encoding, boundaries
+    
+    @staticmethod
+    def _find_block_boundary(buffer, offset: int, separator, spaces: bytes, newlines: bytes) -> Optional[int]:
+        """offset'ten sonra, tüm dosya bölündüğünde de bir ayracın başladığı kesin olan ilk konumu bul"""
+        while True:
+            match = separator.search(buffer, offset)
+            if match is None:
+                return None
             
-            # Eğer içerik boşsa veya çok kısaysa hata ver
-            if len(content.strip()) < 10:
-                raise Exception("TRP dosyası içeriği çok kısa veya boş")
+            # Ayraç, önündeki boşluk dizisinin ilk satır sonunda başlar
+            run_start = match.start()
+            while run_start > 0 and buffer[run_start - 1] in spaces:
+                run_start -= 1
             
-            return content
+            # Önceki karakter '-' ise bir önceki ayraçla çakışabilir; ASCII değilse (çok byte'lı
+            # boşluk ya da decode sırasında atlanan byte) dizinin gerçek başı belirsizdir
+            if run_start == 0 or (buffer[run_start - 1] != ord('-') and buffer[run_start - 1] < 0x80):
+                while buffer[run_start] not in newlines:
+                    run_start += 1
+                return run_start
             
+            offset = match.end()
+    
+    def _iter_blocks(self, filepath: str, start: int = 0, end: Optional[int] = None,
+                     encoding: Optional[str] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     timer: Optional[StageTimer] = None) -> Iterator[str]:
+        """Dosyadaki "---" ile ayrılmış blokları sırayla üret (.log ve .trp dosyaları desteklenir).
+        
+        start/end verilirse yalnızca o byte aralığı okunur; start > 0 olan aralıklar bir
+        ayraçla başladığından ilk parça boştur. progress verilirse yaklaşık her okuma
+        parçasında (okunan byte konumu, aralık sonu) ile çağrılır. timer verilirse okuma
+        ('read'; .trp'de blok bulma ve decode 'trp_decode') ve bölme ('split') süreleri eklenir.
+        """
+        # Dosya uzantısını kontrol et
+        file_extension = filepath.lower().split('.')[-1]
+        
+        if file_extension == 'trp':
+            blocks = self._iter_trp_blocks(filepath, start, end, encoding, progress)
+            yield from (blocks if timer is None else timer.timed('trp_decode', blocks))
+            return
+        
+        splitter = BlockSplitter(self.message_patterns['block_separator'])
+        texts = self._iter_log_text(filepath, start, end, progress)
+        if timer is None:
+            for text in texts:
+                yield from splitter.feed(text)
+            yield from splitter.close()
+            return
+        
+        for text in timer.timed('read', texts):
+            with timer.stage('split'):
+                blocks = splitter.feed(text)
+            yield from blocks
+        with timer.stage('split'):
+            blocks = splitter.close()
+        yield from blocks
+    
+    def _iter_log_text(self, filepath: str, start: int = 0, end: Optional[int] = None,
+                       progress: Optional[Callable[[int, int], None]] = None) -> Iterator[str]:
+        """.log dosyasını parça parça text olarak oku.
+        
+        open(filepath, 'r', encoding='utf-8', errors='ignore') ile aynı decode ve satır sonu
+        dönüşümünü uygular, ancak yalnızca [start, end) byte aralığını okuyabilir.
+        """
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(errors='ignore'), translate=True)
+        with open(filepath, 'rb') as file:
+            file.seek(start)
+            remaining = None if end is None else end - start
+            total = end if end is not None else os.fstat(file.fileno()).st_size
+            while True:
+                size = self.READ_CHUNK_SIZE if remaining is None else min(self.READ_CHUNK_SIZE, remaining)
+                chunk = file.read(size) if size > 0 else b''
+                if remaining is not None:
+                    remaining -= len(chunk)
+                if progress is not None:
+                    progress(file.tell(), total)
+                text = decoder.decode(chunk, final=not chunk)
+                if text:
+                    yield text
+                if not chunk:
+                    break
+    
+    def _iter_trp_blocks(self, filepath: str, start: int = 0, end: Optional[int] = None,
+                         encoding: Optional[str] = None,
+                         progress: Optional[Callable[[int, int], None]] = None) -> Iterator[str]:
+        """TRP dosyasını mmap ile açıp blokları doğrudan byte tamponu üzerinde bul.
+        
+        Yalnızca mesaja dönüştürülen blok dilimleri kopyalanır, NUL byte'ları temizlenir
+        ve decode edilir; bloklar, dosyanın tamamı decode edilip NUL byte'ları silindikten
+        sonra blok ayracıyla bölünmesiyle elde edilenlerle aynıdır.
+        """
+        try:
+            with open(filepath, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    raise Exception("TRP dosyası içeriği çok kısa veya boş")
+                
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    if encoding is None:
+                        encoding = self._trp_encoding(filepath, buffer)
+                    if end is None:
+                        end = len(buffer)
+                    
+                    position = start
+                    next_report = start + self.READ_CHUNK_SIZE
+                    for match in self._trp_separator(encoding).finditer(buffer, start, end):
+                        yield buffer[position:match.start()].decode(encoding).replace('\x00', '')
+                        position = match.end()
+                        if progress is not None and position >= next_report:
+                            progress(position, end)
+                            next_report = position + self.READ_CHUNK_SIZE
+                    yield buffer[position:end].decode(encoding).replace('\x00', '')
+                    if progress is not None:
+                        progress(end, end)
+                    
         except Exception as e:
             raise Exception(f"TRP dosyası parse edilirken hata: {str(e)}")
     
-    def _extract_messages(self, content: str) -> List[Dict[str, Any]]:
-        """Log içeriğinden mesajları çıkar"""
+    def _trp_encoding(self, filepath: str, buffer=None) -> str:
+        """TRP dosyasının encoding'ini belirle; içerik çok kısaysa hata ver"""
+        if buffer is None:
+            with open(filepath, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    raise Exception("TRP dosyası içeriği çok kısa veya boş")
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return self._trp_encoding(filepath, buffer)
+        
+        encoding = self._detect_trp_encoding(buffer)
+        # Eğer içerik boşsa veya çok kısaysa hata ver
+        if not self._trp_has_content(buffer, encoding):
+            raise Exception("TRP dosyası içeriği çok kısa veya boş")
+        return encoding
+    
+    def _detect_trp_encoding(self, buffer) -> str:
+        """Tamponun tamamı geçerli UTF-8 ise 'utf-8', değilse 'latin-1' döndür"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        try:
+            for start in range(0, len(buffer), self.READ_CHUNK_SIZE):
+                decoder.decode(buffer[start:start + self.READ_CHUNK_SIZE])
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return 'latin-1'
+        return 'utf-8'
+    
+    def _trp_has_content(self, buffer, encoding: str) -> bool:
+        """NUL'lar temizlenmiş içeriğin strip() sonrası en az 10 karakter olup olmadığını kontrol et"""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        text = ''
+        for start in range(0, len(buffer) + 1, self.READ_CHUNK_SIZE):
+            chunk = buffer[start:start + self.READ_CHUNK_SIZE]
+            # Baştaki boşluklar sonucu etkilemez, tutulmasına gerek yok
+            text = (text + decoder.decode(chunk, final=not chunk).replace('\x00', '')).lstrip()
+            if len(text.rstrip()) >= 10:
+                return True
+        return False
+    
+    def _trp_separator(self, encoding: str):
+        """Blok ayracının (\\n\\s*---\\s*\\n) verilen encoding'deki byte karşılığı.
+        
+        NUL byte'lar decode sonrası silindiği için ayracın her yerinde yok sayılır.
+        """
+        separator = self._trp_separators.get(encoding)
+        if separator is None:
+            space_bytes = set()
+            for char in _WHITESPACE_CHARS + '\x00':
+                try:
+                    space_bytes.add(re.escape(char.encode(encoding)))
+                except UnicodeEncodeError:
+                    continue
+            space = b'(?:' + b'|'.join(sorted(space_bytes, key=len, reverse=True)) + b')*'
+            separator = re.compile(b'\n' + space + b'-\x00*-\x00*-' + space + b'\n')
+            self._trp_separators[encoding] = separator
+        return separator
+    
+    def _extract_block_messages(self, block: str, block_number: int, first_id: int,
+                                writer: Optional[DetailFileWriter] = None) -> List[MessageRecord]:
+        """Tek bir bloktan mesajları çıkar; mesaj id'leri first_id'den başlar.
+        
+        writer verilirse (tembel parse) motordan bağımsız olarak yalnızca özetler çıkarılır.
+        """
+        if writer is not None:
+            return self._extract_block_summaries(block, block_number, first_id, writer)
+        if self.engine == 'fast':
+            return self._extract_block_messages_fast(block, block_number, first_id)
+        
         messages = []
+        if not block.strip():
+            return messages
+            
+        # Yeni format kontrolü: [PROTOCOL] [DIRECTION] [SOURCE->DEST] MESSAGE
+        new_format_match = re.search(self.message_patterns['new_format'], block)
+        
+        if new_format_match:
+            messages.append(self._build_new_format_message(new_format_match, block, first_id, block_number))
+            return messages
         
-        # "---" ile ayrılmış blokları bul
-        message_blocks = re.split(r'\n\s*---\s*\n', content)
+        # Eski format için mevcut kod
+        lines = block.split('\n')
+        current_message = None
+        message_buffer = []
         
-        for block_idx, block in enumerate(message_blocks):
-            if not block.strip():
+        for i, line in enumerate(lines):
+            line = line.strip()
+            if not line:
                 continue
-                
-            # Yeni format kontrolü: [PROTOCOL] [DIRECTION] [SOURCE->DEST] MESSAGE
-            new_format_match = re.search(r'(\d{6})\s+(\d{2}:\d{2}:\d{2}\.\d{3})\s+\[(\w+)\]\s+\[(\w+)\]\s+\[([^\]]+)\]\s+(.+)', block)
             
-            if new_format_match:
-                # Yeni format mesajı
-                timestamp_num = new_format_match.group(1)
-                timestamp_time = new_format_match.group(2)
-                protocol = new_format_match.group(3)
-                direction = new_format_match.group(4)
-                source_dest = new_format_match.group(5)
-                message_content = new_format_match.group(6)
-                
-                # Mesaj tipini çıkar
-                message_type = 'Unknown'
-                if ':' in message_content:
-                    message_type = message_content.split(':')[0].strip()
+            # Timestamp kontrolü - yeni mesaj başlangıcı
+            timestamp_match = re.search(self.message_patterns['timestamp'], line)
+            if timestamp_match:
+                # Önceki mesajı kaydet
+                if current_message and message_buffer:
+                    current_message['raw_content'] = '\n'.join(message_buffer)
+                    current_message['error_keywords'] = self._error_classifier.matches(current_message['raw_content'])
+                    messages.append(current_message)
                 
-                # Source ve destination'ı parse et
-                source = 'Unknown'
-                destination = 'Unknown'
-                if '->' in source_dest:
-                    parts = source_dest.split('->')
-                    source = parts[0].strip()
-                    destination = parts[1].strip()
+                # Yeni mesaj başlat
+                timestamp_num = timestamp_match.group(1)
+                timestamp_time = timestamp_match.group(2)
                 
                 current_message = {
-                    'id': len(messages) + 1,
+                    'id': first_id + len(messages),
                     'timestamp': f"{timestamp_num} {timestamp_time}",
                     'timestamp_num': timestamp_num,
                     'timestamp_time': timestamp_time,
-                    'line_number': 1,
-                    'block_number': block_idx + 1,
-                    'message_type': message_type,
-                    'protocol_type': protocol,
-                    'channel': direction,
-                    'message_identity': message_type,
-                    'protocol': protocol,
-                    'source': source,
-                    'destination': destination,
-                    'pci': None,
-                    'earfcn': None,
-                    'rrc_transaction_id': None,
-                    'is_paging': 'paging' in message_content.lower(),
-                    'is_measurement': False,
-                    'is_connection_related': 'service request' in message_content.lower(),
-                    'parameters': {
-                        'direction': direction.lower(),
-                        'source_dest': source_dest,
-                        'content': message_content,
-                        'protocol_detail': protocol,
-                        'channel_detail': direction
-                    },
-                    'measurements': {},
-                    'paging_info': {},
-                    'raw_content': block.strip()
+                    'line_number': i + 1,
+                    'block_number': block_number,
+                    'message_type': self._extract_lte_message_type(line),
+                    'protocol_type': 'LTE_RRC',
+                    'channel': self._extract_channel(block),
+                    'message_identity': self._extract_message_identity(block),
+                    'protocol': self._extract_protocol(block),
+                    'pci': self._extract_pci(block),
+                    'earfcn': self._extract_earfcn(block),
+                    'rrc_transaction_id': self._extract_rrc_transaction(block),
+                    'is_paging': self._is_paging_message(block),
+                    'is_measurement': self._is_measurement_message(block),
+                    'is_connection_related': self._is_connection_related(block),
+                    'parameters': self._extract_lte_parameters(block),
+                    'measurements': self._extract_measurements(block),
+                    'paging_info': self._extract_paging_info(block)
                 }
-                messages.append(current_message)
+                message_buffer = [line]
+            else:
+                # Mevcut mesaja ekle
+                if current_message:
+                    message_buffer.append(line)
+        
+        # Son mesajı kaydet
+        if current_message and message_buffer:
+            current_message['raw_content'] = '\n'.join(message_buffer)
+            current_message['error_keywords'] = self._error_classifier.matches(current_message['raw_content'])
+            messages.append(current_message)
+        
+        return [MessageRecord.from_dict(message) for message in messages]
+    
+    def _build_new_format_message(self, new_format_match, block: str, message_id: int, block_number: int) -> MessageRecord:
+        """Yeni format ([PROTOCOL] [DIRECTION] [SOURCE->DEST]) bloğundan mesaj oluştur"""
+        timestamp_num = new_format_match.group(1)
+        timestamp_time = new_format_match.group(2)
+        protocol = new_format_match.group(3)
+        direction = new_format_match.group(4)
+        source_dest = new_format_match.group(5)
+        message_content = new_format_match.group(6)
+        
+        # Mesaj tipini çıkar
+        message_type = 'Unknown'
+        if ':' in message_content:
+            message_type = message_content.split(':')[0].strip()
+        
+        # Source ve destination'ı parse et
+        source = 'Unknown'
+        destination = 'Unknown'
+        if '->' in source_dest:
+            parts = source_dest.split('->')
+            source = parts[0].strip()
+            destination = parts[1].strip()
+        
+        return MessageRecord(
+            id=message_id,
+            timestamp_num=timestamp_num,
+            timestamp_time=timestamp_time,
+            line_number=1,
+            block_number=block_number,
+            message_type=message_type,
+            protocol_type=protocol,
+            channel=direction,
+            message_identity=message_type,
+            protocol=protocol,
+            source=source,
+            destination=destination,
+            is_paging='paging' in message_content.lower(),
+            is_measurement=False,
+            is_connection_related='service request' in message_content.lower(),
+            parameters_head=freeze({
+                'direction': direction.lower(),
+                'source_dest': source_dest,
+                'content': message_content,
+                'protocol_detail': protocol,
+                'channel_detail': direction
+            }),
+            raw_content=block.strip(),
+            error_keywords=self._error_classifier.matches(block)
+        )
+    
+    def _extract_block_messages_fast(self, block: str, block_number: int, first_id: int) -> List[MessageRecord]:
+        """Önceden derlenmiş motor: blok alanları blok başına bir kez hesaplanır.
+        
+        Çıktı 'regex' motoruyla birebir aynıdır.
+        """
+        messages = []
+        if not block.strip():
+            return messages
+        
+        # Yeni format '[' içermeden eşleşemez; büyük eski format bloklarında regex'i atla
+        new_format_match = self._compiled_patterns['new_format'].search(block) if '[' in block else None
+        if new_format_match:
+            messages.append(self._build_new_format_message(new_format_match, block, first_id, block_number))
+            return messages
+        
+        timestamp_regex = self._compiled_patterns['timestamp']
+        header_regex = self._compiled_patterns['message_header']
+        fields = None
+        current_message = None
+        message_buffer = []
+        
+        for i, line in enumerate(block.split('\n')):
+            line = line.strip()
+            if not line:
                 continue
             
-            # Eski format için mevcut kod
-            lines = block.split('\n')
-            current_message = None
-            message_buffer = []
-            
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    continue
+            # Zaman damgası '.' içermeden eşleşemez; ucuz ön kontrol regex'i çoğu satırda atlatır
+            timestamp_match = timestamp_regex.search(line) if '.' in line else None
+            if timestamp_match:
+                if current_message and message_buffer:
+                    current_message['raw_content'] = '\n'.join(message_buffer)
+                    current_message['error_keywords'] = self._error_classifier.matches(current_message['raw_content'])
+                    messages.append(current_message)
                 
-                # Timestamp kontrolü - yeni mesaj başlangıcı
-                timestamp_match = re.search(self.message_patterns['timestamp'], line)
-                if timestamp_match:
-                    # Önceki mesajı kaydet
-                    if current_message and message_buffer:
-                        current_message['raw_content'] = '\n'.join(message_buffer)
-                        messages.append(current_message)
-                    
-                    # Yeni mesaj başlat
-                    timestamp_num = timestamp_match.group(1)
-                    timestamp_time = timestamp_match.group(2)
-                    
-                    current_message = {
-                        'id': len(messages) + 1,
-                        'timestamp': f"{timestamp_num} {timestamp_time}",
-                        'timestamp_num': timestamp_num,
-                        'timestamp_time': timestamp_time,
-                        'line_number': i + 1,
-                        'block_number': block_idx + 1,
-                        'message_type': self._extract_lte_message_type(line),
-                        'protocol_type': 'LTE_RRC',
-                        'channel': self._extract_channel(block),
-                        'message_identity': self._extract_message_identity(block),
-                        'protocol': self._extract_protocol(block),
-                        'pci': self._extract_pci(block),
-                        'earfcn': self._extract_earfcn(block),
-                        'rrc_transaction_id': self._extract_rrc_transaction(block),
-                        'is_paging': self._is_paging_message(block),
-                        'is_measurement': self._is_measurement_message(block),
-                        'is_connection_related': self._is_connection_related(block),
-                        'parameters': self._extract_lte_parameters(block),
-                        'measurements': self._extract_measurements(block),
-                        'paging_info': self._extract_paging_info(block)
-                    }
-                    message_buffer = [line]
-                else:
-                    # Mevcut mesaja ekle
-                    if current_message:
-                        message_buffer.append(line)
-            
-            # Son mesajı kaydet
-            if current_message and message_buffer:
-                current_message['raw_content'] = '\n'.join(message_buffer)
-                messages.append(current_message)
+                # Blok alanları bloktaki tüm mesajlar için aynıdır ve değiştirilemez; bir kez hesapla
+                if fields is None:
+                    fields = self._scan_block(block)
+                
+                header_match = header_regex.search(line)
+                current_message = MessageRecord(
+                    id=first_id + len(messages),
+                    timestamp_num=timestamp_match.group(1),
+                    timestamp_time=timestamp_match.group(2),
+                    line_number=i + 1,
+                    block_number=block_number,
+                    message_type=header_match.group(2) if header_match else 'Unknown',
+                    protocol_type='LTE_RRC',
+                    **fields
+                )
+                message_buffer = [line]
+            elif current_message:
+                message_buffer.append(line)
+        
+        if current_message and message_buffer:
+            current_message['raw_content'] = '\n'.join(message_buffer)
+            current_message['error_keywords'] = self._error_classifier.matches(current_message['raw_content'])
+            messages.append(current_message)
         
         return messages
     
+    def _extract_block_summaries(self, block: str, block_number: int, first_id: int,
+                                 writer: DetailFileWriter) -> List[MessageRecord]:
+        """Tembel parse: bloktaki mesajların yalnızca özet alanlarını çıkar.
+        
+        raw_content ve ayrıntılı parametreler üretilmez; blok metni writer ile ayrıntı dosyasına
+        yazılır ve mesajlar source_offset/source_length ile bloğun konumunu tutar (ayrıntılar
+        load_message_details ile açılır). Hata anahtar kelimeleri, yön, ölçümler ve paging
+        bilgisi tam parse ile aynıdır. Tek satırlık yeni format mesajları tam haliyle döner.
+        """
+        messages = []
+        if not block.strip():
+            return messages
+        
+        new_format_match = self._compiled_patterns['new_format'].search(block) if '[' in block else None
+        if new_format_match:
+            messages.append(self._build_new_format_message(new_format_match, block, first_id, block_number))
+            return messages
+        
+        timestamp_regex = self._compiled_patterns['timestamp']
+        header_regex = self._compiled_patterns['message_header']
+        fields = None
+        starts = []  # (mesaj, satırın bloktaki konumu, satır indeksi)
+        lines = block.split('\n')
+        position = 0
+        for i, line in enumerate(lines):
+            line_start = position
+            position += len(line) + 1
+            line = line.strip()
+            if not line:
+                continue
+            timestamp_match = timestamp_regex.search(line) if '.' in line else None
+            if timestamp_match:
+                if fields is None:
+                    fields = self._scan_block(block, details=False)
+                header_match = header_regex.search(line)
+                message = MessageRecord(
+                    id=first_id + len(starts),
+                    timestamp_num=timestamp_match.group(1),
+                    timestamp_time=timestamp_match.group(2),
+                    line_number=i + 1,
+                    block_number=block_number,
+                    message_type=header_match.group(2) if header_match else 'Unknown',
+                    protocol_type='LTE_RRC',
+                    **fields
+                )
+                starts.append((message, line_start, i))
+        
+        if not starts:
+            return messages
+        offset, length = writer.add(block)
+        for index, (message, start, line_index) in enumerate(starts):
+            end = starts[index + 1][1] if index + 1 < len(starts) else len(block)
+            # Anahtar kelimeler boşluk içermediğinden satırların strip edilip birleştirilmesi
+            # sonucu değiştirmez; raw_content yerine bloğun ilgili dilimi taranır
+            message['error_keywords'] = self._error_classifier.matches(block[start:end])
+            if message.message_identity in RAW_CONTENT_IDENTITIES:
+                last = starts[index + 1][2] if index + 1 < len(starts) else len(lines)
+                message['raw_content'] = '\n'.join(
+                    line for line in (line.strip() for line in lines[line_index:last]) if line)
+            message['source_offset'] = offset
+            message['source_length'] = length
+            messages.append(message)
+        return messages
+    
+    def _scan_block(self, block: str, details: bool = True) -> Dict[str, Any]:
+        """Blok seviyesindeki tüm alanları tek seferde çıkar (her pattern en fazla bir kez çalışır).
+        
+        details False ise (tembel parse) parametrelerden yalnızca filtrelerde kullanılan yön çıkarılır.
+        """
+        # Her çapanın ilk konumu; bulunamayan çapanın pattern'i hiç çalıştırılmaz
+        anchor_positions = {anchor: block.find(anchor) for anchor in self._anchors}
+        
+        def search(name):
+            anchor, offset = self._pattern_anchors[name]
+            position = anchor_positions[anchor]
+            if position < 0:
+                return None
+            return self._compiled_patterns[name].search(block, max(0, position - offset))
+        
+        def findall(name):
+            anchor, offset = self._pattern_anchors[name]
+            position = anchor_positions[anchor]
+            if position < 0:
+                return []
+            return self._compiled_patterns[name].findall(block, max(0, position - offset))
+        
+        channel_match = search('channel')
+        identity_match = search('message_identity')
+        protocol_match = search('protocol')
+        pci_match = search('pci')
+        earfcn_match = search('earfcn')
+        transaction_match = search('rrc_transaction')
+        channel = channel_match.group(1) if channel_match else 'Unknown'
+        protocol = protocol_match.group(1) if protocol_match else 'Unknown'
+        is_paging = 'Paging' in block or 'PCCH' in block
+        
+        # Parametreler (_extract_lte_parameters ile aynı anahtar sırası): mesaja özgü baş kısım,
+        # mesaj türünün paylaşılan açıklaması (DESCRIPTORS) ve yön ile başlayan son kısım
+        parameters_head = {}
+        descriptor_id = -1
+        header_match = self._compiled_patterns['message_header'].search(block)
+        message_type = header_match.group(2) if header_match else 'Unknown'
+        if details:
+            version_match = search('version_info')
+            if version_match:
+                parameters_head['version'] = version_match.group(1)
+                parameters_head['rrc_release'] = version_match.group(2)
+                parameters_head['rrc_version'] = version_match.group(3)
+            rrc_match = search('rrc_message')
+            if rrc_match:
+                parameters_head['rrc_message_type'] = rrc_match.group(1)
+            
+            descriptor_id = self._specific_content_cache.get(message_type)
+            if descriptor_id is None:
+                descriptor_id = DESCRIPTORS.register(self._get_message_specific_content(message_type, block))
+                self._specific_content_cache[message_type] = descriptor_id
+        parameters_tail = {'direction': self._extract_message_direction(block, protocol, channel, message_type)}
+        
+        if details:
+            for name in ('events', 'layer3_message'):
+                match = search(name)
+                if match:
+                    parameters_tail[name] = match.group(1).strip()
+            for name in ('protocol_detail', 'channel_detail', 'lte_rrc_version', 'nr_rrc_version', 'rb_id', 'subfn', 'sysfn'):
+                match = search(name)
+                if match:
+                    parameters_tail[name] = match.group(1)
+        
+        # Ölçümler (_extract_measurements ile aynı anahtar sırası)
+        measurements = {}
+        rsrp_matches = findall('rsrp')
+        if rsrp_matches:
+            measurements['rsrp_values'] = [{'raw': int(m[0]), 'dbm': float(m[1])} for m in rsrp_matches]
+        rsrq_matches = findall('rsrq')
+        if rsrq_matches:
+            measurements['rsrq_values'] = [{'raw': int(m[0]), 'db': float(m[1])} for m in rsrq_matches]
+        meas_id_match = search('meas_id')
+        if meas_id_match:
+            measurements['meas_id'] = int(meas_id_match.group(1))
+        phys_cell_matches = findall('phys_cell_id')
+        if phys_cell_matches:
+            measurements['neighbor_cells'] = [int(cell_id) for cell_id in phys_cell_matches]
+        
+        paging_info = {}
+        if is_paging:
+            s_tmsi_matches = findall('s_tmsi')
+            if s_tmsi_matches:
+                paging_info['paging_records'] = [
+                    {'mmec': int(match[0]), 'm_tmsi': int(match[1]), 'm_tmsi_hex': match[2]}
+                    for match in s_tmsi_matches
+                ]
+        
+        return {
+            'channel': channel,
+            'message_identity': identity_match.group(1).strip() if identity_match else 'Unknown',
+            'protocol': protocol,
+            'pci': int(pci_match.group(1)) if pci_match else None,
+            'earfcn': int(earfcn_match.group(1)) if earfcn_match else None,
+            'rrc_transaction_id': int(transaction_match.group(1)) if transaction_match else None,
+            'is_paging': is_paging,
+            'is_measurement': 'MeasurementReport' in block or 'measurementReport' in block,
+            'is_connection_related': self._is_connection_related(block),
+            'parameters_head': freeze(parameters_head),
+            'descriptor_id': descriptor_id,
+            'parameters_tail': freeze(parameters_tail),
+            'measurements_data': freeze(measurements),
+            'paging_info_data': freeze(paging_info)
+        }
+    
     def _extract_lte_message_type(self, line: str) -> str:
         """LTE RRC mesaj tipini çıkar"""
         match = re.search(self.message_patterns['message_header'], line)
@@ -345,7 +1646,6 @@ class TemsParser:
         """Mesaj yönünü belirle"""
         protocol_lower = protocol.lower() if protocol else ''
         channel_lower = channel.lower() if channel else ''
-        message_type_lower = message_type.lower() if message_type else ''
         
         # Kanal bilgisine göre yön belirleme
         if 'ul' in channel_lower or 'uplink' in channel_lower:
@@ -354,44 +1654,15 @@ class TemsParser:
             return 'downlink'
         
         # Mesaj tipine göre yön belirleme
-        uplink_messages = [
-            'rrcconnectionrequest', 'rrcconnectionsetupcomplete', 'rrcconnectionreconfigurationcomplete',
-            'measurementreport', 'ulhandoverpreparationtransfer', 'ulnastransport', 'initialuemessage',
-            'uplinkdatatransfer', 'rrcconnectionreestablishmentrequest', 'rrcconnectionreestablishmentcomplete',
-            'securitymodecompleterequest', 'uecapabilityinformation', 'attachrequest', 'authenticationresponse',
-            'securitymodecomplete', 'attachcomplete', 'trackingareaupdaterequest'
-        ]
+        direction = self._direction_classifier.classify(message_type)
+        if direction:
+            return direction
         
-        downlink_messages = [
-            'rrcconnectionsetup', 'rrcconnectionreconfiguration', 'rrcconnectionrelease',
-            'dlhandoverpreparationtransfer', 'dlnastransport', 'initialcontextsetupresponse',
-            'downlinkdatatransfer', 'rrcconnectionreestablishment', 'rrcconnectionreestablishmentreject',
-            'securitymodecommand', 'uecapabilityenquiry', 'attachaccept', 'authenticationrequest',
-            'attachreject', 'trackingareaupdateaccept', 'paging'
-        ]
-        
-        for ul_msg in uplink_messages:
-            if ul_msg in message_type_lower:
-                return 'uplink'
-        
-        for dl_msg in downlink_messages:
-            if dl_msg in message_type_lower:
-                return 'downlink'
-        
-        # Protocol ve içerik analizi
+        # Protocol ve içerik analizi (NAS ve S1-AP mesajları)
         if 'nas' in protocol_lower:
-            # NAS mesajları için içerik analizi
-            if any(keyword in block.lower() for keyword in ['attach request', 'tau request', 'service request']):
-                return 'uplink'
-            elif any(keyword in block.lower() for keyword in ['attach accept', 'tau accept', 'authentication request']):
-                return 'downlink'
-        
+            return self._nas_direction_classifier.classify(block, 'unknown')
         elif 's1ap' in protocol_lower:
-            # S1-AP mesajları için içerik analizi
-            if any(keyword in block.lower() for keyword in ['initial ue message', 'uplink nas transport']):
-                return 'uplink'
-            elif any(keyword in block.lower() for keyword in ['initial context setup', 'downlink nas transport']):
-                return 'downlink'
+            return self._s1ap_direction_classifier.classify(block, 'unknown')
         
         # Varsayılan olarak bilinmeyen
         return 'unknown'
@@ -423,45 +1694,45 @@ class TemsParser:
         parameters['direction'] = direction
         
         # Events bilgisini çıkar
-        events_match = re.search(r'Events:\s*\n([^\n]*(?:\n[^\n]*)*?)(?=\n\n|\nLayer|\nProtocol|$)', block, re.MULTILINE)
+        events_match = re.search(self.message_patterns['events'], block)
         if events_match:
             parameters['events'] = events_match.group(1).strip()
         
         # Layer 3 Message bilgisini çıkar
-        layer3_match = re.search(r'Layer 3 Message:\s*Message identity:\s*([^\(]+)\s*\([^\)]*\)', block)
+        layer3_match = re.search(self.message_patterns['layer3_message'], block)
         if layer3_match:
             parameters['layer3_message'] = layer3_match.group(1).strip()
         
         # Protocol bilgisini çıkar (daha detaylı)
-        protocol_match = re.search(r'Protocol:\s*(\w+)', block)
+        protocol_match = re.search(self.message_patterns['protocol_detail'], block)
         if protocol_match:
             parameters['protocol_detail'] = protocol_match.group(1)
         
         # Channel bilgisini çıkar (daha detaylı)
-        channel_match = re.search(r'Channel:\s*(\w+)', block)
+        channel_match = re.search(self.message_patterns['channel_detail'], block)
         if channel_match:
             parameters['channel_detail'] = channel_match.group(1)
         
         # LTE RRC Protocol Version
-        lte_version_match = re.search(r'LTE RRC Protocol Version:\s*([\d\.]+)', block)
+        lte_version_match = re.search(self.message_patterns['lte_rrc_version'], block)
         if lte_version_match:
             parameters['lte_rrc_version'] = lte_version_match.group(1)
         
         # NR 5G RRC Protocol Version
-        nr_version_match = re.search(r'NR 5G RRC Protocol Version:\s*([\d\.]+)', block)
+        nr_version_match = re.search(self.message_patterns['nr_rrc_version'], block)
         if nr_version_match:
             parameters['nr_rrc_version'] = nr_version_match.group(1)
         
         # RB Id, SubFN, SysFN bilgilerini çıkar
-        rb_match = re.search(r'RB Id:\s*(\d+)', block)
+        rb_match = re.search(self.message_patterns['rb_id'], block)
         if rb_match:
             parameters['rb_id'] = rb_match.group(1)
         
-        subfn_match = re.search(r'SubFN:\s*(\d+)', block)
+        subfn_match = re.search(self.message_patterns['subfn'], block)
         if subfn_match:
             parameters['subfn'] = subfn_match.group(1)
         
-        sysfn_match = re.search(r'SysFN:\s*(\d+)', block)
+        sysfn_match = re.search(self.message_patterns['sysfn'], block)
         if sysfn_match:
             parameters['sysfn'] = sysfn_match.group(1)
         
@@ -469,93 +1740,8 @@ class TemsParser:
     
     def _get_message_specific_content(self, message_type: str, block: str) -> Dict[str, str]:
         """Mesaj türüne göre spesifik içerik döndür"""
-        content = {}
-        
-        if 'RRCConnectionReconfigurationComplete' in message_type:
-            content['purpose'] = 'UE tarafından RRC bağlantı yeniden yapılandırmasının başarıyla tamamlandığını onaylar'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-DCCH'
-            content['content_structure'] = 'RRC Transaction ID, Completion confirmation'
-            
-        elif 'MeasurementReport' in message_type:
-            content['purpose'] = 'Serving ve komşu hücrelerin sinyal kalitesi ölçümlerini raporlar'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-DCCH'
-            content['content_structure'] = 'Measurement ID, RSRP/RSRQ değerleri, PCI listesi'
-            
-        elif 'RRCConnectionRequest' in message_type:
-            content['purpose'] = 'UE tarafından RRC bağlantısı kurma talebi'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-CCCH'
-            content['content_structure'] = 'UE Identity, Establishment Cause'
-            
-        elif 'Paging' in message_type:
-            content['purpose'] = 'Ağ tarafından UE\'yi arama ve uyandırma'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'PCCH'
-            content['content_structure'] = 'Paging Record List, System Info Modification'
-            
-        elif 'RRCConnectionReconfiguration' in message_type:
-            content['purpose'] = 'Radyo kaynakları ve parametrelerinin yeniden yapılandırılması'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'DL-DCCH'
-            content['content_structure'] = 'Radio Resource Config, Mobility Control Info'
-            
-        elif 'RRCConnectionRelease' in message_type:
-            content['purpose'] = 'RRC bağlantısının sonlandırılması ve IDLE moda geçiş'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'DL-DCCH'
-            content['content_structure'] = 'Release Cause, Redirect Info'
-            
-        elif 'RRCConnectionSetup' in message_type:
-            content['purpose'] = 'RRC bağlantısının kurulması ve radyo kaynaklarının atanması'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'DL-CCCH'
-            content['content_structure'] = 'Radio Resource Config, RRC Transaction ID'
-            
-        elif 'SystemInformationBlockType' in message_type or 'SIB' in message_type:
-            content['purpose'] = 'Hücre ve sistem parametrelerinin yayınlanması'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'BCCH-DL-SCH'
-            content['content_structure'] = 'Cell Access Info, Frequency Info, Neighbor Cell List'
-            
-        elif 'RRCConnectionSetupComplete' in message_type:
-            content['purpose'] = 'RRC bağlantı kurulumunun teyidi ve NAS mesajının iletimi'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-DCCH'
-            content['content_structure'] = 'Selected PLMN, Dedicated Info NAS'
-            
-        elif 'SecurityModeCommand' in message_type:
-            content['purpose'] = 'Güvenlik algoritmaları ve şifreleme parametrelerinin aktivasyonu'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'DL-DCCH'
-            content['content_structure'] = 'Security Config SMC, Ciphering Algorithm, Integrity Algorithm'
-            
-        elif 'SecurityModeComplete' in message_type:
-            content['purpose'] = 'Güvenlik prosedürlerinin başarıyla tamamlandığının onayı'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-DCCH'
-            content['content_structure'] = 'RRC Transaction ID, Security completion confirmation'
-            
-        elif 'UECapabilityEnquiry' in message_type:
-            content['purpose'] = 'UE yeteneklerinin sorgulanması'
-            content['direction'] = 'Downlink (eNB → UE)'
-            content['channel'] = 'DL-DCCH'
-            content['content_structure'] = 'UE Capability Request, RAT Type'
-            
-        elif 'UECapabilityInformation' in message_type:
-            content['purpose'] = 'UE yetenekleri ve desteklenen özelliklerin raporlanması'
-            content['direction'] = 'Uplink (UE → eNB)'
-            content['channel'] = 'UL-DCCH'
-            content['content_structure'] = 'Supported Band List, Category Info, Feature Group Indicators'
-            
-        elif 'ServiceRequest' in message_type:
-            content['purpose'] = 'Çekirdek ağ hizmetlerine erişim talebi'
-            content['direction'] = 'Uplink (UE → MME)'
-            content['channel'] = 'NAS/EMM'
-            content['content_structure'] = 'Service Type, KSI and Sequence Number, Authentication Token'
-        
-        return content
+        name = self._specific_content_classifier.classify(message_type)
+        return dict(self.MESSAGE_SPECIFIC_CONTENT[name]) if name else {}
     
     def _extract_parameters(self, line: str) -> Dict[str, str]:
         """Satırdan parametreleri çıkar"""
@@ -576,122 +1762,27 @@ class TemsParser:
         return params
     
     def _group_by_call_flow(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Mesajları call flow'lara göre grupla"""
-        call_flows = []
-        current_flow = None
-        
-        for message in messages:
-            # Yeni call flow başlangıcı kontrolü
-            if (message['protocol_type'] in ['Paging', 'Call Setup'] and 
-                message['message_type'] == 'Request'):
-                
-                # Önceki flow'u kaydet
-                if current_flow:
-                    call_flows.append(current_flow)
-                
-                # Yeni flow başlat
-                current_flow = {
-                    'id': len(call_flows) + 1,
-                    'start_time': message['timestamp'],
-                    'type': message['protocol_type'],
-                    'messages': [message],
-                    'status': 'In Progress',
-                    'duration': None
-                }
-            elif current_flow:
-                current_flow['messages'].append(message)
-                
-                # Flow tamamlanma kontrolü
-                if message['message_type'] in ['Response', 'Complete']:
-                    current_flow['status'] = 'Completed'
-                    current_flow['end_time'] = message['timestamp']
-                    current_flow['duration'] = self._calculate_duration(
-                        current_flow['start_time'], 
-                        message['timestamp']
-                    )
-        
-        # Son flow'u kaydet
-        if current_flow:
-            call_flows.append(current_flow)
-        
-        return call_flows
-    
-    def _calculate_duration(self, start_time: str, end_time: str) -> Optional[float]:
-        """İki zaman arasındaki süreyi hesapla (milisaniye)"""
-        try:
-            start = datetime.strptime(start_time, '%Y-%m-%d %H:%M:%S.%f')
-            end = datetime.strptime(end_time, '%Y-%m-%d %H:%M:%S.%f')
-            return (end - start).total_seconds() * 1000
-        except:
+        """Mesajları call flow'lara (RRC bağlantısı ve prosedürleri) göre grupla"""
+        return track_call_flows(messages)
+    
+    def _calculate_duration(self, start_time: Union[str, int, None],
+                            end_time: Union[str, int, None]) -> Optional[float]:
+        """İki zaman arasındaki süreyi hesapla (milisaniye).
+        
+        Zamanlar epoch milisaniyesi (timestamp_ms) ya da 'DDMMYY HH:MM:SS.mmm' olabilir.
+        """
+        start = parse_timestamp(start_time) if isinstance(start_time, str) else start_time
+        end = parse_timestamp(end_time) if isinstance(end_time, str) else end_time
+        if start is None or end is None:
             return None
+        return float(end - start)
     
     def _calculate_statistics(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Mesajlardan istatistikleri hesapla"""
-        total_messages = len(messages)
-        paging_count = sum(1 for msg in messages if msg.get('is_paging', False))
-        measurement_count = sum(1 for msg in messages if msg.get('is_measurement', False))
-        connection_count = sum(1 for msg in messages if msg.get('is_connection_related', False))
-        
-        # Mesaj tiplerini say
-        message_types = {}
-        channels = {}
-        protocols = {}
-        
+        accumulator = StatisticsAccumulator()
         for msg in messages:
-            # Mesaj tipi istatistikleri
-            msg_identity = msg.get('message_identity', 'Unknown')
-            message_types[msg_identity] = message_types.get(msg_identity, 0) + 1
-            
-            # Kanal istatistikleri
-            channel = msg.get('channel', 'Unknown')
-            channels[channel] = channels.get(channel, 0) + 1
-            
-            # Protokol istatistikleri
-            protocol = msg.get('protocol', 'Unknown')
-            protocols[protocol] = protocols.get(protocol, 0) + 1
-        
-        # RSRP/RSRQ istatistikleri
-        rsrp_values = []
-        rsrq_values = []
-        
-        for msg in messages:
-            measurements = msg.get('measurements', {})
-            if 'rsrp_values' in measurements:
-                rsrp_values.extend([m['dbm'] for m in measurements['rsrp_values']])
-            if 'rsrq_values' in measurements:
-                rsrq_values.extend([m['db'] for m in measurements['rsrq_values']])
-        
-        rsrp_stats = {}
-        rsrq_stats = {}
-        
-        if rsrp_values:
-            rsrp_stats = {
-                'min': min(rsrp_values),
-                'max': max(rsrp_values),
-                'avg': sum(rsrp_values) / len(rsrp_values),
-                'count': len(rsrp_values)
-            }
-        
-        if rsrq_values:
-            rsrq_stats = {
-                'min': min(rsrq_values),
-                'max': max(rsrq_values),
-                'avg': sum(rsrq_values) / len(rsrq_values),
-                'count': len(rsrq_values)
-            }
-        
-        return {
-            'total_messages': total_messages,
-            'paging_messages': paging_count,
-            'measurement_messages': measurement_count,
-            'connection_messages': connection_count,
-            'other_messages': total_messages - paging_count - measurement_count - connection_count,
-            'message_types': message_types,
-            'channels': channels,
-            'protocols': protocols,
-            'rsrp_statistics': rsrp_stats,
-            'rsrq_statistics': rsrq_stats
-        }
+            accumulator.add(msg)
+        return accumulator.result()
     
     def analyze_call_flow(self, log_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Call flow analizi yap"""
@@ -717,7 +1808,7 @@ class TemsParser:
                 'message_type': message['message_type'],
                 'protocol': message.get('protocol_type', message.get('protocol', 'Unknown')),
                 'description': f"{message.get('protocol_type', message.get('protocol', 'Unknown'))} {message['message_type']}",
-                'is_error': 'error' in message.get('raw_content', '').lower()
+                'is_error': 'error' in self._error_keywords(message)
             })
         
         return diagram_data
@@ -727,26 +1818,53 @@ class TemsParser:
         timing_data = {
             'total_duration': None,
             'average_response_time': None,
-            'slow_operations': []
+            'slow_operations': [],
+            'procedure_latencies': {}
         }
         
         if len(messages) >= 2:
-            try:
-                start_time = datetime.strptime(messages[0]['timestamp'], '%Y-%m-%d %H:%M:%S.%f')
-                end_time = datetime.strptime(messages[-1]['timestamp'], '%Y-%m-%d %H:%M:%S.%f')
-                timing_data['total_duration'] = (end_time - start_time).total_seconds() * 1000
-            except:
-                pass
+            timing_data['total_duration'] = self._calculate_duration(
+                message_timestamp_ms(messages[0]), message_timestamp_ms(messages[-1]))
+        
+        # Prosedür gecikmeleri (paging -> setup, setup -> complete, ...) tek geçişte çıkarılır
+        call_flows = self._group_by_call_flow(messages)
+        latencies = latency_distributions(call_flows)
+        timing_data['procedure_latencies'] = latencies
+        
+        # İstek/yanıt gecikmelerinin ortalaması (paging ve bağlantı süresi hariç)
+        response_count = sum(latency['count'] for name, latency in latencies.items()
+                             if name not in self.NON_RESPONSE_LATENCIES)
+        if response_count:
+            timing_data['average_response_time'] = sum(
+                latency['avg'] * latency['count'] for name, latency in latencies.items()
+                if name not in self.NON_RESPONSE_LATENCIES) / response_count
+        
+        slow_operations = [
+            {'flow_id': flow['id'], 'type': flow['type'], 'latency': name, 'duration': value,
+             'start_time': flow['start_time']}
+            for flow in call_flows
+            for name, value in flow['latencies'].items()
+            if name not in self.NON_RESPONSE_LATENCIES and value >= self.SLOW_OPERATION_MS
+        ]
+        slow_operations.sort(key=lambda operation: operation['duration'], reverse=True)
+        timing_data['slow_operations'] = slow_operations[:self.MAX_SLOW_OPERATIONS]
         
         return timing_data
     
+    def _error_keywords(self, message: Dict[str, Any]) -> Tuple[str, ...]:
+        """Mesajın raw_content'inde geçen hata anahtar kelimeleri (parse sırasında hesaplanmış olanı kullanır)"""
+        keywords = message.get('error_keywords')
+        if keywords is None:
+            # error_keywords alanı eklenmeden önce üretilmiş mesajlar
+            keywords = self._error_classifier.matches(message.get('raw_content', ''))
+        return keywords
+    
     def _analyze_errors(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Hata analizi yap"""
         errors = []
         
         for message in messages:
-            content = message.get('raw_content', '').lower()
-            if any(keyword in content for keyword in ['error', 'fail', 'reject', 'timeout']):
+            if self._error_keywords(message):
                 errors.append({
                     'message_id': message['id'],
                     'timestamp': message['timestamp'],
@@ -764,129 +1882,62 @@ class TemsParser:
         if paging_count > 10:
             recommendations.append("Yüksek paging trafiği tespit edildi. Ağ optimizasyonu gerekebilir.")
         
-        error_count = sum(1 for msg in messages if 'error' in msg.get('raw_content', '').lower())
+        error_count = sum(1 for msg in messages if 'error' in self._error_keywords(msg))
         if error_count > 0:
             recommendations.append(f"{error_count} hata mesajı tespit edildi. Detaylı inceleme önerilir.")
         
         return recommendations
     
-    def filter_messages(self, messages: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Mesajları filtrele"""
-        filtered = messages.copy()
-        
-        # Protokol filtresi
-        if filters.get('protocol'):
-            filtered = [msg for msg in filtered if msg.get('protocol') == filters['protocol']]
-        
-        # Mesaj türü filtresi (lte_message_type alanını kontrol et)
-        if filters.get('message_type'):
-            filtered = [msg for msg in filtered if msg.get('lte_message_type') == filters['message_type']]
-        
-        # Mesaj yönü filtresi
-        if filters.get('message_direction'):
-            direction_filter = filters['message_direction']
-            filtered_by_direction = []
-            
-            for msg in filtered:
-                protocol = (msg.get('protocol') or '').lower()
-                direction = (msg.get('parameters', {}).get('direction') or '').lower()
-                
-                # Mesaj yönünü belirle
-                if direction_filter == 'ue_to_enb':
-                    # UE'den eNB'ye: RRC UL mesajları
-                    if ('rrc' in protocol or 'lte_rrc' in protocol) and direction == 'uplink':
-                        filtered_by_direction.append(msg)
-                elif direction_filter == 'enb_to_ue':
-                    # eNB'den UE'ye: RRC DL mesajları
-                    if ('rrc' in protocol or 'lte_rrc' in protocol) and direction == 'downlink':
-                        filtered_by_direction.append(msg)
-                elif direction_filter == 'enb_to_mme':
-                    # eNB'den MME'ye: S1-AP UL mesajları
-                    if 's1ap' in protocol and direction == 'uplink':
-                        filtered_by_direction.append(msg)
-                elif direction_filter == 'mme_to_enb':
-                    # MME'den eNB'ye: S1-AP DL mesajları
-                    if 's1ap' in protocol and direction == 'downlink':
-                        filtered_by_direction.append(msg)
-                elif direction_filter == 'ue_to_mme':
-                    # UE'den MME'ye: NAS UL mesajları
-                    if 'nas' in protocol and direction == 'uplink':
-                        filtered_by_direction.append(msg)
-                elif direction_filter == 'mme_to_ue':
-                    # MME'den UE'ye: NAS DL mesajları
-                    if 'nas' in protocol and direction == 'downlink':
-                        filtered_by_direction.append(msg)
-            
-            filtered = filtered_by_direction
-        
-        # Kanal filtresi
-        if filters.get('channel'):
-            filtered = [msg for msg in filtered if msg.get('channel') == filters['channel']]
-        
-        # Mesaj kimliği filtresi (kısmi eşleşme)
-        if filters.get('message_identity'):
-            filtered = [msg for msg in filtered if filters['message_identity'].lower() in msg.get('message_identity', '').lower()]
-        
-        # PCI filtresi
-        if filters.get('pci'):
-            try:
-                pci_value = int(filters['pci'])
-                filtered = [msg for msg in filtered if msg.get('pci') == pci_value]
-            except (ValueError, TypeError):
-                pass
-        
-        # EARFCN filtresi
-        if filters.get('earfcn'):
-            try:
-                earfcn_value = int(filters['earfcn'])
-                filtered = [msg for msg in filtered if msg.get('earfcn') == earfcn_value]
-            except (ValueError, TypeError):
-                pass
-        
-        # Boolean filtreler
-        if filters.get('is_paging') is not None:
-            filtered = [msg for msg in filtered if msg.get('is_paging') == filters['is_paging']]
-        
-        if filters.get('is_measurement') is not None:
-            filtered = [msg for msg in filtered if msg.get('is_measurement') == filters['is_measurement']]
-        
-        if filters.get('is_connection_related') is not None:
-            filtered = [msg for msg in filtered if msg.get('is_connection_related') == filters['is_connection_related']]
-        
-        # RRC Transaction ID filtresi
-        if filters.get('rrc_transaction_id'):
-            try:
-                rrc_id = int(filters['rrc_transaction_id'])
-                filtered = [msg for msg in filtered if msg.get('rrc_transaction_id') == rrc_id]
-            except (ValueError, TypeError):
-                pass
-        
-        # RSRP filtresi
-        if filters.get('min_rsrp') or filters.get('max_rsrp'):
-            def has_rsrp_in_range(msg):
-                measurements = msg.get('measurements', {})
-                if 'rsrp_values' in measurements:
-                    for rsrp in measurements['rsrp_values']:
-                        try:
-                            dbm_value = float(rsrp['dbm'])
-                            if filters.get('min_rsrp') and dbm_value < float(filters['min_rsrp']):
-                                continue
-                            if filters.get('max_rsrp') and dbm_value > float(filters['max_rsrp']):
-                                continue
-                            return True
-                        except (ValueError, TypeError, KeyError):
-                            continue
-                return False
-            filtered = [msg for msg in filtered if has_rsrp_in_range(msg)]
-        
-        # Zaman aralığı filtresi
-        if filters.get('start_time') and filters.get('end_time'):
-            try:
-                start = datetime.strptime(filters['start_time'], '%Y-%m-%d %H:%M:%S')
-                end = datetime.strptime(filters['end_time'], '%Y-%m-%d %H:%M:%S')
-                filtered = [msg for msg in filtered 
-                           if start <= datetime.strptime(msg['timestamp'], '%Y-%m-%d %H:%M:%S.%f') <= end]
-            except (ValueError, KeyError):
-                pass
-        
-        return filtered
\ No newline at end of file
+    def filter_messages(self, messages: Union[List[Dict[str, Any]], MessageStore],
+                        filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Mesajları filtrele
+        
+        Aynı mesajlar üzerinde tekrar tekrar filtre uygulanacaksa MessageStore verilmelidir;
+        sütunlar ve indeksler bir kez oluşturulup sonraki filtrelerde yeniden kullanılır.
+        """
+        store = messages if isinstance(messages, MessageStore) else MessageStore(messages)
+        return store.filter(filters)
+
+
+def _parse_byte_range(engine: str, filepath: str, start: int, end: int, encoding: Optional[str],
+                      detail_file: Optional[str] = None, search_index: bool = False
+                      ) -> Tuple[List[Dict[str, Any]], int, StatisticsAccumulator, Dict[str, float],
+                                 Optional[IndexSegment]]:
+    """Süreç havuzu işçisi: dosyanın bir byte aralığını parse eder.
+    
+    (mesajlar, blok sayısı, istatistikler, aşama süreleri, indeks segmenti) döndürür; id ve blok
+    numaraları aralık içinde 1'den başlar. detail_file verilirse tembel parse yapılır ve ayrıntı
+    konumları bu dosyanın başından sayılır. search_index verilmezse segment None'dır.
+    """
+    parser = TemsParser(engine=engine)
+    timer = StageTimer()
+    blocks = parser._iter_blocks(filepath, start, end, encoding, timer=timer)
+    if start > 0:
+        # Aralık bir ayraçla başlar; ayraçtan önceki boş parça gerçek bir blok değildir
+        next(blocks)
+    
+    messages = []
+    statistics = StatisticsAccumulator()
+    builder = SearchIndexBuilder() if search_index else None
+    block_count = 0
+    file = open(detail_file, 'wb') if detail_file is not None else None
+    try:
+        writer = DetailFileWriter(file) if file is not None else None
+        for block_count, block in enumerate(blocks, 1):
+            extract_start = time.perf_counter()
+            block_messages = parser._extract_block_messages(block, block_count, len(messages) + 1, writer)
+            statistics_start = time.perf_counter()
+            for message in block_messages:
+                statistics.add(message)
+            index_start = time.perf_counter()
+            timer.add('extract', statistics_start - extract_start)
+            timer.add('statistics', index_start - statistics_start)
+            if builder is not None:
+                parser._index_block(builder, block, block_messages)
+                timer.add('index', time.perf_counter() - index_start)
+            messages.extend(block_messages)
+    finally:
+        if file is not None:
+            file.close()
+    
+    return messages, block_count, statistics, timer.seconds, builder.build() if builder is not None else None
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from generate_logs import generate  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+@pytest.fixture(scope='session')
+def call_flow_log():
+    """Paging -> bağlantı -> alt prosedürler -> release akışını içeren elle yazılmış log"""
+    return os.path.join(FIXTURES, 'call_flow.log')
+
+
+@pytest.fixture(scope='session')
+def generated_logs(tmp_path_factory):
+    """Benchmark üreticisiyle deterministik loglar: CRLF'li .log, UTF-8 .trp ve latin-1 .trp"""
+    directory = tmp_path_factory.mktemp('logs')
+    paths = {}
+
+    log_path = str(directory / 'sample.log')
+    generate(log_path, 200_000, 'default', 3)
+    with open(log_path, 'rb') as file:
+        data = file.read()
+    # Satır sonlarının bir kısmı CRLF
+    with open(log_path, 'wb') as file:
+        file.write(data.replace(b'\n', b'\r\n', 200))
+    paths['log'] = log_path
+
+    trp_path = str(directory / 'sample.trp')
+    generate(trp_path, 200_000, 'paging', 5)
+    paths['trp'] = trp_path
+
+    # UTF-8 olarak geçersiz byte'lar içeren TRP latin-1 olarak okunur
+    latin1_path = str(directory / 'latin1.trp')
+    generate(latin1_path, 200_000, 'default', 9)
+    with open(latin1_path, 'rb') as file:
+        data = file.read()
+    with open(latin1_path, 'wb') as file:
+        file.write(data.replace(b'Service Request', 'Service Requést'.encode('latin-1')))
+    paths['latin1_trp'] = latin1_path
+    return paths
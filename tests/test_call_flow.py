@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+
+from call_flow import CallFlowTracker, track_call_flows, latency_distributions, LATENCY_PERCENTILES
+from tems_parser import TemsParser
+from timestamps import parse_timestamp
+
+CHANNELS = {
+    'RRCConnectionRequest': 'UL_CCCH', 'RRCConnectionSetup': 'DL_CCCH',
+    'RRCConnectionSetupComplete': 'UL_DCCH', 'RRCConnectionRelease': 'DL_DCCH',
+    'RRCConnectionReject': 'DL_CCCH', 'SecurityModeCommand': 'DL_DCCH',
+    'SecurityModeComplete': 'UL_DCCH', 'SecurityModeFailure': 'UL_DCCH',
+    'RRCConnectionReconfiguration': 'DL_DCCH', 'RRCConnectionReconfigurationComplete': 'UL_DCCH',
+    'MeasurementReport': 'UL_DCCH', 'SystemInformationBlockType1': 'BCCH_DL_SCH', 'Paging': 'PCCH',
+}
+
+
+class MessageFactory:
+    """Tracker'ın okuduğu alanları taşıyan en küçük mesaj sözlükleri"""
+
+    def __init__(self):
+        self.next_id = 1
+
+    def __call__(self, identity, time, transaction_id=None, raw_content='', **fields):
+        timestamp = f'150124 10:00:{time}'
+        message = {
+            'id': self.next_id,
+            'timestamp': timestamp,
+            'timestamp_ms': parse_timestamp(timestamp),
+            'message_identity': identity,
+            'channel': CHANNELS[identity],
+            'rrc_transaction_id': transaction_id,
+            'is_paging': identity == 'Paging',
+            'raw_content': raw_content,
+        }
+        message.update(fields)
+        self.next_id += 1
+        return message
+
+
+@pytest.fixture
+def message():
+    return MessageFactory()
+
+
+def _paging(message, time, m_tmsi):
+    return message('Paging', time, paging_info={'paging_records': [{'m_tmsi': m_tmsi}]})
+
+
+def _request(message, time, m_tmsi, cause, **fields):
+    return message('RRCConnectionRequest', time,
+                   raw_content=f'ue-Identity s-TMSI mmec: 5 m-TMSI: {m_tmsi}\nestablishmentCause: {cause}', **fields)
+
+
+def test_connection_lifecycle(message):
+    tracker = CallFlowTracker()
+    changed = tracker.add(_request(message, '00.000', 1234, 'mo-Data'))
+    connection = changed[0]
+    assert (connection['type'], connection['status'], connection['trigger']) == ('RRC Connection', 'In Progress', 'ue')
+    assert (connection['m_tmsi'], connection['cause']) == (1234, 'mo-Data')
+
+    tracker.add(message('RRCConnectionSetup', '00.040', 2))
+    assert connection['status'] == 'In Progress'
+    assert connection['rrc_transaction_id'] == 2
+    # Farklı transaction ID'li SetupComplete bağlantıyı kurmaz
+    tracker.add(message('RRCConnectionSetupComplete', '00.050', 1))
+    assert connection['status'] == 'In Progress'
+    tracker.add(message('RRCConnectionSetupComplete', '00.070', 2))
+    assert connection['status'] == 'Connected'
+
+    tracker.add(message('MeasurementReport', '00.100'))
+    tracker.add(message('SystemInformationBlockType1', '00.150'))
+    changed = tracker.add(message('RRCConnectionRelease', '00.500'))
+    assert changed == [connection]
+    assert connection['status'] == 'Released'
+    assert connection['end_time'] == '150124 10:00:00.500'
+    assert connection['duration'] == 500.0
+    # Yayın kanalındaki SIB bağlantıya eklenmez
+    assert connection['message_ids'] == [1, 2, 3, 4, 5, 7]
+    assert connection['latencies'] == {'request_to_setup': 40.0, 'setup_to_complete': 30.0}
+
+
+def test_rejected_connection(message):
+    tracker = CallFlowTracker()
+    tracker.add(_request(message, '00.000', 1, 'mo-Signalling'))
+    tracker.add(message('RRCConnectionReject', '00.030'))
+    assert [(flow['status'], flow['message_ids']) for flow in tracker.call_flows] == [('Rejected', [1, 2])]
+
+
+def test_new_request_closes_unfinished_connection(message):
+    tracker = CallFlowTracker()
+    tracker.add(_request(message, '00.000', 1, 'mo-Data'))
+    tracker.add(message('RRCConnectionSetup', '00.040', 0))
+    tracker.add(message('RRCConnectionSetupComplete', '00.050', 0))
+    tracker.add(message('SecurityModeCommand', '00.060', 1))
+    changed = tracker.add(_request(message, '05.000', 1, 'mo-Data'))
+    first, security, second = tracker.call_flows
+    assert (first['status'], security['status'], second['status']) == ('Incomplete', 'Incomplete', 'In Progress')
+    assert {flow['id'] for flow in changed} == {first['id'], security['id'], second['id']}
+    # Yarım kalan bağlantı yeni isteği içermez
+    assert 5 not in first['message_ids']
+
+
+def test_setup_without_request_opens_connection(message):
+    tracker = CallFlowTracker()
+    tracker.add(message('RRCConnectionSetup', '00.000', 1))
+    tracker.add(message('RRCConnectionSetupComplete', '00.020', 1))
+    (connection,) = tracker.call_flows
+    assert connection['status'] == 'Connected'
+    assert connection['latencies'] == {'setup_to_complete': 20.0}
+
+
+def test_transaction_procedures(message):
+    tracker = CallFlowTracker()
+    tracker.add(message('RRCConnectionSetup', '00.000', 0))
+    tracker.add(message('SecurityModeCommand', '00.100', 1))
+    tracker.add(message('SecurityModeFailure', '00.130', 1))
+    tracker.add(message('RRCConnectionReconfiguration', '00.200', 2))
+    tracker.add(message('RRCConnectionReconfiguration', '00.300', 2))
+    tracker.add(message('RRCConnectionReconfigurationComplete', '00.350', 2))
+    # Açık prosedürü olmayan yanıt yok sayılır
+    tracker.add(message('SecurityModeComplete', '00.400', 3))
+
+    connection, security, reconfiguration, retried = tracker.call_flows
+    assert (security['type'], security['status'], security['parent_id']) == ('Security Mode', 'Failed', connection['id'])
+    assert security['latencies'] == {'security_mode_to_complete': 30.0}
+    assert reconfiguration['status'] == 'Incomplete'
+    assert (retried['status'], retried['message_ids']) == ('Completed', [5, 6])
+    assert retried['latencies'] == {'reconfiguration_to_complete': 50.0}
+    assert len(tracker.call_flows) == 4
+
+
+def test_paging_response_window(message):
+    tracker = CallFlowTracker()
+    tracker.add(_paging(message, '00.000', 1234))
+    tracker.add(_paging(message, '00.100', 99))
+    tracker.add(_request(message, '00.300', 1234, 'mt-Access'))
+    tracker.add(message('RRCConnectionSetup', '00.350', 0))
+    answered = tracker.call_flows[0]
+    assert (answered['trigger'], answered['paging_message_id']) == ('paging', 1)
+    assert answered['message_ids'] == [1, 3, 4]
+    assert answered['latencies'] == {'paging_to_request': 300.0, 'request_to_setup': 50.0, 'paging_to_setup': 350.0}
+
+    # Pencere (10 sn) dışındaki paging bağlanmaz; neden mo-* ise tetikleyen UE'dir
+    tracker.add(_request(message, '20.000', 99, 'mo-Data'))
+    late = tracker.call_flows[1]
+    assert (late['trigger'], late['paging_message_id']) == ('ue', None)
+
+
+def test_fixture_log_call_flows(call_flow_log):
+    result = TemsParser(engine='fast').parse_log_file(call_flow_log)
+    flows = result['call_flows']
+    assert [(flow['type'], flow['status'], flow['parent_id']) for flow in flows] == [
+        ('RRC Connection', 'Released', None),
+        ('Security Mode', 'Completed', 1),
+        ('RRC Connection Reconfiguration', 'Completed', 1),
+        ('RRC Connection', 'Incomplete', None),
+        ('RRC Connection', 'In Progress', None),
+    ]
+    assert flows[0]['message_ids'] == [1, 2, 3, 4, 5, 6, 7, 9, 10]
+    assert flows[0]['latencies'] == {'paging_to_request': 100.0, 'request_to_setup': 50.0,
+                                     'paging_to_setup': 150.0, 'setup_to_complete': 50.0}
+    # S1AP paging'indeki m-TMSI de bağlanır
+    assert (flows[4]['trigger'], flows[4]['paging_message_id'], flows[4]['m_tmsi']) == ('paging', 12, 777)
+    assert TemsParser(engine='regex').parse_log_file(call_flow_log)['call_flows'] == flows
+
+
+def test_track_call_flows_separates_sources(message):
+    messages = [
+        _request(message, '00.000', 1, 'mo-Data', source_file='ue1.log'),
+        _request(message, '00.010', 2, 'mo-Data', source_file='ue2.log'),
+        message('RRCConnectionSetup', '00.050', 0, source_file='ue1.log'),
+        message('RRCConnectionSetup', '00.080', 0, source_file='ue2.log'),
+    ]
+    flows = track_call_flows(messages)
+    assert [(flow['source_file'], flow['status'], flow['message_ids']) for flow in flows] == [
+        ('ue1.log', 'In Progress', [1, 3]),
+        ('ue2.log', 'In Progress', [2, 4]),
+    ]
+    assert [flow['latencies']['request_to_setup'] for flow in flows] == [50.0, 70.0]
+
+
+def test_latency_distributions_match_numpy_percentiles():
+    values = [12.0, 3.0, 7.0, 40.0, 5.0, 9.0, 100.0]
+    flows = [{'latencies': {'setup_to_complete': value}} for value in values]
+    flows.append({'latencies': {'paging_to_setup': 80.0}})
+    flows.append({'latencies': {}})
+
+    distributions = latency_distributions(flows)
+    distribution = distributions['setup_to_complete']
+    assert (distribution['count'], distribution['min'], distribution['max']) == (7, 3.0, 100.0)
+    assert distribution['avg'] == pytest.approx(np.mean(values))
+    for q in LATENCY_PERCENTILES:
+        assert distribution[f'p{q}'] == pytest.approx(np.percentile(values, q))
+    assert distributions['paging_to_setup'] == {'count': 1, 'min': 80.0, 'max': 80.0, 'avg': 80.0,
+                                                'p50': 80.0, 'p90': 80.0, 'p95': 80.0, 'p99': 80.0}
+    assert latency_distributions([]) == {}
@@ -0,0 +1,185 @@
+from collections import Counter
+
+import pytest
+
+from message_record import MessageRecord, message_direction
+from message_store import MessageStore
+from tems_parser import TemsParser
+from timestamps import parse_time_bound
+
+DIRECTIONS = ('ue_to_enb', 'enb_to_ue', 'enb_to_mme', 'mme_to_enb', 'ue_to_mme', 'mme_to_ue')
+
+# (protokol parçası, parametrelerdeki yön) - eski filter_messages'taki eşleme
+_DIRECTION_RULES = {
+    'ue_to_enb': (('rrc', 'lte_rrc'), 'uplink'),
+    'enb_to_ue': (('rrc', 'lte_rrc'), 'downlink'),
+    'enb_to_mme': (('s1ap',), 'uplink'),
+    'mme_to_enb': (('s1ap',), 'downlink'),
+    'ue_to_mme': (('nas',), 'uplink'),
+    'mme_to_ue': (('nas',), 'downlink'),
+}
+
+
+def legacy_filter(messages, filters):
+    """MessageStore'dan önceki liste tabanlı TemsParser.filter_messages (zaman aralığı hariç)"""
+    filtered = list(messages)
+    for field, key in (('protocol', 'protocol'), ('message_type', 'lte_message_type'),
+                       ('channel', 'channel'), ('source_file', 'source_file')):
+        if filters.get(field):
+            filtered = [msg for msg in filtered if msg.get(key) == filters[field]]
+
+    if filters.get('message_direction'):
+        protocols, wanted = _DIRECTION_RULES[filters['message_direction']]
+        filtered = [msg for msg in filtered
+                    if any(part in (msg.get('protocol') or '').lower() for part in protocols)
+                    and (msg.get('parameters', {}).get('direction') or '').lower() == wanted]
+
+    if filters.get('message_identity'):
+        filtered = [msg for msg in filtered
+                    if filters['message_identity'].lower() in msg.get('message_identity', '').lower()]
+
+    for field in ('pci', 'earfcn', 'rrc_transaction_id'):
+        if filters.get(field):
+            try:
+                value = int(filters[field])
+            except (ValueError, TypeError):
+                continue
+            filtered = [msg for msg in filtered if msg.get(field) == value]
+
+    for field in ('is_paging', 'is_measurement', 'is_connection_related'):
+        if filters.get(field) is not None:
+            filtered = [msg for msg in filtered if msg.get(field) == filters[field]]
+
+    if filters.get('min_rsrp') or filters.get('max_rsrp'):
+        def has_rsrp_in_range(msg):
+            for rsrp in msg.get('measurements', {}).get('rsrp_values', ()):
+                try:
+                    dbm_value = float(rsrp['dbm'])
+                except (ValueError, TypeError, KeyError):
+                    continue
+                if filters.get('min_rsrp') and dbm_value < float(filters['min_rsrp']):
+                    continue
+                if filters.get('max_rsrp') and dbm_value > float(filters['max_rsrp']):
+                    continue
+                return True
+            return False
+        filtered = [msg for msg in filtered if has_rsrp_in_range(msg)]
+    return filtered
+
+
+def time_filter(messages, start_time, end_time):
+    """Zaman aralığının liste tabanlı karşılığı: sınırlardan biri de verilebilir, uçlar dahil"""
+    start = parse_time_bound(start_time)
+    end = parse_time_bound(end_time, upper=True)
+    return [msg for msg in messages if msg.get('timestamp_ms') is not None
+            and (start is None or msg['timestamp_ms'] >= start)
+            and (end is None or msg['timestamp_ms'] <= end)]
+
+
+@pytest.fixture(scope='module')
+def messages(generated_logs):
+    return TemsParser(engine='fast').parse_log_file(generated_logs['log'])['messages']
+
+
+def _most_common(messages, field):
+    return Counter(msg.get(field) for msg in messages if msg.get(field) is not None).most_common(1)[0][0]
+
+
+def _filter_cases(messages):
+    cases = [
+        {},
+        {'protocol': _most_common(messages, 'protocol')},
+        {'message_type': 'RRCConnectionRequest'},
+        {'channel': _most_common(messages, 'channel')},
+        {'message_identity': 'connection'},
+        {'message_identity': 'RECONFIGURATION'},
+        {'pci': str(_most_common(messages, 'pci'))},
+        {'earfcn': _most_common(messages, 'earfcn')},
+        {'rrc_transaction_id': _most_common(messages, 'rrc_transaction_id')},
+        {'pci': 'abc'},
+        {'is_paging': True},
+        {'is_measurement': False},
+        {'is_connection_related': True},
+        {'min_rsrp': '-100'},
+        {'max_rsrp': '-95'},
+        {'min_rsrp': '-110', 'max_rsrp': '-90'},
+        {'protocol': 'NOPE'},
+        {'channel': _most_common(messages, 'channel'), 'is_connection_related': True, 'min_rsrp': '-120'},
+    ]
+    cases.extend({'message_direction': direction} for direction in DIRECTIONS)
+    return cases
+
+
+def test_filter_matches_legacy_list_filter(messages):
+    store = MessageStore(messages)
+    for filters in _filter_cases(messages):
+        expected = legacy_filter(messages, filters)
+        result = store.filter(filters)
+        assert [msg['id'] for msg in result] == [msg['id'] for msg in expected], filters
+        assert all(a is b for a, b in zip(result, expected))
+
+
+def test_direction_filters_are_not_empty(messages):
+    store = MessageStore(messages)
+    assert store.filter({'message_direction': 'ue_to_enb'})
+    assert store.filter({'message_direction': 'enb_to_ue'})
+
+
+def test_parameter_lookup_matches_parameters_view(messages):
+    for message in messages:
+        parameters = message['parameters']
+        assert message_direction(message) == parameters.get('direction')
+        for key in parameters:
+            assert message.parameter(key) == parameters[key]
+    plain = messages[0].to_dict()
+    assert message_direction(plain) == plain['parameters']['direction']
+    assert message_direction(MessageRecord.from_dict(plain)) == plain['parameters']['direction']
+    assert message_direction({}) is None
+
+
+def test_time_range_with_both_bounds(messages):
+    store = MessageStore(messages)
+    start = messages[len(messages) // 4]['timestamp']
+    end = messages[len(messages) // 2]['timestamp']
+    expected = time_filter(messages, start, end)
+    assert expected
+    assert store.filter({'start_time': start, 'end_time': end}) == expected
+
+
+@pytest.mark.parametrize('bound', ['start_time', 'end_time'])
+def test_time_range_with_only_one_bound(messages, bound):
+    store = MessageStore(messages)
+    value = messages[len(messages) // 3]['timestamp']
+    filters = {bound: value}
+    expected = time_filter(messages, filters.get('start_time'), filters.get('end_time'))
+    assert 0 < len(expected) < len(messages)
+    assert store.filter(filters) == expected
+
+
+def test_end_bound_without_millis_covers_whole_second(messages):
+    store = MessageStore(messages)
+    second = messages[len(messages) // 3]['timestamp'][:15]
+    result = store.filter({'end_time': second})
+    assert result == time_filter(messages, None, second)
+    assert any(msg['timestamp'].startswith(second) for msg in result)
+
+
+def test_time_range_combined_with_other_filters(messages):
+    store = MessageStore(messages)
+    start = messages[len(messages) // 5]['timestamp']
+    filters = {'start_time': start, 'is_connection_related': True}
+    expected = time_filter(legacy_filter(messages, filters), start, None)
+    assert store.filter(filters) == expected
+
+
+def test_invalid_time_bound_is_ignored(messages):
+    store = MessageStore(messages)
+    assert store.filter({'start_time': 'yesterday'}) == messages
+
+
+def test_filter_mask_matches_filter(messages):
+    store = MessageStore(messages)
+    filters = {'is_paging': True}
+    mask = store.filter_mask(filters)
+    assert len(mask) == len(messages)
+    assert [msg for msg, selected in zip(messages, mask) if selected] == store.filter(filters)
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from tems_parser import TemsParser
+from message_record import json_default
+
+
+def _dump(result):
+    return json.dumps(result, ensure_ascii=False, default=json_default)
+
+
+def _parse(path, engine, workers=1):
+    parser = TemsParser(engine=engine)
+    if workers > 1:
+        # Küçük test dosyaları da birden fazla aralığa bölünsün
+        parser.READ_CHUNK_SIZE = 16 * 1024
+        assert len(parser._plan_byte_ranges(path, workers)[1]) > 2
+    return parser.parse_log_file(path, workers=workers)
+
+
+@pytest.mark.parametrize('kind', ['log', 'trp', 'latin1_trp'])
+def test_fast_engine_matches_regex_engine(generated_logs, kind):
+    path = generated_logs[kind]
+    expected = _dump(_parse(path, 'regex'))
+    assert _dump(_parse(path, 'fast')) == expected
+
+
+@pytest.mark.parametrize('kind', ['log', 'trp', 'latin1_trp'])
+def test_parallel_parse_matches_sequential(generated_logs, kind):
+    path = generated_logs[kind]
+    expected = _dump(_parse(path, 'regex'))
+    assert _dump(_parse(path, 'fast', workers=3)) == expected
+
+
+def test_latin1_trp_is_decoded(generated_logs):
+    result = TemsParser(engine='fast').parse_log_file(generated_logs['latin1_trp'])
+    assert any('Service Requést' in message['raw_content'] for message in result['messages'])
+
+
+def test_iter_messages_matches_parse_log_file(generated_logs):
+    parser = TemsParser(engine='fast')
+    path = generated_logs['log']
+    streamed = [message.to_dict() for message in parser.iter_messages(path)]
+    assert streamed == [message.to_dict() for message in parser.parse_log_file(path)['messages']]
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from search_index import (parse_query, tokenize, encode_postings, decode_postings, SearchIndex,
+                          SearchIndexBuilder, build_search_index)
+from message_store import MessageStore
+from tems_parser import TemsParser
+
+TEXTS = [
+    'RRCConnectionReconfiguration mobilityControlInfo targetPhysCellId: 12',
+    'RRCConnectionReconfiguration measConfig',
+    'Paging: ue-identity m-TMSI=3046523346',
+    'connection setup complete',
+    'setup of the connection',
+    'mobilityFromEUTRACommand cause: other',
+]
+
+
+@pytest.fixture(scope='module')
+def messages():
+    return [{'id': number, 'raw_content': text} for number, text in enumerate(TEXTS, 1)]
+
+
+@pytest.fixture(scope='module')
+def index(messages):
+    return build_search_index(messages)
+
+
+def _texts(messages):
+    return lambda ids: [messages[message_id - 1]['raw_content'] for message_id in ids]
+
+
+def _search(index, messages, query, **kwargs):
+    return index.search(query, texts=_texts(messages), **kwargs).tolist()
+
+
+def test_tokenize():
+    assert tokenize('Paging: ue-identity m-TMSI=30465') == ['paging', 'ue', 'identity', 'm', 'tmsi', '30465']
+    assert tokenize('Service Requést_1') == ['service', 'requést_1']
+
+
+def test_postings_round_trip():
+    for ids in ([7], [1, 2, 3], list(range(5, 5000, 3)), [1, 300, 70000, 10 ** 6]):
+        assert decode_postings(encode_postings(ids)).tolist() == ids
+
+
+def test_parse_query_and_binds_tighter_than_or():
+    assert parse_query('a b OR c') == [[(('a',), False, False), (('b',), False, False)],
+                                       [(('c',), False, False)]]
+    assert parse_query('a AND b OR c') == parse_query('a b OR c')
+
+
+def test_parse_query_terms():
+    assert parse_query('"RRC Connection"') == [[(('rrc', 'connection'), False, False)]]
+    assert parse_query('mobility*') == [[(('mobility',), True, False)]]
+    assert parse_query('m-TMSI') == [[(('m', 'tmsi'), False, False)]]
+    assert parse_query('paging -s1ap -"ue identity"') == [[(('paging',), False, False), (('s1ap',), False, True),
+                                                          (('ue', 'identity'), False, True)]]
+    # Kapanmamış tırnak satır sonuna kadar sürer
+    assert parse_query('"setup complete') == [[(('setup', 'complete'), False, False)]]
+
+
+@pytest.mark.parametrize('query', ['', '   ', '-paging', 'paging OR -s1ap', '"!!"', 'paging OR'])
+def test_parse_query_rejects_invalid(query):
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_and_or_precedence(index, messages):
+    assert _search(index, messages, 'rrcconnectionreconfiguration mobilitycontrolinfo') == [1]
+    assert _search(index, messages, 'measconfig OR paging') == [2, 3]
+    # (paging) OR (setup AND complete); (paging OR setup) AND complete olsaydı [4] dönerdi
+    assert _search(index, messages, 'paging OR setup complete') == [3, 4]
+    assert _search(index, messages, 'MeasConfig') == [2]
+
+
+def test_phrase(index, messages):
+    assert _search(index, messages, '"connection setup"') == [4]
+    # Metin verilmezse token'ların aynı mesajda geçmesi yeterlidir
+    assert index.search('"connection setup"').tolist() == [4, 5]
+    assert _search(index, messages, 'm-TMSI') == [3]
+    assert _search(index, messages, '"tmsi m"') == []
+
+
+def test_prefix(index, messages):
+    assert _search(index, messages, 'mobility*') == [1, 6]
+    assert _search(index, messages, 'mobilityc*') == [1]
+    assert _search(index, messages, '"ue ident*"') == [3]
+    assert _search(index, messages, 'zzz*') == []
+
+
+def test_negation(index, messages):
+    assert _search(index, messages, 'rrcconnectionreconfiguration -measconfig') == [1]
+    assert _search(index, messages, 'connection -"connection setup"') == [5]
+    assert _search(index, messages, 'mobility* -cause OR paging') == [1, 3]
+
+
+def test_selection_mask(index, messages):
+    selection = bytes([1, 1, 1, 0, 0, 0])
+    assert _search(index, messages, 'mobility*', selection=selection) == [1]
+    assert _search(index, messages, 'setup OR paging', selection=selection) == [3]
+    assert _search(index, messages, 'measconfig -paging', selection=bytes(6)) == []
+
+
+def test_segments_match_single_index(messages):
+    single = build_search_index(messages)
+    segments = []
+    for start, end in ((0, 2), (2, 6)):
+        builder = SearchIndexBuilder()
+        for local_id, message in enumerate(messages[start:end], 1):
+            builder.add(local_id, message['raw_content'])
+        segments.append((builder.build(), start))
+    split = SearchIndex(segments)
+    for query in ('mobility*', 'connection OR paging', '"connection setup"', 'rrcconnectionreconfiguration -measconfig'):
+        assert np.array_equal(split.search(query), single.search(query))
+
+
+def test_search_combined_with_structured_filters(generated_logs):
+    result = TemsParser(engine='fast').parse_log_file(generated_logs['log'], search_index=True)
+    messages = result['messages']
+    store = MessageStore(messages)
+    selection = store.filter_mask({'protocol': 'RRC'})
+    found = result['search_index'].search('rrcconnectionrelease OR paging', texts=_texts(messages),
+                                          selection=selection).tolist()
+    expected = [message['id'] for message in store.filter({'protocol': 'RRC'})
+                if {'rrcconnectionrelease', 'paging'} & set(tokenize(message['raw_content']))]
+    assert found == expected
+    assert found
@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from dataset_store import DatasetStore
+from message_record import json_default
+from parse_cache import ParseCache
+from stream_upload import StreamingUploads
+from tems_parser import TemsParser
+
+
+@pytest.fixture
+def uploads(tmp_path):
+    parser = TemsParser(engine='fast')
+    cache = ParseCache(str(tmp_path / 'cache'), parser_version=parser.PARSER_VERSION)
+    return StreamingUploads(parser, DatasetStore(), cache, spool_dir=str(tmp_path / 'spool'))
+
+
+def _upload(uploads, path, name):
+    with open(path, 'rb') as file:
+        data = file.read()
+    session = uploads.create(name, len(data))
+    result = uploads.receive(session, io.BytesIO(data))
+    return session, json.dumps(result, default=json_default)
+
+
+@pytest.mark.parametrize('kind, name', [('log', 'a.log'), ('trp', 'a.trp'), ('latin1_trp', 'b.trp')])
+def test_repeated_upload_is_served_from_cache(uploads, generated_logs, monkeypatch, kind, name):
+    path = generated_logs[kind]
+    first, first_result = _upload(uploads, path, name)
+    assert not first.cache_hit
+    assert first_result == json.dumps(TemsParser(engine='fast').parse_log_file(path), default=json_default)
+
+    # İkinci yüklemede latin-1 dosya yeniden parse edilmez
+    monkeypatch.setattr(uploads.parser, 'parse_log_file', lambda *args, **kwargs: pytest.fail('parse edildi'))
+    second, second_result = _upload(uploads, path, name)
+    assert second.cache_hit
+    assert second_result == first_result
+    assert uploads.dataset_store.get(second.dataset_id)['total_messages'] == json.loads(first_result)['total_messages']
+
+
+def test_sessions_never_started_expire(uploads, generated_logs, monkeypatch):
+    idle = uploads.create('idle.log')
+    started, _ = _upload(uploads, generated_logs['log'], 'a.log')
+    assert idle.dataset_id in uploads.dataset_store
+
+    # Bekleme süresi dolduktan sonra açılan yeni oturum eskileri temizler
+    now = idle.created_at + uploads.WAITING_TTL_SECONDS + 1
+    monkeypatch.setattr('stream_upload.time.time', lambda: now)
+    uploads.create('b.log')
+    assert uploads.get(idle.dataset_id) is None
+    assert idle.dataset_id not in uploads.dataset_store
+    assert uploads.get(started.dataset_id) is started
+    assert started.dataset_id in uploads.dataset_store
+    with pytest.raises(Exception, match='süresi doldu'):
+        uploads.receive(idle, io.BytesIO(b''))
@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from message_record import MessageRecord
+from tems_parser import TemsParser
+from timestamps import timestamp_ms, parse_timestamp, format_timestamp_ms, parse_time_bound, message_timestamp_ms
+
+# 15.01.2024 10:00:00.000 (log saati UTC kabul edilir)
+BASE_MS = int(datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def test_timestamp_ms():
+    assert timestamp_ms('150124', '10:00:00.000') == BASE_MS
+    assert timestamp_ms('150124', '10:00:01.234') == BASE_MS + 1234
+    assert timestamp_ms('150124', '00:00:00.000') == BASE_MS - 10 * 3600 * 1000
+    assert timestamp_ms('160124', '00:00:00.000') - timestamp_ms('150124', '23:59:59.999') == 1
+    assert timestamp_ms('290224', '12:00:00.000') is not None
+
+
+@pytest.mark.parametrize('date, time', [
+    (None, '10:00:00.000'),
+    ('150124', None),
+    ('', '10:00:00.000'),
+    ('320124', '10:00:00.000'),
+    ('150024', '10:00:00.000'),
+    ('290223', '10:00:00.000'),
+    ('15012', '10:00:00.000'),
+    ('15o124', '10:00:00.000'),
+    ('150124', '24:00:00.000'),
+    ('150124', '10:60:00.000'),
+    ('150124', '10:00:60.000'),
+    ('150124', '10:00:00.1'),
+    ('150124', '10:00:00'),
+    ('150124', '10-00-00.000'),
+    ('150124', '1a:00:00.000'),
+])
+def test_timestamp_ms_invalid(date, time):
+    assert timestamp_ms(date, time) is None
+
+
+def test_parse_and_format_timestamp_round_trip():
+    for text in ('150124 10:00:00.000', '010100 00:00:00.001', '311299 23:59:59.999'):
+        assert format_timestamp_ms(parse_timestamp(text)) == text
+    assert parse_timestamp('') is None
+    assert parse_timestamp('150124') is None
+
+
+def test_parse_time_bound_empty():
+    assert parse_time_bound(None) is None
+    assert parse_time_bound('') is None
+    assert parse_time_bound('', upper=True) is None
+
+
+def test_parse_time_bound_epoch_millis():
+    assert parse_time_bound(BASE_MS) == BASE_MS
+    assert parse_time_bound(float(BASE_MS)) == BASE_MS
+    assert parse_time_bound(str(BASE_MS)) == BASE_MS
+    assert parse_time_bound(f' {BASE_MS} ', upper=True) == BASE_MS
+
+
+def test_parse_time_bound_log_format():
+    assert parse_time_bound('150124 10:00:00.250') == BASE_MS + 250
+    assert parse_time_bound('150124 10:00:00.250', upper=True) == BASE_MS + 250
+    # Milisaniyesi verilmeyen üst sınır saniyenin sonuna kadar kapsar
+    assert parse_time_bound('150124 10:00:00') == BASE_MS
+    assert parse_time_bound('150124 10:00:00', upper=True) == BASE_MS + 999
+    # Kısa kesirler eksik basamaklarla tamamlanır
+    assert parse_time_bound('150124 10:00:00.5') == BASE_MS + 500
+    assert parse_time_bound('150124 10:00:00.5', upper=True) == BASE_MS + 599
+    assert parse_time_bound('150124 10:00:00.25', upper=True) == BASE_MS + 259
+
+
+def test_parse_time_bound_iso_format():
+    assert parse_time_bound('2024-01-15 10:00:00') == BASE_MS
+    assert parse_time_bound('2024-01-15T10:00:00') == BASE_MS
+    assert parse_time_bound('2024-01-15 10:00:00', upper=True) == BASE_MS + 999
+    assert parse_time_bound('2024-01-15 10:00:00.250') == BASE_MS + 250
+    assert parse_time_bound('2024-01-15T10:00:00.250', upper=True) == BASE_MS + 250
+
+
+@pytest.mark.parametrize('value', [
+    'yesterday',
+    '150124 25:00:00',
+    '320124 10:00:00',
+    '150124 10:00:00.1234',
+    '150124 10:00:00.ab',
+    '2024-01-15',
+    '2024-13-01 10:00:00',
+    True,
+])
+def test_parse_time_bound_invalid(value):
+    with pytest.raises(ValueError):
+        parse_time_bound(value)
+
+
+def test_message_timestamp_ms():
+    assert message_timestamp_ms({'timestamp_ms': 5, 'timestamp': '150124 10:00:00.000'}) == 5
+    assert message_timestamp_ms({'timestamp': '150124 10:00:00.250'}) == BASE_MS + 250
+    assert message_timestamp_ms({'timestamp': '2024-01-15 10:00:00.250'}) == BASE_MS + 250
+    assert message_timestamp_ms({'timestamp': 'N/A'}) is None
+    assert message_timestamp_ms({}) is None
+
+
+def test_total_duration_without_timestamp_ms():
+    # /api/analyze'a gönderilen düz mesajlarda timestamp_ms bulunmayabilir
+    def analyze(first, last):
+        messages = [{'id': number, 'timestamp': timestamp} for number, timestamp in enumerate((first, last), 1)]
+        return TemsParser()._analyze_timing(messages)['total_duration']
+
+    assert analyze('150124 10:00:00.100', '150124 10:00:02.350') == 2250.0
+    assert analyze('2024-01-15 10:00:00.100', '2024-01-15 10:00:01.000') == 900.0
+
+
+def test_setting_record_timestamp_updates_derived_fields():
+    record = MessageRecord(1, '150124', '10:00:00.000', 1, 1, 'RRC', 'LTE', 'DL_DCCH', 'Paging', 'LTE RRC')
+    record['timestamp'] = '160124 11:30:00.250'
+    assert (record['timestamp_num'], record['timestamp_time']) == ('160124', '11:30:00.250')
+    assert record['timestamp_ms'] == BASE_MS + (25 * 3600 + 30 * 60) * 1000 + 250
+    record['timestamp'] = '2024-01-15 10:00:00.250'
+    assert record['timestamp_ms'] == BASE_MS + 250
+    record['timestamp'] = 'N/A'
+    assert record['timestamp_ms'] is None
+    # Sözlükteki açık timestamp_ms değeri korunur
+    assert MessageRecord.from_dict(dict(record.to_dict(), timestamp='150124 10:00:00.000', timestamp_ms=7))['timestamp_ms'] == 7
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Union
+
+# Log zaman damgaları saat dilimi içermez; epoch milisaniyesi log saati UTC kabul edilerek hesaplanır
+_EPOCH = datetime(1970, 1, 1)
+_DAY_MS = 24 * 60 * 60 * 1000
+
+# 'DDMMYY' -> o günün başlangıcının epoch milisaniyesi (geçersiz tarih için -1)
+_DATE_CACHE: Dict[str, int] = {}
+
+
+def _date_ms(date: str) -> int:
+    day_ms = _DATE_CACHE.get(date)
+    if day_ms is None:
+        try:
+            if len(date) != 6 or not date.isdigit():
+                raise ValueError(date)
+            day = datetime(2000 + int(date[4:6]), int(date[2:4]), int(date[0:2]))
+            day_ms = (day - _EPOCH).days * _DAY_MS
+        except ValueError:
+            day_ms = -1
+        _DATE_CACHE[date] = day_ms
+    return day_ms
+
+
+def timestamp_ms(date: Optional[str], time: Optional[str]) -> Optional[int]:
+    """'DDMMYY' tarih ve 'HH:MM:SS.mmm' saatini epoch milisaniyesine çevir; geçersizse None.
+
+    strptime yerine sabit konumlu elle ayrıştırma yapılır; tarih kısmı önbellekten gelir.
+    """
+    if not date or not time:
+        return None
+    day_ms = _date_ms(date)
+    if day_ms < 0:
+        return None
+    if len(time) != 12 or time[2] != ':' or time[5] != ':' or time[8] != '.':
+        return None
+    hours, minutes, seconds, millis = time[0:2], time[3:5], time[6:8], time[9:12]
+    if not (hours.isdigit() and minutes.isdigit() and seconds.isdigit() and millis.isdigit()):
+        return None
+    hours, minutes, seconds = int(hours), int(minutes), int(seconds)
+    if hours > 23 or minutes > 59 or seconds > 59:
+        return None
+    return day_ms + ((hours * 60 + minutes) * 60 + seconds) * 1000 + int(millis)
+
+
+def parse_timestamp(timestamp: Optional[str]) -> Optional[int]:
+    """'DDMMYY HH:MM:SS.mmm' zaman damgasını epoch milisaniyesine çevir; geçersizse None"""
+    if not timestamp:
+        return None
+    date, _, time = timestamp.partition(' ')
+    return timestamp_ms(date, time)
+
+
+def format_timestamp_ms(value: int) -> str:
+    """Epoch milisaniyesini log formatına ('DDMMYY HH:MM:SS.mmm') çevir"""
+    moment = _EPOCH + timedelta(milliseconds=value)
+    return moment.strftime('%d%m%y %H:%M:%S.') + f'{value % 1000:03d}'
+
+
+# Zaman aralığı filtresinde kabul edilen biçimler (log biçimi ve ISO)
+_BOUND_FORMATS = ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S')
+
+
+def parse_time_bound(value: Union[str, int, float, None], upper: bool = False) -> Optional[int]:
+    """Filtre sınırını epoch milisaniyesine çevir.
+
+    Epoch milisaniyesi (sayı), 'DDMMYY HH:MM:SS[.mmm]' veya 'YYYY-MM-DD HH:MM:SS[.fff]'
+    kabul edilir. Milisaniyesi verilmeyen üst sınır o saniyenin sonuna kadar kapsar.
+    Boşsa None; biçim geçersizse ValueError.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    text = str(value).strip()
+    if text.lstrip('-').isdigit() and len(text) > 6:
+        return int(text)
+
+    # Log biçimi: 'DDMMYY HH:MM:SS[.m[m[m]]]'
+    date, _, time = text.partition(' ')
+    if len(date) == 6 and date.isdigit():
+        time, _, fraction = time.partition('.')
+        if len(fraction) > 3 or (fraction and not fraction.isdigit()):
+            raise ValueError(f'Geçersiz zaman: {value}')
+        millis = fraction.ljust(3, '9' if upper else '0') if fraction else ('999' if upper else '000')
+        result = timestamp_ms(date, f'{time}.{millis}')
+        if result is None:
+            raise ValueError(f'Geçersiz zaman: {value}')
+        return result
+
+    for time_format in _BOUND_FORMATS:
+        try:
+            moment = datetime.strptime(text, time_format)
+        except ValueError:
+            continue
+        result = (moment - _EPOCH) // timedelta(milliseconds=1)
+        if upper and '.' not in text:
+            result += 999
+        return result
+    raise ValueError(f'Geçersiz zaman: {value}')
+
+
+def any_timestamp_ms(timestamp: Any) -> Optional[int]:
+    """Log ya da ISO biçimindeki zaman damgasının epoch milisaniyesi; okunamazsa None"""
+    value = parse_timestamp(timestamp) if isinstance(timestamp, str) else None
+    if value is None and timestamp:
+        try:
+            value = parse_time_bound(timestamp)
+        except (ValueError, TypeError):
+            return None
+    return value
+
+
+def message_timestamp_ms(message: Dict[str, Any]) -> Optional[int]:
+    """Mesajın epoch milisaniyesi; okunamazsa None.
+
+    timestamp_ms yoksa (ör. /api/analyze'a gönderilen eski mesajlar) 'timestamp' alanı log ya da
+    ISO biçiminden çevrilir.
+    """
+    value = message.get('timestamp_ms')
+    if value is not None:
+        return value
+    return any_timestamp_ms(message.get('timestamp'))